@@ -0,0 +1,63 @@
+"""
+Microbenchmark of a single scalar read/write call.
+
+Compares the precompiled codecs of `byter.codec` against the previous
+implementation, which built a format string and looked up the type table on
+every call. Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/bench_codec.py
+"""
+
+import io
+import struct
+import timeit
+
+import byter
+from byter.utils import get_type
+
+NUMBER_CALLS = 1000000
+
+
+def legacy_read_int(data):
+    """Read `int` the way byter did before the codec table was added."""
+    s_type = "=%s" % get_type("int")
+    return struct.unpack(s_type, data.read(4))[0]
+
+
+def legacy_write_int(data, value):
+    """Write `int` the way byter did before the codec table was added."""
+    s_type = "=%s" % get_type("int")
+    bytes_data = struct.pack(s_type, value)
+    data.write(bytes_data)
+
+
+def bench(func, *args):
+    """Return the best time per call of `func(data, *args)` in ns."""
+    timings = timeit.repeat("data.seek(0); [func(data, *args) for _ in calls]",
+                            globals={
+                                "data": io.BytesIO(b"\x00" * 4 * NUMBER_CALLS),
+                                "func": func,
+                                "args": args,
+                                "calls": range(NUMBER_CALLS)
+                            },
+                            number=1,
+                            repeat=5)
+    return min(timings) / NUMBER_CALLS * 1e9
+
+
+def main():
+    """Print per-call timings and speedups."""
+    cases = [
+        ("read_int", legacy_read_int, byter.read_int, ()),
+        ("write_int", legacy_write_int, byter.write_int, (1, )),
+    ]
+
+    for name, legacy_func, codec_func, args in cases:
+        legacy_ns = bench(legacy_func, *args)
+        codec_ns = bench(codec_func, *args)
+        print("%-10s legacy %7.1f ns/op  codec %7.1f ns/op  speedup %.2fx" %
+              (name, legacy_ns, codec_ns, legacy_ns / codec_ns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+"""
+Benchmark suite of byter read/write paths across I/O backends.
+
+Covers every type of `TYPES_TABLE` for single values and arrays of 1, 1K and
+1M elements, `read_string`, and bulk record functions, each against a real
+file, `io.BytesIO`, `BufferCursor`/`BufferWriter`, `MmapReader` and
+`PositionalReader`. Every case reports the best time per operation (ns/op)
+and throughput (MB/s). Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/suite.py --output results.json
+    PYTHONPATH=. python benchmarks/suite.py --compare results.json
+
+`--filter` selects cases by a substring of their name, e.g. "read_int" or
+"mmap", and `--quick` skips the 1M element and 1MB string cases.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import byter
+from byter.codec import STRUCTS
+from byter.constants import TYPES_TABLE
+
+ARRAY_SIZES = (1, 1000, 1000000)
+STRING_SIZES = (16, 1024, 1048576)
+SCALAR_CALLS = 10000
+NUMBER_RECORDS = 100000
+
+RECORD_SCHEMA = byter.Schema([("has_data", "bool"), ("year", "short"),
+                              ("month", "short"), ("width", "float"),
+                              ("height", "float"), ("text", ("char[]", 70)),
+                              ("array", ("unsigned_short", 3))])
+
+READ_BACKENDS = ("file", "bytesio", "cursor", "mmap", "positional")
+WRITE_BACKENDS = ("file", "bytesio", "buffer")
+
+
+def sample_value(c_type):
+    """Get a value of `c_type` to write."""
+    if c_type == "char":
+        return b"a"
+    if c_type == "bool":
+        return True
+    return 1
+
+
+def measure(func, min_time, repeat):
+    """
+    Time `func()` with enough calls per round to last at least `min_time`.
+
+    Returns
+    -------
+    tuple
+        Best time of a single `func()` call (seconds) and calls per round
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+
+    return best / number, number
+
+
+class Backends:
+    """Readers of one data file, reopened for each case."""
+
+    def __init__(self, directory, payload):
+        self.path = os.path.join(directory, "bench.byter")
+        with open(self.path, "wb") as data:
+            data.write(payload)
+        self.payload = payload
+        self.handles = []
+
+    def open(self, backend):
+        """Open the file with `backend`."""
+        if backend == "file":
+            handle = open(self.path, "rb")
+        elif backend == "bytesio":
+            handle = io.BytesIO(self.payload)
+        elif backend == "cursor":
+            handle = byter.BufferCursor(self.payload)
+        elif backend == "mmap":
+            handle = byter.MmapReader(self.path)
+        elif backend == "positional":
+            handle = byter.PositionalReader(self.path)
+        else:
+            raise ValueError("unknown backend %r" % backend)
+        self.handles.append(handle)
+        return handle
+
+    def close(self):
+        """Close every opened reader."""
+        for handle in self.handles:
+            if hasattr(handle, "close"):
+                handle.close()
+        self.handles = []
+
+
+def scalar_read_case(handle, backend, c_type, size):
+    """Build a function reading `SCALAR_CALLS` consequent values."""
+    calls = range(SCALAR_CALLS)
+
+    if backend in ("file", "bytesio"):
+        read = getattr(byter, "read_" + c_type)
+
+        def run():
+            handle.seek(0)
+            for _ in calls:
+                read(handle)
+    elif backend == "cursor":
+        read = getattr(handle, "read_" + c_type)
+
+        def run():
+            handle.offset = 0
+            for _ in calls:
+                read()
+    else:
+        read = getattr(handle, "read_%s_at" % c_type)
+        offsets = range(0, SCALAR_CALLS * size, size)
+
+        def run():
+            for offset in offsets:
+                read(offset)
+
+    return run, SCALAR_CALLS
+
+
+def array_read_case(handle, backend, c_type, count):
+    """Build a function reading an array of `count` values."""
+    if backend in ("file", "bytesio"):
+
+        def run():
+            handle.seek(0)
+            byter.read_array(handle, count, c_type)
+    elif backend == "cursor":
+
+        def run():
+            handle.offset = 0
+            handle.read_array(count, c_type)
+    else:
+
+        def run():
+            handle.read_array_at(0, count, c_type)
+
+    return run, 1
+
+
+def string_read_case(handle, backend, s_len):
+    """Build a function reading a string of `s_len` bytes."""
+    if backend in ("file", "bytesio"):
+
+        def run():
+            handle.seek(0)
+            byter.read_string(handle, s_len)
+    elif backend == "cursor":
+
+        def run():
+            handle.offset = 0
+            handle.read_string(s_len)
+    else:
+
+        def run():
+            handle.read_string_at(0, s_len)
+
+    return run, 1
+
+
+def open_writer(directory, backend):
+    """Open a writer rewound before each round."""
+    if backend == "file":
+        handle = open(os.path.join(directory, "bench_write.byter"), "wb")
+    elif backend == "bytesio":
+        handle = io.BytesIO()
+    else:
+        handle = byter.BufferWriter()
+
+    if backend == "buffer":
+
+        def rewind():
+            handle.offset = 0
+    else:
+
+        def rewind():
+            handle.seek(0)
+
+    return handle, rewind
+
+
+def scalar_write_case(handle, rewind, backend, c_type):
+    """Build a function writing `SCALAR_CALLS` consequent values."""
+    value = sample_value(c_type)
+    calls = range(SCALAR_CALLS)
+
+    if backend == "buffer":
+        write = getattr(handle, "write_" + c_type)
+
+        def run():
+            rewind()
+            for _ in calls:
+                write(value)
+    else:
+        write = getattr(byter, "write_" + c_type)
+
+        def run():
+            rewind()
+            for _ in calls:
+                write(handle, value)
+
+    return run, SCALAR_CALLS
+
+
+def array_write_case(handle, rewind, backend, c_type, count):
+    """Build a function writing an array of `count` values."""
+    values = [sample_value(c_type)] * count
+
+    if backend == "buffer":
+
+        def run():
+            rewind()
+            handle.write_array(values, c_type)
+    else:
+
+        def run():
+            rewind()
+            byter.write_array(handle, values, c_type)
+
+    return run, 1
+
+
+def iter_cases(directory, sizes, string_sizes):
+    """
+    Yield benchmark cases.
+
+    Yields
+    ------
+    tuple
+        Case name, backend, C type, number of elements, a function to time,
+        operations per call and bytes processed per call
+    """
+    max_size = max(codec.size for codec in STRUCTS["native"].values())
+    payload = bytes(
+        max(sizes[-1] * max_size, SCALAR_CALLS * max_size, string_sizes[-1],
+            NUMBER_RECORDS * RECORD_SCHEMA.size))
+    backends = Backends(directory, payload)
+
+    try:
+        for backend in READ_BACKENDS:
+            for c_type in TYPES_TABLE:
+                size = STRUCTS["native"][c_type].size
+                handle = backends.open(backend)
+
+                run, ops = scalar_read_case(handle, backend, c_type, size)
+                yield ("read_" + c_type, backend, c_type, 1, run, ops, ops *
+                       size)
+
+                for count in sizes:
+                    run, ops = array_read_case(handle, backend, c_type, count)
+                    yield ("read_array", backend, c_type, count, run, ops,
+                           count * size)
+
+            handle = backends.open(backend)
+            for s_len in string_sizes:
+                run, ops = string_read_case(handle, backend, s_len)
+                yield ("read_string", backend, "char[]", s_len, run, ops,
+                       s_len)
+
+            backends.close()
+
+        for backend in ("file", "bytesio"):
+            handle = backends.open(backend)
+            record_bytes = NUMBER_RECORDS * RECORD_SCHEMA.size
+
+            def run_read_records():
+                handle.seek(0)
+                byter.read_records(handle, RECORD_SCHEMA, NUMBER_RECORDS)
+
+            def run_read_columns():
+                handle.seek(0)
+                byter.read_records(handle,
+                                   RECORD_SCHEMA,
+                                   NUMBER_RECORDS,
+                                   columns=True)
+
+            yield ("read_records", backend, "record", NUMBER_RECORDS,
+                   run_read_records, NUMBER_RECORDS, record_bytes)
+            yield ("read_records_columns", backend, "record", NUMBER_RECORDS,
+                   run_read_columns, NUMBER_RECORDS, record_bytes)
+            backends.close()
+    finally:
+        backends.close()
+
+    for backend in WRITE_BACKENDS:
+        handle, rewind = open_writer(directory, backend)
+        try:
+            for c_type in TYPES_TABLE:
+                size = STRUCTS["native"][c_type].size
+
+                run, ops = scalar_write_case(handle, rewind, backend, c_type)
+                yield ("write_" + c_type, backend, c_type, 1, run, ops, ops *
+                       size)
+
+                for count in sizes:
+                    run, ops = array_write_case(handle, rewind, backend,
+                                                c_type, count)
+                    yield ("write_array", backend, c_type, count, run, ops,
+                           count * size)
+        finally:
+            if backend != "buffer":
+                handle.close()
+
+
+def git_revision():
+    """Get the current git commit, None outside of a git checkout."""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"],
+                                       stderr=subprocess.DEVNULL,
+                                       universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def case_key(result):
+    """Get the identity of a result to compare runs."""
+    return (result["name"], result["backend"], result["c_type"],
+            result["size"])
+
+
+def main():
+    """Run the suite, print a table and optionally save or compare JSON."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--output", help="save results to a JSON file")
+    parser.add_argument("--compare",
+                        help="JSON results of a previous run to compare with")
+    parser.add_argument("--filter",
+                        default="",
+                        help="run only cases whose name, backend or C type "
+                        "contain this substring")
+    parser.add_argument("--quick",
+                        action="store_true",
+                        help="skip the 1M element and 1MB string cases")
+    parser.add_argument("--min-time",
+                        type=float,
+                        default=0.05,
+                        help="minimal duration of a timing round (seconds)")
+    parser.add_argument("--repeat",
+                        type=int,
+                        default=3,
+                        help="number of timing rounds, the best one is kept")
+    args = parser.parse_args()
+
+    sizes, string_sizes = ARRAY_SIZES, STRING_SIZES
+    if args.quick:
+        sizes, string_sizes = ARRAY_SIZES[:-1], STRING_SIZES[:-1]
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = {
+                case_key(result): result
+                for result in json.load(baseline_file)["results"]
+            }
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name, backend, c_type, size, run, ops, num_bytes in iter_cases(
+                directory, sizes, string_sizes):
+            label = "%s[%s] %s x%d" % (name, backend, c_type, size)
+            if args.filter not in label:
+                continue
+
+            seconds, number = measure(run, args.min_time, args.repeat)
+            result = {
+                "name": name,
+                "backend": backend,
+                "c_type": c_type,
+                "size": size,
+                "ns_per_op": seconds / ops * 1e9,
+                "mb_per_s": num_bytes / seconds / 1e6,
+                "number": number,
+            }
+            results.append(result)
+
+            line = "%-52s %12.1f ns/op %10.1f MB/s" % (
+                label, result["ns_per_op"], result["mb_per_s"])
+            previous = baseline.get(case_key(result))
+            if previous is not None:
+                line += "  %.2fx" % (previous["ns_per_op"] /
+                                     result["ns_per_op"])
+            print(line, flush=True)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                {
+                    "python": sys.version,
+                    "implementation": platform.python_implementation(),
+                    "platform": platform.platform(),
+                    "revision": git_revision(),
+                    "results": results,
+                },
+                output_file,
+                indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,33 @@
 
 from .reader import *
 from .writer import *
+from .schema import *
+from .records import *
+from .cursor import *
+from .mmap_reader import *
+from .positional import *
+from .index import *
+from .codegen import *
+from .view import *
+from .parallel import *
+from .compression import *
+
+# Not in `__all__`: `from byter import *` would shadow the built-in `open`
+from .compression import open  # noqa: F401
 
 __all__ = []
 __all__.extend(reader.__all__)
 __all__.extend(writer.__all__)
+__all__.extend(schema.__all__)
+__all__.extend(records.__all__)
+__all__.extend(cursor.__all__)
+__all__.extend(mmap_reader.__all__)
+__all__.extend(positional.__all__)
+__all__.extend(index.__all__)
+__all__.extend(codegen.__all__)
+__all__.extend(view.__all__)
+__all__.extend(parallel.__all__)
+__all__.extend(compression.__all__)
+
+# Makes `byter.stats.enable()` available right after `import byter`
+from . import stats  # noqa: F401,E402
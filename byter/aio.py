@@ -0,0 +1,864 @@
+"""
+Byter asyncio read/write functions.
+
+Counterparts of the `byter` functions for `asyncio` streams: readers are
+coroutines built on `StreamReader.readexactly`, so values are decoded as
+they arrive without blocking the event loop. Writers write to the buffer of
+a `StreamWriter` and optionally wait for it to drain.
+"""
+
+# yapf: disable
+__all__ = [
+    "read_char",
+    "read_signed_char",
+    "read_unsigned_char",
+    "read_bool",
+    "read_short",
+    "read_unsigned_short",
+    "read_int",
+    "read_unsigned_int",
+    "read_long",
+    "read_unsigned_long",
+    "read_long_long",
+    "read_unsigned_long_long",
+    "read_float",
+    "read_double",
+    "read_string",
+    "read_array",
+    "read_record",
+    "read_records",
+    "write_char",
+    "write_signed_char",
+    "write_unsigned_char",
+    "write_bool",
+    "write_short",
+    "write_unsigned_short",
+    "write_int",
+    "write_unsigned_int",
+    "write_long",
+    "write_unsigned_long",
+    "write_long_long",
+    "write_unsigned_long_long",
+    "write_float",
+    "write_double",
+    "write_string",
+    "write_array",
+    "write_record",
+    "write_records"
+]
+# yapf: enable
+
+import itertools
+
+from . import writer
+from .codec import STRUCTS, get_array_struct, unpack_array_from
+from .records import decode_columns, decode_rows
+
+
+class _BytesWriter:
+    """
+    File-like wrapper of a `StreamWriter` passing it immutable copies.
+
+    Transports may keep a reference to the data until it is sent, while
+    `byter.write_array` reuses and byte-swaps its buffers between writes.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data):
+        """Write a copy of `data` to the stream."""
+        self.stream.write(bytes(data))
+
+
+async def read_char(stream, byteorder="native"):
+    """
+    Read 1 byte of data as `char`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    bytes
+        Python string of length of 1, encoded as bytes
+    """
+    codec = STRUCTS[byteorder]["char"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_signed_char(stream, byteorder="native"):
+    """
+    Read 1 byte of data as `signed char`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["signed_char"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_unsigned_char(stream, byteorder="native"):
+    """
+    Read 1 byte of data as `unsigned char`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["unsigned_char"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_bool(stream, byteorder="native"):
+    """
+    Read 1 byte of data as `bool` type.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    bool
+        True or False
+    """
+    codec = STRUCTS[byteorder]["bool"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_short(stream, byteorder="native"):
+    """
+    Read 2 bytes of data as `short`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["short"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_unsigned_short(stream, byteorder="native"):
+    """
+    Read 2 bytes of data as `unsigned short`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["unsigned_short"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_int(stream, byteorder="native"):
+    """
+    Read 4 bytes of data as `int`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["int"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_unsigned_int(stream, byteorder="native"):
+    """
+    Read 4 bytes of data as `unsigned int`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["unsigned_int"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_long(stream, byteorder="native"):
+    """
+    Read 4 bytes of data as `long`.
+
+    It is highly recommended to use `read_int(data)` instead.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["long"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_unsigned_long(stream, byteorder="native"):
+    """
+    Read 4 bytes of data as `unsigned long`.
+
+    It is highly recommended to use `read_unsigned_int(data)` instead.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["unsigned_long"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_long_long(stream, byteorder="native"):
+    """
+    Read 8 bytes of data as `long long`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["long_long"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_unsigned_long_long(stream, byteorder="native"):
+    """
+    Read 8 bytes of data as `unsigned long long`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Python integer
+    """
+    codec = STRUCTS[byteorder]["unsigned_long_long"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_float(stream, byteorder="native"):
+    """
+    Read 4 bytes of data as `float`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    float
+        Python float
+    """
+    codec = STRUCTS[byteorder]["float"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_double(stream, byteorder="native"):
+    """
+    Read 8 bytes of data as `double`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    float
+        Python float
+    """
+    codec = STRUCTS[byteorder]["double"]
+    return codec.unpack(await stream.readexactly(codec.size))[0]
+
+
+async def read_string(stream, s_len):
+    """
+    Read `s_len` bytes as `char[]`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    s_len : int
+        Size of the string to read (# of bytes)
+
+    Returns
+    -------
+    str
+        Python string of length `s_len`
+    """
+    return (await stream.readexactly(s_len)).decode("utf-8")
+
+
+async def read_array(stream,
+                     size,
+                     c_type,
+                     byteorder="native",
+                     as_numpy=False,
+                     as_array=False):
+    """
+    Read `size` consequent elements, each of type `c_type`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    size : int
+        Number of elements to read
+    c_type : str
+        C-language type string (e.g. "unsigned_int")
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    as_numpy : bool
+        Return a read-only NumPy array (requires NumPy)
+    as_array : bool
+        Return an `array.array` in native byte order
+
+    Returns
+    -------
+    list | numpy.ndarray | array.array
+        Python list of size `size`, or a NumPy array or an `array.array` if
+        `as_numpy` or `as_array` is set
+    """
+    codec = get_array_struct(size, c_type, byteorder)
+    bytes_data = await stream.readexactly(codec.size)
+    return unpack_array_from(bytes_data, 0, size, c_type, byteorder, as_numpy,
+                             as_array)
+
+
+async def read_record(stream, schema):
+    """
+    Read one record of layout `schema`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    schema : Schema
+        Layout of the record
+
+    Returns
+    -------
+    dict
+        Field name -> value mapping
+    """
+    return schema.unpack(await stream.readexactly(schema.size))
+
+
+async def read_records(stream, schema, count, columns=False):
+    """
+    Read `count` back-to-back fixed-size records of layout `schema`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        Stream to read from
+    schema : Schema
+        Layout of a record
+    count : int
+        Number of records to read
+    columns : bool
+        Return per-field columns instead of a list of records
+
+    Returns
+    -------
+    list of tuple | dict
+        List of field value tuples, or field name -> column mapping if
+        `columns` is set (see `byter.read_records`)
+    """
+    bytes_data = await stream.readexactly(count * schema.size)
+    if columns:
+        return decode_columns(bytes_data, schema, count)
+    return decode_rows(bytes_data, schema, count)
+
+
+async def write_char(stream, value, byteorder="native", drain=True):
+    """
+    Write 1 byte of data as `char`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : bytes
+        Python string of length of 1, encoded as bytes
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_char(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_signed_char(stream, value, byteorder="native", drain=True):
+    """
+    Write 1 byte of data as `signed char`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_signed_char(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_unsigned_char(stream, value, byteorder="native", drain=True):
+    """
+    Write 1 byte of data as `unsigned char`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_unsigned_char(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_bool(stream, value, byteorder="native", drain=True):
+    """
+    Write 1 byte of data as `bool` type.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : bool
+        True or False
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_bool(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_short(stream, value, byteorder="native", drain=True):
+    """
+    Write 2 bytes of data as `short`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_short(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_unsigned_short(stream, value, byteorder="native", drain=True):
+    """
+    Write 2 bytes of data as `unsigned short`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_unsigned_short(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_int(stream, value, byteorder="native", drain=True):
+    """
+    Write 4 bytes of data as `int`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_int(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_unsigned_int(stream, value, byteorder="native", drain=True):
+    """
+    Write 4 bytes of data as `unsigned int`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_unsigned_int(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_long(stream, value, byteorder="native", drain=True):
+    """
+    Write 4 bytes of data as `long`.
+
+    It is highly recommended to use `write_int(data, value)` instead.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_long(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_unsigned_long(stream, value, byteorder="native", drain=True):
+    """
+    Write 4 bytes of data as `unsigned long`.
+
+    It is highly recommended to use `write_unsigned_int(data, value)` instead.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_unsigned_long(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_long_long(stream, value, byteorder="native", drain=True):
+    """
+    Write 8 bytes of data as `long long`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_long_long(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_unsigned_long_long(stream,
+                                   value,
+                                   byteorder="native",
+                                   drain=True):
+    """
+    Write 8 bytes of data as `unsigned long long`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : int
+        Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_unsigned_long_long(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_float(stream, value, byteorder="native", drain=True):
+    """
+    Write 4 bytes of data as `float`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : float
+        Python float
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_float(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_double(stream, value, byteorder="native", drain=True):
+    """
+    Write 8 bytes of data as `double`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : float
+        Python float
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_double(stream, value, byteorder)
+    if drain:
+        await stream.drain()
+
+
+async def write_string(stream, value, drain=True):
+    """
+    Write Python string as `char[]`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    value : str
+        Python string
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    writer.write_string(stream, value)
+    if drain:
+        await stream.drain()
+
+
+async def write_array(stream,
+                      values,
+                      c_type,
+                      byteorder="native",
+                      chunk_size=65536,
+                      drain=True):
+    """
+    Write a list of elements, each of type `c_type`.
+
+    Values are packed and written `chunk_size` elements at a time, waiting
+    for the stream to drain after each chunk if `drain` is set, so no more
+    than about one chunk is buffered by the transport at once.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    values : list | tuple | iterable | bytes-like | numpy.ndarray
+        Python iterable object (see `byter.write_array`)
+    c_type : str
+        C-language type string (e.g. "unsigned_int")
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    chunk_size : int
+        Number of elements to pack and write at once
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough after
+        every chunk
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive, got %d" % chunk_size)
+
+    if hasattr(values, "__len__") and hasattr(values, "__getitem__"):
+        # Slices keep buffers written as buffers (see `byter.write_array`)
+        chunks = (values[start:start + chunk_size]
+                  for start in range(0, len(values), chunk_size))
+    else:
+        values = iter(values)
+        chunks = iter(lambda: tuple(itertools.islice(values, chunk_size)), ())
+
+    sink = _BytesWriter(stream)
+    for chunk in chunks:
+        writer.write_array(sink, chunk, c_type, byteorder, chunk_size)
+        if drain:
+            await stream.drain()
+
+
+async def write_record(stream, schema, record, drain=True):
+    """
+    Write one record of layout `schema`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    schema : Schema
+        Layout of the record
+    record : dict | list | tuple
+        Field name -> value mapping or field values in order
+    drain : bool
+        Wait until the write buffer of the stream is flushed enough
+    """
+    stream.write(schema.pack(record))
+    if drain:
+        await stream.drain()
+
+
+async def write_records(stream, schema, records, batch_size=1 << 16):
+    """
+    Write many records of layout `schema`, draining once per batch.
+
+    Records are packed into a buffer of `batch_size` bytes, which is written
+    to the stream with a single `write` call followed by a single `drain`.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamWriter
+        Stream to write to
+    schema : Schema
+        Layout of a record
+    records : iterable
+        Records as field name -> value mappings or field values in order
+    batch_size : int
+        Size of a batch (# of bytes), rounded down to a whole number of
+        records (at least one)
+    """
+    capacity = max(batch_size // schema.size, 1)
+    buffer = bytearray(capacity * schema.size)
+    count = 0
+
+    for record in records:
+        schema.pack_into(buffer, count * schema.size, record)
+        count += 1
+        if count == capacity:
+            stream.write(bytes(buffer))
+            await stream.drain()
+            count = 0
+
+    if count:
+        stream.write(bytes(buffer[:count * schema.size]))
+        await stream.drain()
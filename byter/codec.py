@@ -0,0 +1,388 @@
+"""Byter precompiled codecs."""
+
+import array
+import functools
+import struct
+import sys
+
+from .constants import BYTE_ORDERS, TYPES_TABLE
+from .utils import get_type
+
+try:
+    import numpy
+except ImportError:  # NumPy is an optional dependency
+    numpy = None
+
+
+def _array_typecode(s_type):
+    """Find an `array` typecode of the same kind and size as `s_type`."""
+    if s_type in "fd":
+        return s_type
+    if s_type in "c?":
+        return None
+
+    candidates = "bhiql" if s_type.islower() else "BHIQL"
+    size = struct.calcsize("=" + s_type)
+    for typecode in candidates:
+        if array.array(typecode).itemsize == size:
+            return typecode
+    return None
+
+
+def get_typecode(c_type):
+    """
+    Get an `array` typecode of the same kind and size as `c_type`.
+
+    Examples
+    --------
+        get_typecode("unsigned_short") returns "H"
+        get_typecode("long") returns "i" where a C long is 8 bytes wide
+
+    Parameters
+    ----------
+    c_type : str
+        C-language type string (e.g. "unsigned_int")
+
+    Returns
+    -------
+    str
+        A typecode for `array` library
+
+    Raises
+    ------
+    ValueError
+        If `array` has no matching typecode (`char` and `bool`)
+    """
+    try:
+        return ARRAY_TYPECODES[c_type]
+    except KeyError:
+        get_type(c_type)  # raises a KeyError on unknown C-language type
+        raise ValueError("%r values can not be stored in an `array.array`" %
+                         c_type) from None
+
+
+def _dtype_code(s_type):
+    """Find a sized NumPy type code of the same kind and size as `s_type`."""
+    size = struct.calcsize("=" + s_type)
+    if s_type == "c":
+        return "S%d" % size
+    if s_type == "?":
+        return "b%d" % size
+    if s_type in "fd":
+        return "f%d" % size
+    return "%s%d" % ("i" if s_type.islower() else "u", size)
+
+
+class _CodecTable(dict):
+    """Byte order -> codecs mapping raising ValueError on unknown orders."""
+
+    def __missing__(self, byteorder):
+        get_prefix(byteorder)
+        raise KeyError(byteorder)
+
+
+def get_prefix(byteorder):
+    """
+    Get a `struct` byte order prefix from the byte order name.
+
+    Examples
+    --------
+        get_prefix("little") returns "<"
+        get_prefix("native") returns "="
+
+    Parameters
+    ----------
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    str
+        A byte order character for `struct` library
+    """
+    try:
+        return BYTE_ORDERS[byteorder]
+    except KeyError:
+        raise ValueError("unknown byte order %r, expected one of: %s" %
+                         (byteorder, ", ".join(BYTE_ORDERS))) from None
+
+
+def get_struct(c_type, byteorder="native"):
+    """
+    Get a precompiled `struct.Struct` for a single `c_type` value.
+
+    Parameters
+    ----------
+    c_type : str
+        C-language type string (e.g. "unsigned_int")
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    struct.Struct
+        Compiled struct of a single `c_type` value
+    """
+    return STRUCTS[byteorder][c_type]
+
+
+# One precompiled `struct.Struct` per byte order and C-language type,
+# e.g. STRUCTS["little"]["int"] is `struct.Struct("<i")`
+STRUCTS = _CodecTable({
+    byteorder: {
+        c_type: struct.Struct(prefix + s_type)
+        for c_type, s_type in TYPES_TABLE.items()
+    }
+    for byteorder, prefix in BYTE_ORDERS.items()
+})
+
+
+@functools.lru_cache(maxsize=256)
+def get_array_struct(size, c_type, byteorder="native"):
+    """
+    Get a compiled `struct.Struct` for `size` consequent `c_type` values.
+
+    Parameters
+    ----------
+    size : int
+        Number of elements
+    c_type : str
+        C-language type string (e.g. "unsigned_int")
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    struct.Struct
+        Compiled struct of `size` values, e.g. `struct.Struct("=10i")`
+    """
+    s_type = get_type(c_type)
+    return struct.Struct("%s%d%s" % (get_prefix(byteorder), size, s_type))
+
+
+def resolve_byteorder(byteorder):
+    """
+    Get the actual byte order behind a byte order name.
+
+    Examples
+    --------
+        resolve_byteorder("network") returns "big"
+        resolve_byteorder("native") returns "little" on x86
+
+    Parameters
+    ----------
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    str
+        "little" or "big"
+    """
+    prefix = get_prefix(byteorder)
+    if prefix == "=":
+        return sys.byteorder
+    return "little" if prefix == "<" else "big"
+
+
+def needs_byteswap(byteorder):
+    """
+    Check whether `byteorder` differs from the byte order of this machine.
+
+    Parameters
+    ----------
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    bool
+        True if values in `byteorder` must be byte-swapped to be used natively
+    """
+    return resolve_byteorder(byteorder) != sys.byteorder
+
+
+def _format_kind(s_type):
+    """Get the kind of a format character: "i", "u", "f", "c" or "?"."""
+    if s_type in "bhilqn":
+        return "i"
+    if s_type in "BHILQN":
+        return "u"
+    if s_type in "efd":
+        return "f"
+    return s_type
+
+
+def get_buffer_byteorder(view, c_type):
+    """
+    Check whether a buffer holds values laid out like `c_type` values.
+
+    Parameters
+    ----------
+    view : memoryview
+        View of the buffer
+    c_type : str
+        C-language type string (e.g. "unsigned_int")
+
+    Returns
+    -------
+    str | None
+        Byte order of the buffer ("little" or "big") if it is C-contiguous
+        and its items are of the same kind and size as `c_type`, else None
+    """
+    if not view.c_contiguous or view.itemsize != STRUCTS["native"][c_type].size:
+        return None
+
+    s_format = view.format
+    prefix = "@"
+    if s_format[:1] in "@=<>!":
+        prefix, s_format = s_format[0], s_format[1:]
+    if len(s_format) != 1:
+        return None
+
+    kind = _format_kind(s_format)
+    expected_kind = _format_kind(get_type(c_type))
+    if kind != expected_kind and not (expected_kind == "c" and kind in "iu"):
+        return None
+
+    if prefix in "@=":
+        return sys.byteorder
+    return "little" if prefix == "<" else "big"
+
+
+# `array` typecodes of the same kind and size as the C-language types,
+# e.g. ARRAY_TYPECODES["long"] is "i" where a C long is 8 bytes wide
+ARRAY_TYPECODES = {
+    c_type: typecode
+    for c_type, typecode in ((c_type, _array_typecode(s_type))
+                             for c_type, s_type in TYPES_TABLE.items())
+    if typecode is not None
+}
+
+# Sized NumPy type codes of the C-language types, e.g. DTYPE_CODES["long"]
+# is "i4" regardless of the width of a C long on this machine
+DTYPE_CODES = {
+    c_type: _dtype_code(s_type)
+    for c_type, s_type in TYPES_TABLE.items()
+}
+
+
+def get_dtype(c_type, byteorder="native"):
+    """
+    Get a NumPy dtype for a single `c_type` value.
+
+    Parameters
+    ----------
+    c_type : str
+        C-language type string (e.g. "unsigned_int")
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    numpy.dtype
+        NumPy dtype of the same size, kind and byte order as `c_type`
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed
+    """
+    if numpy is None:
+        raise ImportError("NumPy is required for NumPy arrays support, "
+                          "install it with `pip install numpy`")
+
+    prefix = get_prefix(byteorder).replace("!", ">")
+    return numpy.dtype(prefix + DTYPE_CODES[c_type])
+
+
+def check_offset(buffer, offset):
+    """
+    Reject negative offsets, which `unpack_from` counts from the end.
+
+    Parameters
+    ----------
+    buffer : bytes-like | mmap.mmap
+        Buffer the offset points into
+    offset : int
+        Position in the buffer (# of bytes)
+
+    Raises
+    ------
+    struct.error
+        If `offset` is negative
+    """
+    if offset < 0:
+        raise struct.error("offset %d out of range for %d-byte buffer" %
+                           (offset, memoryview(buffer).nbytes))
+
+
+def unpack_array_from(buffer,
+                      offset,
+                      size,
+                      c_type,
+                      byteorder="native",
+                      as_numpy=False,
+                      as_array=False,
+                      as_view=False):
+    """
+    Decode `size` consequent `c_type` elements from a buffer at `offset`.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        Buffer to decode from
+    offset : int
+        Position of the first element in the buffer (# of bytes)
+    size : int
+        Number of elements to decode
+    c_type : str
+        C-language type string (e.g. "unsigned_int")
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    as_numpy : bool
+        Return a NumPy array sharing memory with `buffer` (requires NumPy)
+    as_array : bool
+        Return an `array.array` in native byte order
+    as_view : bool
+        Return a `memoryview` sharing memory with `buffer` (requires
+        `byteorder` to match the byte order of this machine)
+
+    Returns
+    -------
+    list | numpy.ndarray | array.array | memoryview
+        Decoded elements
+    """
+    if as_numpy + as_array + as_view > 1:
+        raise ValueError("`as_numpy`, `as_array` and `as_view` are mutually "
+                         "exclusive")
+    check_offset(buffer, offset)
+
+    if not as_numpy and not as_array and not as_view:
+        codec = get_array_struct(size, c_type, byteorder)
+        return list(codec.unpack_from(buffer, offset))
+
+    view = memoryview(buffer).cast("B")
+    num_bytes = size * STRUCTS[byteorder][c_type].size
+    if offset + num_bytes > view.nbytes:
+        raise struct.error("unpack_from requires a buffer of at least %d "
+                           "bytes" % (offset + num_bytes))
+
+    if as_numpy:
+        return numpy.frombuffer(view,
+                                dtype=get_dtype(c_type, byteorder),
+                                count=size,
+                                offset=offset)
+
+    if as_view:
+        if needs_byteswap(byteorder):
+            raise ValueError("a view requires %r byte order to match the "
+                             "byte order of this machine" % byteorder)
+        typecode = ARRAY_TYPECODES.get(c_type) or get_type(c_type)
+        return view[offset:offset + num_bytes].cast(typecode)
+
+    values = array.array(get_typecode(c_type))
+    values.frombytes(view[offset:offset + num_bytes])
+    if values.itemsize > 1 and needs_byteswap(byteorder):
+        values.byteswap()
+    return values
@@ -0,0 +1,183 @@
+"""Byter code-generated record decoders."""
+
+__all__ = ["compile_decoder"]
+
+import collections
+import functools
+import keyword
+import re
+
+from .schema import STRING_TYPE
+
+# Characters of field names that are not allowed in Python identifiers
+_NON_IDENTIFIER = re.compile(r"\W+")
+
+
+def _identifier(name):
+    """Get the attribute name of a field, e.g. "pts_0_x" for "pts[0].x"."""
+    return _NON_IDENTIFIER.sub("_", name).rstrip("_")
+
+
+def _identifiers(schema):
+    """Get the attribute names of all fields of `schema`."""
+    identifiers = []
+    for name in schema.names:
+        identifier = _identifier(name)
+        if not identifier.isidentifier() or keyword.iskeyword(identifier):
+            raise ValueError("field name %r is not a valid identifier" % name)
+        identifiers.append(identifier)
+
+    if len(set(identifiers)) < len(identifiers):
+        raise ValueError("field names %r map to duplicate identifiers %r" %
+                         (schema.names, identifiers))
+    return identifiers
+
+
+def _slot_names(cls):
+    """Get the names of all `__slots__` of `cls` and its base classes."""
+    names = set()
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        names.update((slots, ) if isinstance(slots, str) else slots)
+    return names
+
+
+def _value_expressions(schema, converters):
+    """Get the source of every field value decoded from a tuple `v`."""
+    expressions = []
+    for number, field in enumerate(schema.fields):
+        if field.c_type == STRING_TYPE:
+            expression = "v[%d].decode('utf-8')" % field.index
+        elif field.length is None:
+            expression = "v[%d]" % field.index
+        else:
+            expression = "list(v[%d:%d])" % (field.index, field.index +
+                                             field.count)
+
+        if field.name in converters:
+            expression = "convert_%d(%s)" % (number, expression)
+        expressions.append(expression)
+    return expressions
+
+
+def _build_source(schema, names, cls, converters):
+    """Get the body building a record from an unpacked tuple `v`."""
+    expressions = _value_expressions(schema, converters)
+
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        if list(cls._fields) != names:
+            raise ValueError("namedtuple fields %r do not match the schema "
+                             "fields %r" % (cls._fields, names))
+        flat = ["v[%d]" % index for index in range(len(expressions))]
+        if expressions == flat:
+            return ["return new(cls, v)"]
+        return ["return new(cls, (%s,))" % ", ".join(expressions)]
+
+    if "__slots__" in cls.__dict__:
+        missing = set(names) - _slot_names(cls)
+        if missing:
+            raise ValueError("%s has no slots for fields %s" %
+                             (cls.__name__, ", ".join(sorted(missing))))
+        lines = ["record = new(cls)"]
+        lines.extend("record.%s = %s" % (name, expression)
+                     for name, expression in zip(names, expressions))
+        lines.append("return record")
+        return lines
+
+    return [
+        "return cls(%s)" %
+        ", ".join("%s=%s" % (name, expression)
+                  for name, expression in zip(names, expressions))
+    ]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(schema, cls, converters):
+    """Generate and compile the decoder functions of a schema."""
+    converters = dict(converters)
+    names = _identifiers(schema)
+    unknown = set(converters) - set(schema.names)
+    if unknown:
+        raise ValueError("converters of unknown fields: %s" %
+                         ", ".join(sorted(unknown)))
+
+    if cls is None:
+        cls = collections.namedtuple("Record", names)
+
+    body = _build_source(schema, names, cls, converters)
+    # The last line of the body returns the record, the generator yields it
+    iter_body = body[:-1] + ["yield " + body[-1][len("return "):]]
+
+    lines = ["def decode(buffer, offset=0):"]
+    lines.append("    v = unpack_from(buffer, offset)")
+    lines.extend("    " + line for line in body)
+    lines.append("")
+    lines.append("def iter_decode(buffer):")
+    lines.append("    for v in iter_unpack(buffer):")
+    lines.extend("        " + line for line in iter_body)
+    source = "\n".join(lines)
+
+    namespace = {
+        "cls": cls,
+        "new": tuple.__new__ if issubclass(cls, tuple) else cls.__new__,
+        "unpack_from": schema.struct.unpack_from,
+        "iter_unpack": schema.struct.iter_unpack,
+    }
+    namespace.update(
+        ("convert_%d" % number, converters[name])
+        for number, name in enumerate(schema.names) if name in converters)
+
+    exec(compile(source, "<byter decoder of %r>" % (schema, ), "exec"),
+         namespace)
+
+    decode = namespace["decode"]
+    decode.iter_decode = namespace["iter_decode"]
+    decode.record_class = cls
+    decode.source = source
+    return decode
+
+
+def compile_decoder(schema, cls=None, converters=None):
+    """
+    Generate a Python function decoding records of `schema` into objects.
+
+    The function is specialised for the schema: it unpacks a record with
+    the compiled struct of the schema and builds the object in a single
+    expression, with string decoding and `converters` inlined, instead of
+    looping over the fields. Decoders are cached per schema, class and
+    converters.
+
+    Objects get one attribute per field, named after the field with every
+    run of characters not allowed in identifiers replaced by "_" (trailing
+    ones dropped): fields "in.x" and "pts[0].x" of `Schema.from_c` become
+    `in_x` and `pts_0_x`.
+
+    Examples
+    --------
+        decode = compile_decoder(schema)
+        record = decode(buffer, offset)  # Record(has_data=True, ...)
+        records = list(decode.iter_decode(buffer))
+
+    Parameters
+    ----------
+    schema : Schema
+        Layout of a record
+    cls : type | None
+        Class of the decoded objects: a namedtuple with the schema fields,
+        a class with `__slots__` for the schema fields, or any class taking
+        the fields as keyword arguments (e.g. a dataclass). A namedtuple
+        named "Record" is created if None
+    converters : dict | None
+        Field name (as in the schema, e.g. "in.x") -> function applied to
+        the decoded value of the field
+
+    Returns
+    -------
+    function
+        `decode(buffer, offset=0)` decoding one record from a buffer at
+        `offset`. Its `iter_decode(buffer)` attribute decodes back-to-back
+        records of a whole buffer, `record_class` is the class of the
+        decoded objects and `source` is the generated source code
+    """
+    converters = tuple(sorted((converters or {}).items()))
+    return _compile(schema, cls, converters)
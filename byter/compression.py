@@ -0,0 +1,232 @@
+"""Byter compressed stream reader."""
+
+__all__ = ["detect_compression"]
+
+import io
+import os
+import zlib
+
+try:
+    import bz2
+except ImportError:  # Python built without bz2 support
+    bz2 = None
+
+try:
+    import lzma
+except ImportError:  # Python built without lzma support
+    lzma = None
+
+# Size of the compressed blocks read from the file and of the buffer of
+# decompressed data the values are read from (# of bytes)
+BLOCK_SIZE = 1 << 20
+
+# Longest magic number of `_MAGIC_NUMBERS`
+_MAGIC_SIZE = 6
+
+_MAGIC_NUMBERS = [
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+]
+
+
+def _new_decompressor(compression):
+    """Create a decompressor object of a single compressed stream."""
+    if compression == "gzip":
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if compression == "zlib":
+        return zlib.decompressobj(zlib.MAX_WBITS)
+    if compression == "bz2":
+        if bz2 is None:
+            raise ImportError("the bz2 module is required for bz2 support")
+        return bz2.BZ2Decompressor()
+    if compression == "xz":
+        if lzma is None:
+            raise ImportError("the lzma module is required for xz support")
+        return lzma.LZMADecompressor(lzma.FORMAT_XZ)
+    raise ValueError('unsupported compression %r, expected "auto", "gzip", '
+                     '"bz2", "xz", "zlib" or None' % (compression, ))
+
+
+def detect_compression(header):
+    """
+    Detect the compression of a stream from its first bytes.
+
+    zlib streams are not detected: their 2-byte header is a check sum, not
+    a magic number, and about 1 in 1000 uncompressed files start with a
+    valid one (e.g. the `short` 376 in little-endian).
+
+    Examples
+    --------
+        detect_compression(gzip.compress(data)) returns "gzip"
+        detect_compression(bytes(8)) returns None
+
+    Parameters
+    ----------
+    header : bytes
+        First bytes of the stream, at least 6 to detect all compressions
+
+    Returns
+    -------
+    str | None
+        "gzip", "bz2" or "xz", None if the stream is not compressed in a
+        detectable format
+    """
+    header = bytes(header[:_MAGIC_SIZE])
+    for magic, compression in _MAGIC_NUMBERS:
+        if header.startswith(magic):
+            return compression
+
+    return None
+
+
+class _DecompressedRaw(io.RawIOBase):
+    """
+    Raw stream of the decompressed bytes of a compressed binary file.
+
+    Compressed data is read from the file in blocks of `block_size` bytes,
+    and every `readinto` call decompresses straight into the buffer of the
+    caller. Concatenated streams (e.g. gzip members) are read one after
+    another.
+    """
+
+    def __init__(self, fileobj, compression, block_size, closefd):
+        self._fileobj = fileobj
+        self._compression = compression
+        self._block_size = block_size
+        self._closefd = closefd
+        self._decompressor = _new_decompressor(compression)
+        self._position = 0
+
+    def readable(self):
+        """Return True: the stream is open for reading."""
+        return True
+
+    def tell(self):
+        """Return the number of decompressed bytes read so far."""
+        return self._position
+
+    def _needs_input(self):
+        """Check whether the decompressor has consumed all its input."""
+        if hasattr(self._decompressor, "needs_input"):
+            return self._decompressor.needs_input
+        return not self._decompressor.unconsumed_tail
+
+    def readinto(self, buffer):
+        """Decompress up to `len(buffer)` bytes into `buffer`."""
+        with memoryview(buffer) as view, view.cast("B") as byte_view:
+            size = byte_view.nbytes
+            if not size:
+                return 0
+
+            while True:
+                decompressor = self._decompressor
+                if decompressor.eof:
+                    # The next stream starts with the data left unused
+                    data = (decompressor.unused_data or
+                            self._fileobj.read(self._block_size))
+                    if not data:
+                        return 0
+                    decompressor = self._new_stream()
+                elif self._needs_input():
+                    data = self._fileobj.read(self._block_size)
+                    if not data:
+                        raise EOFError("compressed file ended before the "
+                                       "end-of-stream marker was reached")
+                else:
+                    data = getattr(decompressor, "unconsumed_tail", b"")
+
+                chunk = decompressor.decompress(data, size)
+                if chunk:
+                    num_bytes = len(chunk)
+                    byte_view[:num_bytes] = chunk
+                    self._position += num_bytes
+                    return num_bytes
+
+    def _new_stream(self):
+        """Start decompressing a concatenated stream."""
+        self._decompressor = _new_decompressor(self._compression)
+        return self._decompressor
+
+    def close(self):
+        """Close the stream, and the file if it was opened from a path."""
+        if not self.closed:
+            try:
+                if self._closefd:
+                    self._fileobj.close()
+            finally:
+                super().close()
+
+
+def _peek(fileobj, size):
+    """Get the first `size` bytes of `fileobj` without consuming them."""
+    peek = getattr(fileobj, "peek", None)
+    if peek is not None:
+        return peek(size)[:size]
+
+    position = fileobj.tell()
+    header = fileobj.read(size)
+    fileobj.seek(position)
+    return header
+
+
+def open(file, compression="auto", block_size=BLOCK_SIZE):
+    """
+    Open a binary file for reading, decompressing it on the fly.
+
+    Compressed data is decompressed in large blocks into the buffer of an
+    `io.BufferedReader`, so the small reads of the `read_*` functions are
+    served from memory instead of going through the Python layers of
+    `gzip.open` and the like. Not exported by `from byter import *`, as it
+    would shadow the built-in `open`.
+
+    Examples
+    --------
+        with byter.open("/path/to/binary/file.gz") as data:
+            year = read_short(data)
+            values = read_array(data, 1000, "float", as_array=True)
+
+    Parameters
+    ----------
+    file : str | os.PathLike | io.BufferedReader
+        Path to a file, or file open to read in binary mode (not closed by
+        the returned reader)
+    compression : str | None
+        "gzip", "bz2", "xz" or "zlib", "auto" to detect gzip, bz2 or xz
+        from the magic number at the start of the file, None to read the
+        file as is
+    block_size : int
+        Size of the compressed blocks read and of the buffer of decompressed
+        data (# of bytes)
+
+    Returns
+    -------
+    io.BufferedReader
+        Reader of the decompressed data; the file itself if it is not
+        compressed
+
+    Raises
+    ------
+    ValueError
+        If `compression` is not supported
+    EOFError
+        When reading, if the compressed data is truncated
+    """
+    if compression not in ("auto", None):
+        _new_decompressor(compression)  # Checks the compression early
+
+    closefd = isinstance(file, (str, bytes, os.PathLike))
+    fileobj = io.open(file, "rb", buffering=block_size) if closefd else file
+
+    try:
+        if compression == "auto":
+            compression = detect_compression(_peek(fileobj, _MAGIC_SIZE))
+        if compression is None:
+            return fileobj
+
+        raw = _DecompressedRaw(fileobj, compression, block_size, closefd)
+    except BaseException:
+        if closefd:
+            fileobj.close()
+        raise
+    return io.BufferedReader(raw, buffer_size=block_size)
@@ -16,3 +16,15 @@ TYPES_TABLE = {
     "double":             "d"
 }
 # yapf: enable
+
+# yapf: disable
+BYTE_ORDERS = {
+    "native":  "=",
+    "little":  "<",
+    "big":     ">",
+    "network": "!"
+}
+# yapf: enable
+
+# C-language type string of fixed-size strings in record schemas
+STRING_TYPE = "char[]"
@@ -0,0 +1,301 @@
+"""Byter C struct declaration parser."""
+
+import re
+
+from .codec import STRUCTS
+from .constants import STRING_TYPE
+
+_TOKEN = re.compile(r"\s*(?:([A-Za-z_]\w*)|(0[xX][0-9a-fA-F]+|\d+)|(.))")
+_COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+
+# Words of C type names and fixed-width integer types
+_TYPE_WORDS = {
+    "signed", "unsigned", "char", "short", "int", "long", "float", "double",
+    "bool", "_Bool"
+}
+_QUALIFIERS = {"const", "volatile"}
+_FIXED_WIDTH_TYPES = {
+    "int8_t": "signed_char",
+    "uint8_t": "unsigned_char",
+    "int16_t": "short",
+    "uint16_t": "unsigned_short",
+    "int32_t": "int",
+    "uint32_t": "unsigned_int",
+    "int64_t": "long_long",
+    "uint64_t": "unsigned_long_long",
+}
+
+
+class _Struct:
+    """A parsed struct: members as `(name, type, dimensions)` triples."""
+
+    def __init__(self, members):
+        self.members = members
+
+
+def _tokenize(declaration):
+    """Split a C declaration into identifiers, numbers and symbols."""
+    tokens = []
+    for name, number, symbol in _TOKEN.findall(_COMMENT.sub(" ", declaration)):
+        if name:
+            tokens.append(name)
+        elif number:
+            tokens.append(int(number, 0))
+        elif not symbol.isspace():
+            tokens.append(symbol)
+    return tokens
+
+
+def _c_type(words):
+    """Get a C-language type string of `TYPES_TABLE` from C type words."""
+    declared = " ".join(words)
+    signed, unsigned = "signed" in words, "unsigned" in words
+    words = [word for word in words if word not in ("signed", "unsigned")]
+    if "int" in words and ("long" in words or "short" in words):
+        words.remove("int")
+
+    if not words:
+        base = "int"  # "signed" or "unsigned" alone
+    elif words == ["long", "long"]:
+        base = "long_long"
+    elif words == ["_Bool"]:
+        base = "bool"
+    elif len(words) == 1:
+        base = words[0]
+    else:
+        raise ValueError("unsupported C type %r" % declared)
+
+    sign_less = base in ("float", "double", "bool")
+    if signed and unsigned or (signed or unsigned) and sign_less:
+        raise ValueError("unsupported C type %r" % declared)
+    if unsigned:
+        return "unsigned_" + base
+    if signed and base == "char":
+        return "signed_char"
+    return base
+
+
+class _Parser:
+    """Recursive descent parser of C struct declarations."""
+
+    def __init__(self, declaration):
+        self.tokens = _tokenize(declaration)
+        self.position = 0
+        self.structs = {}
+        self.typedefs = {}
+
+    def peek(self):
+        """Get the next token without consuming it."""
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def take(self, expected=None):
+        """Consume the next token, checking it if `expected` is given."""
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise ValueError(
+                "expected %r, got %r" %
+                (expected or
+                 "a token", "end of declaration" if token is None else token))
+        self.position += 1
+        return token
+
+    def name(self):
+        """Consume an identifier."""
+        token = self.take()
+        if not isinstance(token, str) or not token.isidentifier():
+            raise ValueError("expected a name, got %r" % token)
+        return token
+
+    def parse(self):
+        """Parse all declarations and get the last declared struct."""
+        last = None
+        while self.peek() is not None:
+            if self.peek() == "typedef":
+                self.take()
+                struct_type = self.type()
+                alias = self.name()
+                self.typedefs[alias] = struct_type
+                self.take(";")
+            else:
+                struct_type = self.type()
+                if not isinstance(struct_type, _Struct):
+                    raise ValueError("expected a struct declaration")
+                self.take(";")
+            if isinstance(struct_type, _Struct):
+                last = struct_type
+
+        if last is None:
+            raise ValueError("no struct declaration found")
+        return last
+
+    def type(self):
+        """Parse a type: a struct, a typedef name or C type words."""
+        while self.peek() in _QUALIFIERS:
+            self.take()
+
+        token = self.peek()
+        if token == "struct":
+            self.take()
+            tag = self.name() if self.peek() != "{" else None
+            if self.peek() != "{":
+                if tag not in self.structs:
+                    raise ValueError("unknown struct %r" % tag)
+                return self.structs[tag]
+
+            struct_type = _Struct(self.members())
+            if tag is not None:
+                self.structs[tag] = struct_type
+            return struct_type
+
+        if token in self.typedefs:
+            self.take()
+            return self.typedefs[token]
+
+        if token in _FIXED_WIDTH_TYPES:
+            self.take()
+            return _FIXED_WIDTH_TYPES[token]
+
+        words = []
+        while self.peek() in _TYPE_WORDS or self.peek() in _QUALIFIERS:
+            word = self.take()
+            if word not in _QUALIFIERS:
+                words.append(word)
+        if not words:
+            raise ValueError("unknown type %r" % token)
+        return _c_type(words)
+
+    def members(self):
+        """Parse the `{ ... }` body of a struct."""
+        members = []
+        self.take("{")
+        while self.peek() != "}":
+            member_type = self.type()
+            while True:
+                name = self.name()
+                dimensions = []
+                while self.peek() == "[":
+                    self.take()
+                    size = self.take()
+                    if not isinstance(size, int) or size < 1:
+                        raise ValueError("array %r: expected a positive size, "
+                                         "got %r" % (name, size))
+                    dimensions.append(size)
+                    self.take("]")
+                members.append((name, member_type, dimensions))
+                if self.peek() != ",":
+                    break
+                self.take()
+            self.take(";")
+        self.take("}")
+
+        if not members:
+            raise ValueError("empty struct")
+        return members
+
+
+def _round_up(offset, alignment):
+    """Round `offset` up to a multiple of `alignment`."""
+    return -(-offset // alignment) * alignment
+
+
+def _unroll(name, dimensions):
+    """Get the indexed names of all elements of an array, e.g. "a[0][1]"."""
+    names = [name]
+    for dimension in dimensions:
+        names = [
+            "%s[%d]" % (prefix, index) for prefix in names
+            for index in range(dimension)
+        ]
+    return names
+
+
+def _layout(struct_type, packed):
+    """
+    Lay out the leaf fields of a struct.
+
+    Returns
+    -------
+    tuple
+        List of `(name, spec, offset)` triples, size and alignment of the
+        struct (# of bytes)
+    """
+    fields = []
+    offset, struct_alignment = 0, 1
+
+    for name, member_type, dimensions in struct_type.members:
+        if isinstance(member_type, _Struct):
+            # Arrays of structs are unrolled into indexed names
+            inner_fields, size, alignment = _layout(member_type, packed)
+            names = _unroll(name, dimensions)
+        elif member_type == "char" and dimensions:
+            # The innermost dimension of a `char` array is a string
+            size, alignment = dimensions[-1], 1
+            names = _unroll(name, dimensions[:-1])
+        else:
+            size = STRUCTS["native"][member_type].size
+            alignment = 1 if packed else size
+
+        offset = _round_up(offset, alignment)
+        struct_alignment = max(struct_alignment, alignment)
+
+        if isinstance(member_type, _Struct):
+            for element_name in names:
+                fields.extend(
+                    ("%s.%s" % (element_name, inner_name), spec, offset +
+                     inner_offset)
+                    for inner_name, spec, inner_offset in inner_fields)
+                offset += size
+        elif member_type == "char" and dimensions:
+            for element_name in names:
+                fields.append((element_name, (STRING_TYPE, size), offset))
+                offset += size
+        elif dimensions:
+            count = 1
+            for dimension in dimensions:
+                count *= dimension
+            fields.append((name, (member_type, count), offset))
+            offset += count * size
+        else:
+            fields.append((name, member_type, offset))
+            offset += size
+
+    return fields, _round_up(offset, struct_alignment), struct_alignment
+
+
+def parse_struct(declaration, packed=False):
+    """
+    Parse C struct declarations into `Schema` fields with explicit padding.
+
+    Parameters
+    ----------
+    declaration : str
+        C source declaring one or more structs; the last one is the record
+    packed : bool
+        Lay fields out back to back, like `__attribute__((packed))`, instead
+        of aligning them naturally
+
+    Returns
+    -------
+    list
+        `(name, spec)` pairs of the fields, with `(None, size)` pairs for pad
+        bytes
+    """
+    fields, size, _ = _layout(_Parser(declaration).parse(), packed)
+
+    declaration, end = [], 0
+    for name, spec, offset in fields:
+        if offset > end:
+            declaration.append((None, offset - end))
+        declaration.append((name, spec))
+        if isinstance(spec, str):
+            end = offset + STRUCTS["native"][spec].size
+        elif spec[0] == STRING_TYPE:
+            end = offset + spec[1]
+        else:
+            end = offset + spec[1] * STRUCTS["native"][spec[0]].size
+    if size > end:
+        declaration.append((None, size - end))
+
+    return declaration
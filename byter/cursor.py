@@ -0,0 +1,566 @@
+"""Byter in-memory buffer cursors."""
+
+__all__ = ["BufferCursor", "BufferWriter"]
+
+import struct
+
+from .codec import STRUCTS, check_offset, get_array_struct, unpack_array_from
+
+
+class BufferCursor:
+    """
+    Reader of values from an in-memory buffer.
+
+    Values are decoded with `unpack_from` straight from the buffer at a
+    tracked offset, without copying them into intermediate `bytes` objects.
+
+    Examples
+    --------
+        cursor = BufferCursor(message)
+        has_data = cursor.read_bool()
+        year = cursor.read_short()
+        text = cursor.read_string(70)
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray | memoryview | mmap.mmap
+        Any C-contiguous object supporting the buffer protocol
+    offset : int
+        Position to start reading from (# of bytes)
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Attributes
+    ----------
+    buffer : memoryview
+        Byte view of the buffer
+    offset : int
+        Position of the next value to read (# of bytes)
+    """
+
+    def __init__(self, buffer, offset=0, byteorder="native"):
+        self._codecs = STRUCTS[byteorder]
+        self.buffer = memoryview(buffer).cast("B")
+        check_offset(self.buffer, offset)
+        self.offset = offset
+        self.byteorder = byteorder
+
+    def read_char(self):
+        """
+        Read 1 byte of data as `char`.
+
+        Returns
+        -------
+        bytes
+            Python string of length of 1, encoded as bytes
+        """
+        codec = self._codecs["char"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_signed_char(self):
+        """
+        Read 1 byte of data as `signed char`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["signed_char"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_unsigned_char(self):
+        """
+        Read 1 byte of data as `unsigned char`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_char"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_bool(self):
+        """
+        Read 1 byte of data as `bool` type.
+
+        Returns
+        -------
+        bool
+            True or False
+        """
+        codec = self._codecs["bool"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_short(self):
+        """
+        Read 2 bytes of data as `short`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["short"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_unsigned_short(self):
+        """
+        Read 2 bytes of data as `unsigned short`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_short"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_int(self):
+        """
+        Read 4 bytes of data as `int`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["int"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_unsigned_int(self):
+        """
+        Read 4 bytes of data as `unsigned int`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_int"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_long(self):
+        """
+        Read 4 bytes of data as `long`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["long"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_unsigned_long(self):
+        """
+        Read 4 bytes of data as `unsigned long`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_long"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_long_long(self):
+        """
+        Read 8 bytes of data as `long long`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["long_long"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_unsigned_long_long(self):
+        """
+        Read 8 bytes of data as `unsigned long long`.
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_long_long"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_float(self):
+        """
+        Read 4 bytes of data as `float`.
+
+        Returns
+        -------
+        float
+            Python float
+        """
+        codec = self._codecs["float"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_double(self):
+        """
+        Read 8 bytes of data as `double`.
+
+        Returns
+        -------
+        float
+            Python float
+        """
+        codec = self._codecs["double"]
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += codec.size
+        return value
+
+    def read_string(self, s_len):
+        """
+        Read `s_len` bytes as `char[]`.
+
+        Parameters
+        ----------
+        s_len : int
+            Size of the string to read (# of bytes)
+
+        Returns
+        -------
+        str
+            Python string of length `s_len`
+        """
+        end = self.offset + s_len
+        if end > self.buffer.nbytes:
+            raise struct.error("unpack_from requires a buffer of at least %d "
+                               "bytes" % end)
+        value = str(self.buffer[self.offset:end], "utf-8")
+        self.offset = end
+        return value
+
+    def read_array(self, size, c_type, as_numpy=False, as_array=False):
+        """
+        Read `size` consequent elements, each of type `c_type`.
+
+        Parameters
+        ----------
+        size : int
+            Number of elements to read
+        c_type : str
+            C-language type string (e.g. "unsigned_int")
+        as_numpy : bool
+            Return a NumPy array sharing memory with the buffer (requires
+            NumPy)
+        as_array : bool
+            Return an `array.array` in native byte order
+
+        Returns
+        -------
+        list | numpy.ndarray | array.array
+            Python list of size `size`, or a NumPy array or an
+            `array.array` if `as_numpy` or `as_array` is set
+        """
+        values = unpack_array_from(self.buffer, self.offset, size, c_type,
+                                   self.byteorder, as_numpy, as_array)
+        self.offset += size * self._codecs[c_type].size
+        return values
+
+
+class BufferWriter:
+    """
+    Writer of values into an in-memory buffer.
+
+    Values are encoded with `pack_into` straight into the buffer at a
+    tracked offset. A `bytearray` buffer grows as needed, other writable
+    buffers (e.g. a `memoryview` of shared memory) must be large enough.
+
+    Examples
+    --------
+        writer = BufferWriter()
+        writer.write_bool(True)
+        writer.write_short(2019)
+        message = writer.getvalue()
+
+    Parameters
+    ----------
+    buffer : bytearray | memoryview | None
+        Writable buffer, a new empty `bytearray` if None
+    offset : int
+        Position to start writing at (# of bytes)
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Attributes
+    ----------
+    buffer : bytearray | memoryview
+        Buffer the values are written to
+    offset : int
+        Position of the next value to write (# of bytes)
+    """
+
+    def __init__(self, buffer=None, offset=0, byteorder="native"):
+        if buffer is None:
+            buffer = bytearray()
+        elif not isinstance(buffer, bytearray):
+            buffer = memoryview(buffer).cast("B")
+        check_offset(buffer, offset)
+
+        self._codecs = STRUCTS[byteorder]
+        self.buffer = buffer
+        self.offset = offset
+        self.byteorder = byteorder
+
+    def _reserve(self, size):
+        """Make room for `size` bytes at the offset and return the offset."""
+        offset = self.offset
+        end = offset + size
+
+        if end > len(self.buffer):
+            if not isinstance(self.buffer, bytearray):
+                raise struct.error("pack_into requires a buffer of at least "
+                                   "%d bytes" % end)
+            # Grow geometrically, so that appends are amortized O(1)
+            self.buffer.extend(
+                bytes(max(end, 2 * len(self.buffer)) - len(self.buffer)))
+
+        return offset
+
+    def _pack(self, codec, *values):
+        """Pack `values` at the offset, then move the offset past them."""
+        offset = self._reserve(codec.size)
+        # The offset is only moved once packing succeeded
+        codec.pack_into(self.buffer, offset, *values)
+        self.offset = offset + codec.size
+
+    def getvalue(self):
+        """
+        Get the bytes written so far.
+
+        Returns
+        -------
+        bytes
+            Contents of the buffer up to the current offset
+        """
+        return bytes(self.buffer[:self.offset])
+
+    def write_char(self, value):
+        """
+        Write 1 byte of data as `char`.
+
+        Parameters
+        ----------
+        value : bytes
+            Python string of length of 1, encoded as bytes
+        """
+        codec = self._codecs["char"]
+        self._pack(codec, value)
+
+    def write_signed_char(self, value):
+        """
+        Write 1 byte of data as `signed char`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["signed_char"]
+        self._pack(codec, value)
+
+    def write_unsigned_char(self, value):
+        """
+        Write 1 byte of data as `unsigned char`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["unsigned_char"]
+        self._pack(codec, value)
+
+    def write_bool(self, value):
+        """
+        Write 1 byte of data as `bool` type.
+
+        Parameters
+        ----------
+        value : bool
+            True or False
+        """
+        codec = self._codecs["bool"]
+        self._pack(codec, value)
+
+    def write_short(self, value):
+        """
+        Write 2 bytes of data as `short`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["short"]
+        self._pack(codec, value)
+
+    def write_unsigned_short(self, value):
+        """
+        Write 2 bytes of data as `unsigned short`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["unsigned_short"]
+        self._pack(codec, value)
+
+    def write_int(self, value):
+        """
+        Write 4 bytes of data as `int`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["int"]
+        self._pack(codec, value)
+
+    def write_unsigned_int(self, value):
+        """
+        Write 4 bytes of data as `unsigned int`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["unsigned_int"]
+        self._pack(codec, value)
+
+    def write_long(self, value):
+        """
+        Write 4 bytes of data as `long`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["long"]
+        self._pack(codec, value)
+
+    def write_unsigned_long(self, value):
+        """
+        Write 4 bytes of data as `unsigned long`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["unsigned_long"]
+        self._pack(codec, value)
+
+    def write_long_long(self, value):
+        """
+        Write 8 bytes of data as `long long`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["long_long"]
+        self._pack(codec, value)
+
+    def write_unsigned_long_long(self, value):
+        """
+        Write 8 bytes of data as `unsigned long long`.
+
+        Parameters
+        ----------
+        value : int
+            Python integer
+        """
+        codec = self._codecs["unsigned_long_long"]
+        self._pack(codec, value)
+
+    def write_float(self, value):
+        """
+        Write 4 bytes of data as `float`.
+
+        Parameters
+        ----------
+        value : float
+            Python float
+        """
+        codec = self._codecs["float"]
+        self._pack(codec, value)
+
+    def write_double(self, value):
+        """
+        Write 8 bytes of data as `double`.
+
+        Parameters
+        ----------
+        value : float
+            Python float
+        """
+        codec = self._codecs["double"]
+        self._pack(codec, value)
+
+    def write_string(self, value):
+        """
+        Write Python string as `char[]`.
+
+        Parameters
+        ----------
+        value : str
+            Python string
+        """
+        # Like `byter.write_string`, the encoded string is cut to len(value)
+        bytes_data = value.encode("utf-8")[:len(value)]
+        offset = self._reserve(len(bytes_data))
+        self.buffer[offset:offset + len(bytes_data)] = bytes_data
+        self.offset = offset + len(bytes_data)
+
+    def write_array(self, values, c_type):
+        """
+        Write a list of elements, each of type `c_type`.
+
+        Parameters
+        ----------
+        values : list | tuple
+            Python iterable object
+        c_type : str
+            C-language type string (e.g. "unsigned_int")
+        """
+        codec = get_array_struct(len(values), c_type, self.byteorder)
+        self._pack(codec, *values)
@@ -0,0 +1,313 @@
+"""Byter record offset index."""
+
+__all__ = ["build_index", "IndexedReader"]
+
+import array
+import mmap
+import os
+import struct
+
+from .codec import STRUCTS
+from .schema import Schema
+
+INDEX_SUFFIX = ".idx"
+
+# First bytes of an index file, followed by the size of the build key and
+# the key itself, padded to a multiple of 8 bytes
+INDEX_MAGIC = b"BYTERIDX"
+
+
+def _scan(data, size, read_record, length_type, byteorder):
+    """Collect the offset of every record from the current position."""
+    offsets = array.array("Q")
+    position = data.tell()
+
+    if length_type is not None:
+        codec = STRUCTS[byteorder][length_type]
+        while position < size:
+            offsets.append(position)
+            length = codec.unpack(data.read(codec.size))[0]
+            position = data.seek(length, 1)
+    else:
+        while position < size:
+            offsets.append(position)
+            read_record(data)
+            position = data.tell()
+
+    if position > size:
+        raise struct.error("the last record at offset %d ends past the end "
+                           "of the file" % offsets[-1])
+
+    # The end of the last record closes the last range
+    offsets.append(position)
+    return offsets
+
+
+def _index_key(read_record, length_type, byteorder, offset):
+    """Describe the parameters an index is built with, as bytes."""
+    if length_type is not None:
+        key = "length_type=%s byteorder=%s" % (length_type, byteorder)
+    else:
+        key = "read_record=%s.%s" % (getattr(read_record, "__module__", None),
+                                     getattr(read_record, "__qualname__",
+                                             type(read_record).__qualname__))
+        # Methods of schemas (e.g. `Schema.read`) read the layout of theirs
+        schema = getattr(read_record, "__self__", None)
+        if isinstance(schema, Schema):
+            key += " layout=%r byteorder=%s" % (schema._declaration,
+                                                schema.byteorder)
+    return ("%s offset=%d" % (key, offset)).encode("utf-8")
+
+
+def _header(key):
+    """Build the header of an index file of build key `key`."""
+    return (INDEX_MAGIC + struct.pack("=Q", len(key)) + key +
+            bytes(-len(key) % 8))
+
+
+def _read_header(index_file):
+    """Read the build key of an index file, None if it has no header."""
+    magic = index_file.read(len(INDEX_MAGIC))
+    if magic != INDEX_MAGIC:
+        return None
+    length = index_file.read(8)
+    if len(length) < 8:
+        return None
+    return index_file.read(struct.unpack("=Q", length)[0])
+
+
+def build_index(path,
+                read_record=None,
+                length_type=None,
+                byteorder="native",
+                offset=0,
+                index_path=None):
+    """
+    Scan a file of variable-length records once and save record offsets.
+
+    Records are delimited either by `read_record`, a function reading one
+    whole record from a file, or by a `length_type` length prefix giving
+    the size of the record payload that follows it.
+
+    The index is saved next to the file as `array("Q")` of native unsigned
+    64-bit offsets: one per record, followed by the end of the last record.
+    A header records the parameters the index was built with, so that
+    `IndexedReader` does not reuse it with others.
+
+    Examples
+    --------
+        def read_record(data):
+            return read_short(data), read_string(data, read_int(data))
+
+        offsets = build_index("/path/to/binary/file", read_record)
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path to the file
+    read_record : callable | None
+        Function reading one record from a file open to read in binary mode,
+        e.g. `Schema.read`
+    length_type : str | None
+        C-language type string of the length prefix (e.g. "unsigned_int"),
+        used instead of `read_record`
+    byteorder : str
+        Byte order name of the length prefix: "native", "little", "big" or
+        "network"
+    offset : int
+        Position of the first record in the file (# of bytes), e.g. the
+        size of a file header
+    index_path : str | os.PathLike | None
+        Path to the index file, `path` + ".idx" if None
+
+    Returns
+    -------
+    array.array
+        Offsets of the records followed by the end of the last record
+    """
+    if (read_record is None) == (length_type is None):
+        raise ValueError("expected exactly one of `read_record` and "
+                         "`length_type`")
+
+    if index_path is None:
+        index_path = os.fspath(path) + INDEX_SUFFIX
+
+    with open(path, "rb") as data:
+        size = os.fstat(data.fileno()).st_size
+        data.seek(offset)
+        offsets = _scan(data, size, read_record, length_type, byteorder)
+
+    # Written aside and renamed, so readers never see a partial index
+    temp_path = os.fspath(index_path) + ".tmp"
+    with open(temp_path, "wb") as index_file:
+        index_file.write(
+            _header(_index_key(read_record, length_type, byteorder, offset)))
+        offsets.tofile(index_file)
+    os.replace(temp_path, index_path)
+
+    return offsets
+
+
+class IndexedReader:
+    """
+    Random-access reader of a file of variable-length records.
+
+    Record offsets are memory-mapped from the index file saved by
+    `build_index`, so finding record #N takes a single lookup instead of
+    decoding every record before it. The index is (re)built if it is
+    missing, older than the file, or was built with other parameters.
+    `read_record` functions are told apart by their qualified name, and
+    methods of a `Schema` (e.g. `Schema.read`) by the layout of the schema
+    too: pass `rebuild=True` after changing what another function reads.
+
+    Examples
+    --------
+        with IndexedReader("/path/to/binary/file", read_record) as reader:
+            record = reader[1000]
+            reader.seek_record(-1)
+            year = read_short(reader.data)
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path to the file
+    read_record : callable | None
+        Function reading one record from a file open to read in binary mode,
+        e.g. `Schema.read`
+    length_type : str | None
+        C-language type string of the length prefix (e.g. "unsigned_int"),
+        used instead of `read_record`
+    byteorder : str
+        Byte order name of the length prefix: "native", "little", "big" or
+        "network"
+    offset : int
+        Position of the first record in the file (# of bytes)
+    index_path : str | os.PathLike | None
+        Path to the index file, `path` + ".idx" if None
+    rebuild : bool
+        Rebuild the index even if it is up to date
+
+    Attributes
+    ----------
+    data : io.BufferedReader
+        The file, open to read in binary mode
+    offsets : memoryview
+        Offsets of the records followed by the end of the last record
+    """
+
+    def __init__(self,
+                 path,
+                 read_record=None,
+                 length_type=None,
+                 byteorder="native",
+                 offset=0,
+                 index_path=None,
+                 rebuild=False):
+        if index_path is None:
+            index_path = os.fspath(path) + INDEX_SUFFIX
+
+        self.read_record = read_record
+        self.length_type = length_type
+        self.byteorder = byteorder
+
+        key = _index_key(read_record, length_type, byteorder, offset)
+
+        self.data = open(path, "rb")
+        try:
+            size = os.fstat(self.data.fileno()).st_size
+            if rebuild or not self._is_fresh(path, index_path, size, key):
+                build_index(path, read_record, length_type, byteorder, offset,
+                            index_path)
+
+            with open(index_path, "rb") as index_file:
+                self._map = mmap.mmap(index_file.fileno(),
+                                      0,
+                                      access=mmap.ACCESS_READ)
+            with memoryview(self._map) as view:
+                self.offsets = view[len(_header(key)):].cast("Q")
+        except BaseException:
+            self.data.close()
+            raise
+
+    @staticmethod
+    def _is_fresh(path, index_path, size, key):
+        """Check whether the index of build key `key` covers the file."""
+        try:
+            index_stat = os.stat(index_path)
+        except FileNotFoundError:
+            return False
+
+        header_size = len(_header(key))
+        if (index_stat.st_mtime < os.stat(path).st_mtime or
+                index_stat.st_size <= header_size or
+                index_stat.st_size % array.array("Q").itemsize):
+            return False
+
+        with open(index_path, "rb") as index_file:
+            if _read_header(index_file) != key:
+                return False
+            index_file.seek(-array.array("Q").itemsize, os.SEEK_END)
+            end = array.array("Q", index_file.read())[0]
+        return end == size
+
+    def __enter__(self):
+        """Return the reader itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the reader."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, n):
+        """
+        Read record #`n`.
+
+        Parameters
+        ----------
+        n : int
+            Number of the record, negative values count from the end
+
+        Returns
+        -------
+        object
+            The value returned by `read_record`, or the payload bytes after
+            the length prefix if `length_type` is set
+        """
+        self.seek_record(n)
+        if self.length_type is None:
+            return self.read_record(self.data)
+
+        codec = STRUCTS[self.byteorder][self.length_type]
+        length = codec.unpack(self.data.read(codec.size))[0]
+        return self.data.read(length)
+
+    def close(self):
+        """Close the file and unmap the index."""
+        self.offsets.release()
+        self._map.close()
+        self.data.close()
+
+    def seek_record(self, n):
+        """
+        Move the position of `data` to the beginning of record #`n`.
+
+        Parameters
+        ----------
+        n : int
+            Number of the record, negative values count from the end
+
+        Returns
+        -------
+        int
+            Position of the record in the file (# of bytes)
+        """
+        count = len(self)
+        if n < 0:
+            n += count
+        if not 0 <= n < count:
+            raise IndexError("record index out of range")
+        return self.data.seek(self.offsets[n])
@@ -0,0 +1,367 @@
+"""Byter memory-mapped file reader."""
+
+__all__ = ["MmapReader"]
+
+import mmap
+import struct
+
+from .codec import STRUCTS, check_offset, unpack_array_from
+
+
+class MmapReader:
+    """
+    Random-access reader of a memory-mapped file.
+
+    The file is mapped into memory with `mmap`, so values are decoded
+    straight from the OS page cache without seeking or copying, and arrays
+    can be returned as views sharing memory with the file.
+
+    Examples
+    --------
+        with MmapReader("/path/to/binary/file") as reader:
+            year = reader.read_short_at(1)
+            array = reader.read_array_at(83, 3, "unsigned_short")
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path to a non-empty file
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Attributes
+    ----------
+    buffer : mmap.mmap
+        Read-only memory map of the whole file
+    """
+
+    def __init__(self, path, byteorder="native"):
+        self._codecs = STRUCTS[byteorder]
+        self.byteorder = byteorder
+
+        with open(path, "rb") as data:
+            self.buffer = mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        """Return the reader itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the reader."""
+        self.close()
+
+    def __len__(self):
+        """Return the size of the file (# of bytes)."""
+        return len(self.buffer)
+
+    def close(self):
+        """
+        Unmap the file.
+
+        Raises
+        ------
+        BufferError
+            If views returned with `as_view` or `as_numpy` are still alive
+        """
+        self.buffer.close()
+
+    def read_char_at(self, offset):
+        """
+        Read 1 byte of data as `char` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        bytes
+            Python string of length of 1, encoded as bytes
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["char"].unpack_from(self.buffer, offset)[0]
+
+    def read_signed_char_at(self, offset):
+        """
+        Read 1 byte of data as `signed char` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["signed_char"].unpack_from(self.buffer, offset)[0]
+
+    def read_unsigned_char_at(self, offset):
+        """
+        Read 1 byte of data as `unsigned char` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["unsigned_char"].unpack_from(self.buffer,
+                                                         offset)[0]
+
+    def read_bool_at(self, offset):
+        """
+        Read 1 byte of data as `bool` type at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        bool
+            True or False
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["bool"].unpack_from(self.buffer, offset)[0]
+
+    def read_short_at(self, offset):
+        """
+        Read 2 bytes of data as `short` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["short"].unpack_from(self.buffer, offset)[0]
+
+    def read_unsigned_short_at(self, offset):
+        """
+        Read 2 bytes of data as `unsigned short` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["unsigned_short"].unpack_from(self.buffer,
+                                                          offset)[0]
+
+    def read_int_at(self, offset):
+        """
+        Read 4 bytes of data as `int` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["int"].unpack_from(self.buffer, offset)[0]
+
+    def read_unsigned_int_at(self, offset):
+        """
+        Read 4 bytes of data as `unsigned int` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["unsigned_int"].unpack_from(self.buffer, offset)[0]
+
+    def read_long_at(self, offset):
+        """
+        Read 4 bytes of data as `long` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["long"].unpack_from(self.buffer, offset)[0]
+
+    def read_unsigned_long_at(self, offset):
+        """
+        Read 4 bytes of data as `unsigned long` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["unsigned_long"].unpack_from(self.buffer,
+                                                         offset)[0]
+
+    def read_long_long_at(self, offset):
+        """
+        Read 8 bytes of data as `long long` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["long_long"].unpack_from(self.buffer, offset)[0]
+
+    def read_unsigned_long_long_at(self, offset):
+        """
+        Read 8 bytes of data as `unsigned long long` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["unsigned_long_long"].unpack_from(
+            self.buffer, offset)[0]
+
+    def read_float_at(self, offset):
+        """
+        Read 4 bytes of data as `float` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        float
+            Python float
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["float"].unpack_from(self.buffer, offset)[0]
+
+    def read_double_at(self, offset):
+        """
+        Read 8 bytes of data as `double` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        float
+            Python float
+        """
+        check_offset(self.buffer, offset)
+        return self._codecs["double"].unpack_from(self.buffer, offset)[0]
+
+    def read_string_at(self, offset, s_len):
+        """
+        Read `s_len` bytes as `char[]` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the string in the file (# of bytes)
+        s_len : int
+            Size of the string to read (# of bytes)
+
+        Returns
+        -------
+        str
+            Python string of length `s_len`
+        """
+        check_offset(self.buffer, offset)
+        if offset + s_len > len(self.buffer):
+            raise struct.error("unpack_from requires a buffer of at least %d "
+                               "bytes" % (offset + s_len))
+        return self.buffer[offset:offset + s_len].decode("utf-8")
+
+    def read_array_at(self,
+                      offset,
+                      size,
+                      c_type,
+                      as_numpy=False,
+                      as_array=False,
+                      as_view=False):
+        """
+        Read `size` consequent elements, each of type `c_type`, at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the first element in the file (# of bytes)
+        size : int
+            Number of elements to read
+        c_type : str
+            C-language type string (e.g. "unsigned_int")
+        as_numpy : bool
+            Return a read-only NumPy array sharing memory with the file
+            (requires NumPy)
+        as_array : bool
+            Return an `array.array` in native byte order
+        as_view : bool
+            Return a read-only `memoryview` sharing memory with the file
+            (requires the byte order of the file to match the byte order of
+            this machine)
+
+        Returns
+        -------
+        list | numpy.ndarray | array.array | memoryview
+            Python list of size `size`, or a NumPy array, an `array.array` or
+            a `memoryview` if `as_numpy`, `as_array` or `as_view` is set
+        """
+        return unpack_array_from(self.buffer, offset, size, c_type,
+                                 self.byteorder, as_numpy, as_array, as_view)
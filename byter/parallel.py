@@ -0,0 +1,179 @@
+"""Byter multi-process record decoding."""
+
+__all__ = ["parallel_read_records"]
+
+import array
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+from .codec import ARRAY_TYPECODES
+from .records import decode_columns, decode_rows
+from .utils import readinto_exactly
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8, columns are pickled as array.array
+    shared_memory = None
+
+
+def _numeric_fields(schema):
+    """Get the fields decoded into `array.array` columns."""
+    return [
+        field for field in schema.fields
+        if field.length is None and field.c_type in ARRAY_TYPECODES
+    ]
+
+
+def _read_range(path, schema, offset, start, count, columns, chunk_records,
+                shared_names):
+    """
+    Decode records [start, start + count) of a file in a worker process.
+
+    Numeric columns are copied into the shared memory blocks named in
+    `shared_names` (or returned as `array.array` if it is None), everything
+    else is returned to be pickled.
+    """
+    result = []
+    if columns:
+        result = {field.name: [] for field in schema.fields}
+        for field in _numeric_fields(schema):
+            result[field.name] = array.array(ARRAY_TYPECODES[field.c_type])
+
+    blocks = {}
+    if columns and shared_names is not None:
+        blocks = {
+            name: shared_memory.SharedMemory(name=block_name)
+            for name, block_name in shared_names.items()
+        }
+
+    try:
+        buffer = bytearray(min(count, chunk_records) * schema.size)
+        with open(path, "rb") as data:
+            data.seek(offset + start * schema.size)
+
+            for chunk_start in range(0, count, chunk_records):
+                chunk_count = min(chunk_records, count - chunk_start)
+                view = readinto_exactly(
+                    data,
+                    memoryview(buffer)[:chunk_count * schema.size])
+
+                if not columns:
+                    result.extend(decode_rows(view, schema, chunk_count))
+                    continue
+
+                chunk = decode_columns(view, schema, chunk_count)
+                for name, column in chunk.items():
+                    if name in blocks:
+                        position = (start + chunk_start) * column.itemsize
+                        blocks[name].buf[position:position +
+                                         len(column) * column.itemsize] = \
+                            memoryview(column).cast("B")
+                    else:
+                        result[name].extend(column)
+    finally:
+        for block in blocks.values():
+            block.close()
+
+    for name in blocks:
+        del result[name]
+    return result
+
+
+def parallel_read_records(path,
+                          schema,
+                          workers=None,
+                          columns=False,
+                          offset=0,
+                          count=None,
+                          chunk_records=65536):
+    """
+    Read back-to-back fixed-size records of a file using many processes.
+
+    The records are split into contiguous record-aligned byte ranges, one
+    per worker, and each range is read and decoded in a separate process.
+    With `columns` set, numeric columns are gathered into shared memory
+    instead of being pickled back to the calling process.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path to the file
+    schema : Schema
+        Layout of a record
+    workers : int | None
+        Number of worker processes, the number of CPUs if None
+    columns : bool
+        Return per-field columns instead of a list of records
+    offset : int
+        Position of the first record in the file (# of bytes), e.g. the
+        size of a file header
+    count : int | None
+        Number of records to read, all records until the end of the file if
+        None
+    chunk_records : int
+        Number of records a worker reads and decodes at once
+
+    Returns
+    -------
+    list of tuple | dict
+        List of field value tuples in file order, or field name -> column
+        mapping if `columns` is set (see `read_records`)
+    """
+    if count is None:
+        count, remainder = divmod(os.path.getsize(path) - offset, schema.size)
+        if remainder:
+            raise struct.error("%d trailing bytes do not form a whole "
+                               "record of %d bytes" % (remainder, schema.size))
+
+    workers = max(min(workers or os.cpu_count() or 1, count), 1)
+    step, extra = divmod(count, workers)
+    ranges, start = [], 0
+    for worker in range(workers):
+        size = step + (worker < extra)
+        ranges.append((start, size))
+        start += size
+
+    numeric = _numeric_fields(schema) if columns else []
+    blocks = {}
+
+    try:
+        if shared_memory is not None:
+            for field in numeric:
+                blocks[field.name] = shared_memory.SharedMemory(
+                    create=True, size=max(count * field.size, 1))
+        shared_names = None
+        if shared_memory is not None:
+            shared_names = {name: block.name for name, block in blocks.items()}
+
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [
+                pool.submit(_read_range, path, schema, offset, start, size,
+                            columns, chunk_records, shared_names)
+                for start, size in ranges
+            ]
+            results = [future.result() for future in futures]
+
+        if not columns:
+            return [record for result in results for record in result]
+
+        merged = {}
+        for field in schema.fields:
+            if field.name in blocks:
+                column = array.array(ARRAY_TYPECODES[field.c_type])
+                column.frombytes(blocks[field.name].buf[:count * field.size])
+            elif field in numeric:
+                column = array.array(ARRAY_TYPECODES[field.c_type])
+                for result in results:
+                    column.extend(result[field.name])
+            else:
+                column = [
+                    value for result in results for value in result[field.name]
+                ]
+            merged[field.name] = column
+
+        return merged
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
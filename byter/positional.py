@@ -0,0 +1,361 @@
+"""Byter positional (pread-based) file reader."""
+
+__all__ = ["PositionalReader"]
+
+import os
+import struct
+
+from .codec import STRUCTS, get_array_struct, unpack_array_from
+
+
+class PositionalReader:
+    """
+    Random-access reader of a file using positional reads.
+
+    Every value is read with `os.pread` at an explicit offset, which
+    neither uses nor moves the shared file position and releases the GIL,
+    so many threads can read one file descriptor concurrently without
+    locking. Available on Unix platforms only.
+
+    Examples
+    --------
+        with PositionalReader("/path/to/binary/file") as reader:
+            with ThreadPoolExecutor() as pool:
+                years = pool.map(reader.read_short_at, offsets)
+
+    Parameters
+    ----------
+    fd_or_path : int | str | os.PathLike
+        File descriptor open for reading, or path to a file. A descriptor
+        is not closed by the reader, a file opened from a path is
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Attributes
+    ----------
+    fd : int
+        File descriptor the values are read from
+    """
+
+    def __init__(self, fd_or_path, byteorder="native"):
+        if not hasattr(os, "pread"):
+            raise NotImplementedError("os.pread is not available on this "
+                                      "platform")
+
+        self._codecs = STRUCTS[byteorder]
+        self.byteorder = byteorder
+
+        if isinstance(fd_or_path, int):
+            self.fd, self._owned = fd_or_path, False
+        else:
+            self.fd, self._owned = os.open(fd_or_path, os.O_RDONLY), True
+
+    def __enter__(self):
+        """Return the reader itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the reader."""
+        self.close()
+
+    def __len__(self):
+        """Return the size of the file (# of bytes)."""
+        return os.fstat(self.fd).st_size
+
+    def close(self):
+        """Close the file if it was opened by the reader."""
+        if self._owned and self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def read_char_at(self, offset):
+        """
+        Read 1 byte of data as `char` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        bytes
+            Python string of length of 1, encoded as bytes
+        """
+        codec = self._codecs["char"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_signed_char_at(self, offset):
+        """
+        Read 1 byte of data as `signed char` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["signed_char"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_unsigned_char_at(self, offset):
+        """
+        Read 1 byte of data as `unsigned char` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_char"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_bool_at(self, offset):
+        """
+        Read 1 byte of data as `bool` type at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        bool
+            True or False
+        """
+        codec = self._codecs["bool"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_short_at(self, offset):
+        """
+        Read 2 bytes of data as `short` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["short"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_unsigned_short_at(self, offset):
+        """
+        Read 2 bytes of data as `unsigned short` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_short"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_int_at(self, offset):
+        """
+        Read 4 bytes of data as `int` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["int"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_unsigned_int_at(self, offset):
+        """
+        Read 4 bytes of data as `unsigned int` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_int"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_long_at(self, offset):
+        """
+        Read 4 bytes of data as `long` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["long"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_unsigned_long_at(self, offset):
+        """
+        Read 4 bytes of data as `unsigned long` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_long"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_long_long_at(self, offset):
+        """
+        Read 8 bytes of data as `long long` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["long_long"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_unsigned_long_long_at(self, offset):
+        """
+        Read 8 bytes of data as `unsigned long long` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        int
+            Python integer
+        """
+        codec = self._codecs["unsigned_long_long"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_float_at(self, offset):
+        """
+        Read 4 bytes of data as `float` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        float
+            Python float
+        """
+        codec = self._codecs["float"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_double_at(self, offset):
+        """
+        Read 8 bytes of data as `double` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the value in the file (# of bytes)
+
+        Returns
+        -------
+        float
+            Python float
+        """
+        codec = self._codecs["double"]
+        return codec.unpack(os.pread(self.fd, codec.size, offset))[0]
+
+    def read_string_at(self, offset, s_len):
+        """
+        Read `s_len` bytes as `char[]` at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the string in the file (# of bytes)
+        s_len : int
+            Size of the string to read (# of bytes)
+
+        Returns
+        -------
+        str
+            Python string of length `s_len`
+        """
+        bytes_data = os.pread(self.fd, s_len, offset)
+        if len(bytes_data) != s_len:
+            raise struct.error("unpack requires a buffer of %d bytes" % s_len)
+        return bytes_data.decode("utf-8")
+
+    def read_array_at(self,
+                      offset,
+                      size,
+                      c_type,
+                      as_numpy=False,
+                      as_array=False):
+        """
+        Read `size` consequent elements, each of type `c_type`, at `offset`.
+
+        Parameters
+        ----------
+        offset : int
+            Position of the first element in the file (# of bytes)
+        size : int
+            Number of elements to read
+        c_type : str
+            C-language type string (e.g. "unsigned_int")
+        as_numpy : bool
+            Return a read-only NumPy array (requires NumPy)
+        as_array : bool
+            Return an `array.array` in native byte order
+
+        Returns
+        -------
+        list | numpy.ndarray | array.array
+            Python list of size `size`, or a NumPy array or an `array.array`
+            if `as_numpy` or `as_array` is set
+        """
+        codec = get_array_struct(size, c_type, self.byteorder)
+        bytes_data = os.pread(self.fd, codec.size, offset)
+        return unpack_array_from(bytes_data, 0, size, c_type, self.byteorder,
+                                 as_numpy, as_array)
@@ -17,16 +17,21 @@ __all__ = [
     "read_float",
     "read_double",
     "read_string",
-    "read_array"
+    "read_array",
+    "read_array_into"
 ]
 # yapf: enable
 
+import array
 import struct
+import sys
 
-from .utils import get_type
+from .codec import (STRUCTS, get_array_struct, get_buffer_byteorder, get_dtype,
+                    get_typecode, numpy, resolve_byteorder)
+from .utils import byteswap, readinto_exactly
 
 
-def read_char(data):
+def read_char(data, byteorder="native"):
     """
     Read 1 byte of data as `char`.
 
@@ -34,17 +39,19 @@ def read_char(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     bytes
         Python string of length of 1, encoded as bytes
     """
-    s_type = "=%s" % get_type("char")
-    return struct.unpack(s_type, data.read(1))[0]
+    codec = STRUCTS[byteorder]["char"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_signed_char(data):
+def read_signed_char(data, byteorder="native"):
     """
     Read 1 byte of data as `signed char`.
 
@@ -52,17 +59,19 @@ def read_signed_char(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("signed_char")
-    return struct.unpack(s_type, data.read(1))[0]
+    codec = STRUCTS[byteorder]["signed_char"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_unsigned_char(data):
+def read_unsigned_char(data, byteorder="native"):
     """
     Read 1 byte of data as `unsigned char`.
 
@@ -70,17 +79,19 @@ def read_unsigned_char(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("unsigned_char")
-    return struct.unpack(s_type, data.read(1))[0]
+    codec = STRUCTS[byteorder]["unsigned_char"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_bool(data):
+def read_bool(data, byteorder="native"):
     """
     Read 1 byte of data as `bool` type.
 
@@ -88,17 +99,19 @@ def read_bool(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     bool
         True or False
     """
-    s_type = "=%s" % get_type("bool")
-    return struct.unpack(s_type, data.read(1))[0]
+    codec = STRUCTS[byteorder]["bool"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_short(data):
+def read_short(data, byteorder="native"):
     """
     Read 2 bytes of data as `short`.
 
@@ -106,17 +119,19 @@ def read_short(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("short")
-    return struct.unpack(s_type, data.read(2))[0]
+    codec = STRUCTS[byteorder]["short"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_unsigned_short(data):
+def read_unsigned_short(data, byteorder="native"):
     """
     Read 2 bytes of data as `unsigned short`.
 
@@ -124,17 +139,19 @@ def read_unsigned_short(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("unsigned_short")
-    return struct.unpack(s_type, data.read(2))[0]
+    codec = STRUCTS[byteorder]["unsigned_short"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_int(data):
+def read_int(data, byteorder="native"):
     """
     Read 4 bytes of data as `int`.
 
@@ -142,17 +159,19 @@ def read_int(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("int")
-    return struct.unpack(s_type, data.read(4))[0]
+    codec = STRUCTS[byteorder]["int"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_unsigned_int(data):
+def read_unsigned_int(data, byteorder="native"):
     """
     Read 4 bytes of data as `unsigned int`.
 
@@ -160,17 +179,19 @@ def read_unsigned_int(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("unsigned_int")
-    return struct.unpack(s_type, data.read(4))[0]
+    codec = STRUCTS[byteorder]["unsigned_int"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_long(data):
+def read_long(data, byteorder="native"):
     """
     Read 4 bytes of data as `long`.
 
@@ -180,17 +201,19 @@ def read_long(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("long")
-    return struct.unpack(s_type, data.read(4))[0]
+    codec = STRUCTS[byteorder]["long"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_unsigned_long(data):
+def read_unsigned_long(data, byteorder="native"):
     """
     Read 4 bytes of data as `unsigned long`.
 
@@ -200,17 +223,19 @@ def read_unsigned_long(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("unsigned_long")
-    return struct.unpack(s_type, data.read(4))[0]
+    codec = STRUCTS[byteorder]["unsigned_long"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_long_long(data):
+def read_long_long(data, byteorder="native"):
     """
     Read 8 bytes of data as `long long`.
 
@@ -218,17 +243,19 @@ def read_long_long(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("long_long")
-    return struct.unpack(s_type, data.read(8))[0]
+    codec = STRUCTS[byteorder]["long_long"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_unsigned_long_long(data):
+def read_unsigned_long_long(data, byteorder="native"):
     """
     Read 8 bytes of data as `unsigned long long`.
 
@@ -236,17 +263,19 @@ def read_unsigned_long_long(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     int
         Python integer
     """
-    s_type = "=%s" % get_type("unsigned_long_long")
-    return struct.unpack(s_type, data.read(8))[0]
+    codec = STRUCTS[byteorder]["unsigned_long_long"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_float(data):
+def read_float(data, byteorder="native"):
     """
     Read 4 bytes of data as `float`.
 
@@ -254,17 +283,19 @@ def read_float(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     float
         Python float
     """
-    s_type = "=%s" % get_type("float")
-    return struct.unpack(s_type, data.read(4))[0]
+    codec = STRUCTS[byteorder]["float"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
-def read_double(data):
+def read_double(data, byteorder="native"):
     """
     Read 8 bytes of data as `double`.
 
@@ -272,14 +303,16 @@ def read_double(data):
     ----------
     data : io.BufferedReader
         File open to read in binary mode
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
 
     Returns
     -------
     float
         Python float
     """
-    s_type = "=%s" % get_type("double")
-    return struct.unpack(s_type, data.read(8))[0]
+    codec = STRUCTS[byteorder]["double"]
+    return codec.unpack(data.read(codec.size))[0]
 
 
 def read_string(data, s_len):
@@ -298,10 +331,18 @@ def read_string(data, s_len):
     str
         Python string of length `s_len`
     """
-    return struct.unpack("=%ds" % s_len, data.read(s_len))[0].decode("utf-8")
+    bytes_data = data.read(s_len)
+    if len(bytes_data) != s_len:
+        raise struct.error("unpack requires a buffer of %d bytes" % s_len)
+    return bytes_data.decode("utf-8")
 
 
-def read_array(data, size, c_type):
+def read_array(data,
+               size,
+               c_type,
+               byteorder="native",
+               as_numpy=False,
+               as_array=False):
     """
     Read `size` consequent elements, each of type `c_type`.
 
@@ -313,14 +354,82 @@ def read_array(data, size, c_type):
         Number of elements to read
     c_type : str
         C-language type string (e.g. "unsigned_int")
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    as_numpy : bool
+        Read the elements straight into a NumPy array (requires NumPy)
+    as_array : bool
+        Read the elements into an `array.array` in native byte order
+        (not supported for `char` and `bool`)
 
     Returns
     -------
-    list
-        Python list of size `size`
+    list | numpy.ndarray | array.array
+        Python list of size `size`, a NumPy array of dtype matching
+        `c_type` and `byteorder` if `as_numpy` is set or an `array.array`
+        if `as_array` is set
     """
-    s_type = get_type(c_type)
-    format_string = "=%d%s" % (size, s_type)  # e.g. 10i --> read 10 int's
-    num_bytes_to_read = struct.calcsize(format_string)
+    if as_numpy and as_array:
+        raise ValueError("`as_numpy` and `as_array` are mutually exclusive")
 
-    return list(struct.unpack(format_string, data.read(num_bytes_to_read)))
+    if as_array:
+        values = array.array(get_typecode(c_type), [0]) * size
+        read_array_into(data, values, c_type, byteorder)
+        return values
+
+    if as_numpy:
+        values = numpy.empty(size, dtype=get_dtype(c_type, byteorder))
+        readinto_exactly(data, values)
+        return values
+
+    codec = get_array_struct(size, c_type, byteorder)  # e.g. "=10i"
+    return list(codec.unpack(data.read(codec.size)))
+
+
+def read_array_into(data, buffer, c_type, byteorder="native"):
+    """
+    Read consequent elements of type `c_type` into a preallocated buffer.
+
+    The whole buffer is filled with `data.readinto`, so no intermediate
+    objects are created. Elements are stored in the byte order of typed
+    buffers (e.g. a ">i4" NumPy array), in native byte order in buffers of
+    bytes.
+
+    Parameters
+    ----------
+    data : io.BufferedReader
+        File open to read in binary mode
+    buffer : bytearray | memoryview | array.array | numpy.ndarray
+        Writable C-contiguous buffer, its size in bytes must be a multiple
+        of the size of `c_type`. Items of more than 1 byte must be of the
+        same kind and size as `c_type` (e.g. not floats for "int")
+    c_type : str
+        C-language type string (e.g. "unsigned_int")
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Returns
+    -------
+    int
+        Number of elements read
+    """
+    codec = STRUCTS[byteorder][c_type]
+    view = memoryview(buffer)
+
+    buffer_byteorder = sys.byteorder
+    if view.itemsize > 1:
+        buffer_byteorder = get_buffer_byteorder(view, c_type)
+        if buffer_byteorder is None:
+            raise ValueError("buffer items of format %r and %d bytes do not "
+                             "match %r of %d bytes" %
+                             (view.format, view.itemsize, c_type, codec.size))
+    size, remainder = divmod(view.nbytes, codec.size)
+    if remainder:
+        raise ValueError("buffer of %d bytes does not hold a whole number "
+                         "of %r" % (view.nbytes, c_type))
+
+    readinto_exactly(data, view)
+    if codec.size > 1 and resolve_byteorder(byteorder) != buffer_byteorder:
+        byteswap(buffer, codec.size)
+
+    return size
@@ -0,0 +1,578 @@
+"""Byter bulk record functions."""
+
+__all__ = [
+    "read_records", "iter_records", "read_columns", "filter_records",
+    "RecordWriter"
+]
+
+import array
+import mmap
+import operator
+import os
+import struct
+
+from .codec import (ARRAY_TYPECODES, get_dtype, get_prefix, needs_byteswap,
+                    numpy)
+from .constants import STRING_TYPE
+from .utils import readinto_exactly, readinto_full
+
+
+def gather_column(buffer, count, record_size, offset, size):
+    """
+    Copy one fixed-size field out of `count` back-to-back records.
+
+    The field is gathered byte lane by byte lane with strided slices, so the
+    cost is a handful of C-level copies regardless of `count`.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        Records laid out back to back, starting at the beginning
+    count : int
+        Number of records
+    record_size : int
+        Size of a record (# of bytes)
+    offset : int
+        Offset of the field inside a record (# of bytes)
+    size : int
+        Size of the field (# of bytes)
+
+    Returns
+    -------
+    bytearray
+        `count * size` bytes: the field values packed back to back
+    """
+    view = memoryview(buffer).cast("B")[:count * record_size]
+    column = bytearray(count * size)
+    for lane in range(size):
+        column[lane::size] = view[offset + lane::record_size]
+    return column
+
+
+def decode_columns(buffer, schema, count):
+    """
+    Decode `count` back-to-back records into per-field columns.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        Records laid out back to back, starting at the beginning
+    schema : Schema
+        Layout of a record
+    count : int
+        Number of records
+
+    Returns
+    -------
+    dict
+        Field name -> `array.array` for single numeric fields, list otherwise
+    """
+    columns = {}
+    rows = None
+    swap = needs_byteswap(schema.byteorder)
+
+    for position, field in enumerate(schema.fields):
+        typecode = ARRAY_TYPECODES.get(field.c_type)
+
+        if typecode is not None and field.length is None:
+            column = array.array(typecode)
+            column.frombytes(
+                gather_column(buffer, count, schema.size, field.offset,
+                              field.size))
+            if swap and column.itemsize > 1:
+                column.byteswap()
+        else:
+            if rows is None:
+                rows = decode_rows(buffer, schema, count)
+            column = [row[position] for row in rows]
+
+        columns[field.name] = column
+
+    return columns
+
+
+def decode_rows(buffer, schema, count):
+    """
+    Decode `count` back-to-back records into a list of tuples.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        Records laid out back to back, starting at the beginning
+    schema : Schema
+        Layout of a record
+    count : int
+        Number of records
+
+    Returns
+    -------
+    list of tuple
+        Field values of each record in order
+    """
+    view = memoryview(buffer).cast("B")[:count * schema.size]
+    return list(schema.iter_unpack(view))
+
+
+def read_records(data, schema, count=None, columns=False):
+    """
+    Read `count` back-to-back fixed-size records of layout `schema`.
+
+    All records are read with a single `readinto` call and decoded in bulk.
+
+    Parameters
+    ----------
+    data : io.BufferedReader
+        File open to read in binary mode
+    schema : Schema
+        Layout of a record
+    count : int | None
+        Number of records to read, all remaining records if None
+    columns : bool
+        Return per-field columns instead of a list of records
+
+    Returns
+    -------
+    list of tuple | dict
+        List of field value tuples, or field name -> column mapping if
+        `columns` is set (`array.array` for single numeric fields and
+        `list` for the others)
+    """
+    if count is None:
+        buffer = data.read()
+        count, remainder = divmod(len(buffer), schema.size)
+        if remainder:
+            raise struct.error("%d trailing bytes do not form a whole "
+                               "record of %d bytes" % (remainder, schema.size))
+    else:
+        buffer = readinto_exactly(data, bytearray(count * schema.size))
+
+    if columns:
+        return decode_columns(buffer, schema, count)
+    return decode_rows(buffer, schema, count)
+
+
+def iter_records(data, schema, chunk_records=65536, columns=False):
+    """
+    Iterate over back-to-back fixed-size records of layout `schema`.
+
+    Records are read in chunks of `chunk_records` records into a single
+    reused buffer, so memory usage is constant regardless of the file size.
+    Records split between two reads are reassembled before decoding.
+
+    Parameters
+    ----------
+    data : io.BufferedReader
+        File open to read in binary mode
+    schema : Schema
+        Layout of a record
+    chunk_records : int
+        Number of records to read and decode at once
+    columns : bool
+        Yield per-chunk columns instead of single records
+
+    Yields
+    ------
+    tuple | dict
+        Field values of each record, or field name -> column mapping of
+        each chunk if `columns` is set (see `read_records`)
+    """
+    if chunk_records < 1:
+        raise ValueError("chunk_records must be positive, got %d" %
+                         chunk_records)
+
+    view = memoryview(bytearray(chunk_records * schema.size))
+
+    while True:
+        num_bytes = readinto_full(data, view)
+        count, remainder = divmod(num_bytes, schema.size)
+
+        if count:
+            if columns:
+                yield decode_columns(view, schema, count)
+            else:
+                yield from schema.iter_unpack(view[:count * schema.size])
+
+        if num_bytes < view.nbytes:
+            if remainder:
+                raise struct.error("%d trailing bytes do not form a whole "
+                                   "record of %d bytes" %
+                                   (remainder, schema.size))
+            return
+
+
+def _field_dtype(field, byteorder):
+    """Get a NumPy dtype of a field, a sub-array dtype for arrays."""
+    if field.c_type == STRING_TYPE:
+        return numpy.dtype("S%d" % field.length)
+    dtype = get_dtype(field.c_type, byteorder)
+    if field.length is None:
+        return dtype
+    return numpy.dtype((dtype, (field.length, )))
+
+
+def _project(buffer, schema, field, count, as_numpy):
+    """Extract one field of `count` back-to-back records."""
+    if as_numpy:
+        dtype = _field_dtype(field, schema.byteorder)
+        if not count:
+            return numpy.empty(0, dtype=dtype)
+
+        # A strided view over the records, always copied into a compact
+        # array: an already contiguous view would still share `buffer`
+        view = numpy.ndarray((count, ),
+                             dtype=dtype,
+                             buffer=buffer,
+                             offset=field.offset,
+                             strides=(schema.size, ))
+        column = view.copy()
+        del view
+        return column
+
+    data = gather_column(buffer, count, schema.size, field.offset, field.size)
+    typecode = ARRAY_TYPECODES.get(field.c_type)
+
+    if typecode is not None and field.length is None:
+        column = array.array(typecode)
+        column.frombytes(data)
+        if column.itemsize > 1 and needs_byteswap(schema.byteorder):
+            column.byteswap()
+        return column
+
+    values = struct.Struct(get_prefix(schema.byteorder) +
+                           field.format).iter_unpack(data)
+    if field.c_type == STRING_TYPE:
+        return [value[0].decode("utf-8") for value in values]
+    if field.length is None:
+        return [value[0] for value in values]
+    return [list(value) for value in values]
+
+
+def read_columns(path_or_buffer,
+                 schema,
+                 names,
+                 offset=0,
+                 count=None,
+                 as_numpy=False):
+    """
+    Read only some fields of back-to-back fixed-size records.
+
+    Each field is extracted from all records at once with strided slices of
+    the memory-mapped file or buffer (or a strided NumPy view), so the cost
+    depends on the size of the projected fields, not of the records.
+
+    Examples
+    --------
+        columns = read_columns("/path/to/binary/file", schema,
+                               ["year", "width"])
+        columns["year"]  # array('h', [2019, 2019, ...])
+
+    Parameters
+    ----------
+    path_or_buffer : str | os.PathLike | bytes-like | mmap.mmap
+        Path to a file, memory-mapped for reading, or a buffer of records
+    schema : Schema
+        Layout of a record
+    names : list of str
+        Names of the fields to read
+    offset : int
+        Position of the first record (# of bytes), e.g. the size of a file
+        header
+    count : int | None
+        Number of records, all records until the end if None
+    as_numpy : bool
+        Return NumPy arrays (requires NumPy): strings as `bytes` arrays and
+        array fields as 2D arrays of shape `(count, size)`
+
+    Returns
+    -------
+    dict
+        Field name -> column: `array.array` for single numeric fields and
+        `list` for the others, or a NumPy array if `as_numpy` is set
+    """
+    fields = {field.name: field for field in schema.fields}
+    for name in names:
+        if name not in fields:
+            raise KeyError("unknown field %r" % name)
+    if as_numpy:
+        get_dtype("char")  # raises an ImportError without NumPy
+
+    mapped = None
+    if isinstance(path_or_buffer, (str, os.PathLike)):
+        with open(path_or_buffer, "rb") as data:
+            if os.fstat(data.fileno()).st_size:
+                mapped = mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = mapped if mapped is not None else b""
+    else:
+        buffer = path_or_buffer
+
+    view = memoryview(buffer).cast("B")
+    try:
+        if count is None:
+            count, remainder = divmod(max(view.nbytes - offset, 0),
+                                      schema.size)
+            if remainder:
+                raise struct.error("%d trailing bytes do not form a whole "
+                                   "record of %d bytes" %
+                                   (remainder, schema.size))
+        if offset < 0 or offset + count * schema.size > view.nbytes:
+            raise struct.error("unpack_from requires a buffer of at least %d "
+                               "bytes" % (offset + count * schema.size))
+
+        records = view[offset:offset + count * schema.size]
+        try:
+            return {
+                name: _project(records, schema, fields[name], count, as_numpy)
+                for name in names
+            }
+        finally:
+            records.release()
+    finally:
+        view.release()
+        if mapped is not None:
+            mapped.close()
+
+
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _check_predicate(schema, name, predicate):
+    """Validate a `(op, value)` predicate and normalize its value."""
+    if name not in schema.names:
+        raise KeyError("unknown field %r" % name)
+    try:
+        op, value = predicate
+    except (TypeError, ValueError):
+        raise ValueError(
+            "field %r: expected an (op, value) predicate, got %r" %
+            (name, predicate)) from None
+
+    if op == "between":
+        try:
+            low, high = value
+        except (TypeError, ValueError):
+            raise ValueError("field %r: `between` expects a (low, high) "
+                             "pair, got %r" % (name, value)) from None
+    elif op == "in":
+        value = list(value)
+    elif op not in _OPERATORS:
+        raise ValueError(
+            "field %r: unknown operator %r, expected one of: %s" %
+            (name, op, ", ".join(list(_OPERATORS) + ["in", "between"])))
+    return op, value
+
+
+def _numpy_mask(column, op, value):
+    """Evaluate a predicate over a NumPy column."""
+    if op == "between":
+        low, high = value
+        return (column >= low) & (column <= high)
+    if op == "in":
+        return numpy.isin(column, value)
+    return _OPERATORS[op](column, value)
+
+
+def _select(column, op, value, indices):
+    """Keep the positions in `indices` whose value satisfies a predicate."""
+    if op == "between":
+        low, high = value
+        return [index for index in indices if low <= column[index] <= high]
+    if op == "in":
+        try:
+            value = set(value)
+        except TypeError:  # e.g. lists for array fields
+            pass
+        return [index for index in indices if column[index] in value]
+    test = _OPERATORS[op]
+    return [index for index in indices if test(column[index], value)]
+
+
+def _match(buffer, schema, predicates, count):
+    """Get the positions of the records of a chunk matching all predicates."""
+    mask, indices = None, range(count)
+
+    for field, op, value in predicates:
+        if numpy is not None and field.length is None and field.c_type != "char":
+            column = numpy.ndarray((count, ),
+                                   dtype=get_dtype(field.c_type,
+                                                   schema.byteorder),
+                                   buffer=buffer,
+                                   offset=field.offset,
+                                   strides=(schema.size, ))
+            if column.dtype.kind == "f" and column.dtype.itemsize < 8:
+                # Compared like the decoded Python floats, not as float32
+                column = column.astype("f8")
+            field_mask = _numpy_mask(column, op, value)
+            mask = field_mask if mask is None else mask & field_mask
+        else:
+            if mask is not None:
+                indices = numpy.flatnonzero(mask).tolist()
+            column = _project(buffer, schema, field, count, False)
+            indices = _select(column, op, value, indices)
+            if numpy is not None:
+                # Back to a mask, for the next NumPy predicates to narrow
+                mask = numpy.zeros(count, dtype=bool)
+                mask[indices] = True
+
+    if mask is not None:
+        return numpy.flatnonzero(mask).tolist()
+    return indices
+
+
+def filter_records(data, schema, where, chunk_records=65536):
+    """
+    Iterate over the records of layout `schema` satisfying all predicates.
+
+    Records are read in chunks like with `iter_records`. For each chunk,
+    only the fields used by the predicates are extracted and tested, over
+    strided NumPy views when NumPy is installed, and only the matching
+    records are fully decoded.
+
+    Examples
+    --------
+        with open("/path/to/binary/file", "rb") as data:
+            for record in filter_records(data, schema, {
+                    "year": ("==", 2019),
+                    "width": ("between", (0.5, 2.5))}):
+                process(record)
+
+    Parameters
+    ----------
+    data : io.BufferedReader
+        File open to read in binary mode
+    schema : Schema
+        Layout of a record
+    where : dict
+        Field name -> `(op, value)` predicate. `op` is one of "==", "!=",
+        "<", "<=", ">", ">=", "in" (value in a collection) or "between"
+        (value in an inclusive `(low, high)` range). A record is kept if
+        it satisfies all predicates
+    chunk_records : int
+        Number of records to read and test at once
+
+    Yields
+    ------
+    tuple
+        Field values of each matching record, like `iter_records`
+    """
+    fields = {field.name: field for field in schema.fields}
+    predicates = []
+    for name, predicate in where.items():
+        op, value = _check_predicate(schema, name, predicate)
+        predicates.append((fields[name], op, value))
+
+    if chunk_records < 1:
+        raise ValueError("chunk_records must be positive, got %d" %
+                         chunk_records)
+
+    unpack_from, size = schema.struct.unpack_from, schema.size
+    view = memoryview(bytearray(chunk_records * size))
+
+    while True:
+        num_bytes = readinto_full(data, view)
+        count, remainder = divmod(num_bytes, size)
+
+        if count:
+            for index in _match(view, schema, predicates, count):
+                values = unpack_from(view, index * size)
+                yield values if schema._flat else tuple(schema._decode(values))
+
+        if num_bytes < view.nbytes:
+            if remainder:
+                raise struct.error("%d trailing bytes do not form a whole "
+                                   "record of %d bytes" % (remainder, size))
+            return
+
+
+class RecordWriter:
+    """
+    Buffered writer of back-to-back fixed-size records of layout `schema`.
+
+    Records are packed with `pack_into` into a preallocated buffer, which
+    is written out with a single `write` call whenever it fills up.
+
+    Examples
+    --------
+        with open("/path/to/binary/file", "wb") as data:
+            with RecordWriter(data, schema) as writer:
+                writer.write_records(records)
+
+    Parameters
+    ----------
+    data : io.BufferedWriter
+        File open to write in binary mode
+    schema : Schema
+        Layout of a record
+    buffer_size : int
+        Size of the buffer (# of bytes), rounded down to a whole number of
+        records (at least one)
+    """
+
+    def __init__(self, data, schema, buffer_size=1 << 20):
+        self.data = data
+        self.schema = schema
+
+        self._capacity = max(buffer_size // schema.size, 1)
+        self._buffer = bytearray(self._capacity * schema.size)
+        self._count = 0
+
+    def __enter__(self):
+        """Return the writer itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Write out the buffered records."""
+        self.flush()
+
+    def flush(self):
+        """Write out the buffered records."""
+        if self._count:
+            num_bytes = self._count * self.schema.size
+            self.data.write(memoryview(self._buffer)[:num_bytes])
+            self._count = 0
+
+    def write(self, record):
+        """
+        Write one record.
+
+        Parameters
+        ----------
+        record : dict | list | tuple
+            Field name -> value mapping or field values in order
+        """
+        if self._count == self._capacity:
+            self.flush()
+        self.schema.pack_into(self._buffer, self._count * self.schema.size,
+                              record)
+        self._count += 1
+
+    def write_records(self, records):
+        """
+        Write many records.
+
+        Parameters
+        ----------
+        records : iterable
+            Records as field name -> value mappings or field values in order
+        """
+        pack_into = self.schema.struct.pack_into
+        encode = self.schema._encode
+        buffer, size, capacity = self._buffer, self.schema.size, self._capacity
+
+        count = self._count
+        try:
+            for record in records:
+                if count == capacity:
+                    self._count = count
+                    self.flush()
+                    count = 0
+                pack_into(buffer, count * size, *encode(record))
+                count += 1
+        finally:
+            self._count = count
@@ -0,0 +1,371 @@
+"""Byter record schemas."""
+
+__all__ = ["Schema"]
+
+import struct
+from collections.abc import Mapping
+
+from .codec import get_prefix
+from .constants import STRING_TYPE
+from .cparser import parse_struct
+from .utils import get_type
+
+
+class Field:
+    """
+    A single named field of a `Schema`.
+
+    Attributes
+    ----------
+    name : str
+        Field name
+    c_type : str
+        C-language type string (e.g. "unsigned_int"), "char[]" for strings
+    length : int | None
+        Number of array elements or string bytes, None for a single value
+    format : str
+        Format of the field for `struct` library, without byte order
+    offset : int
+        Offset of the field from the beginning of the record (# of bytes)
+    size : int
+        Size of the field (# of bytes)
+    index : int
+        Position of the first value of the field in the unpacked tuple
+    count : int
+        Number of values the field occupies in the unpacked tuple
+    """
+
+    __slots__ = ("name", "c_type", "length", "format", "offset", "size",
+                 "index", "count")
+
+    def __init__(self, name, spec, offset, index):
+        if isinstance(spec, str):
+            c_type, length = spec, None
+        else:
+            try:
+                c_type, length = spec
+            except (TypeError, ValueError):
+                raise ValueError("field %r: expected a C type string or a "
+                                 "(c_type, length) pair, got %r" %
+                                 (name, spec)) from None
+
+        if c_type == STRING_TYPE:
+            if length is None:
+                raise ValueError("field %r: `char[]` requires a length" % name)
+            s_format, count = "%ds" % length, 1
+        elif length is None:
+            s_format, count = get_type(c_type), 1
+        else:
+            s_format, count = "%d%s" % (length, get_type(c_type)), length
+
+        self.name = name
+        self.c_type = c_type
+        self.length = length
+        self.format = s_format
+        self.offset = offset
+        self.size = struct.calcsize("=" + s_format)
+        self.index = index
+        self.count = count
+
+    def __repr__(self):
+        """Return the field declaration."""
+        return "Field(%r, %r)" % (self.name, self.spec)
+
+    @property
+    def spec(self):
+        """Type of the field as passed to `Schema`."""
+        return self.c_type if self.length is None else (self.c_type,
+                                                        self.length)
+
+
+class Schema:
+    """
+    Layout of a fixed-size binary record.
+
+    The whole record is compiled into a single `struct.Struct`, so reading
+    or writing it takes one I/O call and one (un)pack call.
+
+    Examples
+    --------
+        schema = Schema([("has_data", "bool"),
+                         ("year", "short"),
+                         ("text", ("char[]", 70)),
+                         ("array", ("unsigned_short", 3))])
+        record = schema.read(data)  # {"has_data": True, "year": 2019, ...}
+
+    Parameters
+    ----------
+    fields : list
+        Sequence of `(name, c_type)` pairs. `c_type` is either a C-language
+        type string (e.g. "unsigned_int"), a `("char[]", s_len)` pair for
+        a string or a `(c_type, size)` pair for an array. A `(None, size)`
+        pair declares `size` pad bytes, skipped when unpacking
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+
+    Attributes
+    ----------
+    fields : list of Field
+        Fields of the record in order
+    names : tuple of str
+        Names of the fields in order
+    struct : struct.Struct
+        Compiled struct of the whole record
+    size : int
+        Size of the record (# of bytes)
+    """
+
+    def __init__(self, fields, byteorder="native"):
+        self.byteorder = byteorder
+        self.fields = []
+        self._declaration = []
+
+        formats = []
+        offset, index = 0, 0
+        for name, spec in fields:
+            if name is None:
+                if not isinstance(spec, int) or spec < 0:
+                    raise ValueError("padding size must be a non-negative "
+                                     "integer, got %r" % (spec, ))
+                formats.append("%dx" % spec)
+                self._declaration.append((None, spec))
+                offset += spec
+                continue
+
+            field = Field(name, spec, offset, index)
+            self.fields.append(field)
+            self._declaration.append((name, field.spec))
+            formats.append(field.format)
+            offset += field.size
+            index += field.count
+
+        self.names = tuple(field.name for field in self.fields)
+        if len(set(self.names)) != len(self.names):
+            raise ValueError("field names must be unique: %r" % (self.names, ))
+
+        self.struct = struct.Struct(get_prefix(byteorder) + "".join(formats))
+        self.size = self.struct.size
+
+        # Records of single non-string values need no conversion at all
+        self._flat = all(field.length is None and field.c_type != STRING_TYPE
+                         for field in self.fields)
+
+    @classmethod
+    def from_c(cls, declaration, byteorder="native", packed=False):
+        """
+        Build a schema from C struct declarations.
+
+        Fields are laid out like a C compiler does: each one is aligned to
+        the size of its type (`char` arrays to 1 byte) and the record is
+        padded to a multiple of its largest alignment. Pad bytes are part of
+        the compiled struct, so they are skipped inside the (un)pack call.
+        Type sizes are the standard ones of the types table, e.g. `long` is
+        4 bytes wide.
+
+        `char` arrays are strings, other arrays are `(c_type, size)` fields
+        (multidimensional arrays are flattened). Fields of nested structs
+        are named "outer.inner" and elements of struct arrays "outer[i].x"
+        (`compile_decoder` maps them to attributes `outer_inner` and
+        `outer_i_x`).
+
+        Examples
+        --------
+            schema = Schema.from_c('''
+                struct hdr {
+                    bool ok;              // 1 pad byte follows
+                    short year;
+                    float w;
+                    char name[70];
+                    unsigned short arr[3];
+                };
+            ''')
+
+        Parameters
+        ----------
+        declaration : str
+            C source declaring one or more structs (or typedefs of structs);
+            the last one declares the record
+        byteorder : str
+            Byte order name: "native", "little", "big" or "network"
+        packed : bool
+            Lay fields out without padding, like `__attribute__((packed))`
+            or `#pragma pack(1)`
+
+        Returns
+        -------
+        Schema
+            Schema of the last declared struct
+        """
+        return cls(parse_struct(declaration, packed), byteorder)
+
+    def __repr__(self):
+        """Return the schema declaration."""
+        return "Schema(%r, byteorder=%r)" % (self.fields, self.byteorder)
+
+    def __reduce__(self):
+        """Rebuild from the declaration, as `struct.Struct` can't pickle."""
+        return (Schema, (list(self._declaration), self.byteorder))
+
+    def __eq__(self, other):
+        """Check whether two schemas declare the same layout."""
+        if not isinstance(other, Schema):
+            return NotImplemented
+        return self.__reduce__() == other.__reduce__()
+
+    def __hash__(self):
+        """Hash the declaration, e.g. to cache code compiled per schema."""
+        return hash((tuple(self._declaration), self.byteorder))
+
+    def _decode(self, values):
+        """Convert a flat tuple of unpacked values to field values."""
+        if self._flat:
+            return values
+
+        record = []
+        for field in self.fields:
+            if field.c_type == STRING_TYPE:
+                record.append(values[field.index].decode("utf-8"))
+            elif field.length is None:
+                record.append(values[field.index])
+            else:
+                record.append(
+                    list(values[field.index:field.index + field.count]))
+        return record
+
+    def _encode(self, record):
+        """Convert a record to a flat list of values to pack."""
+        if not isinstance(record, (tuple, list)):
+            if isinstance(record, Mapping):
+                record = [record[name] for name in self.names]
+            else:
+                record = tuple(record)
+        if len(record) != len(self.fields):
+            raise ValueError("expected %d field values, got %d" %
+                             (len(self.fields), len(record)))
+
+        if self._flat:
+            return record
+
+        values = []
+        for field, value in zip(self.fields, record):
+            if field.c_type == STRING_TYPE:
+                values.append(value.encode("utf-8"))
+            elif field.length is None:
+                values.append(value)
+            else:
+                values.extend(value)
+        return values
+
+    def unpack(self, buffer):
+        """
+        Decode one record from a buffer of exactly `size` bytes.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            Buffer of `size` bytes
+
+        Returns
+        -------
+        dict
+            Field name -> value mapping
+        """
+        return dict(zip(self.names, self._decode(self.struct.unpack(buffer))))
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Decode one record from a buffer starting at `offset`.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            Buffer of at least `offset + size` bytes
+        offset : int
+            Position of the record in the buffer (# of bytes)
+
+        Returns
+        -------
+        dict
+            Field name -> value mapping
+        """
+        values = self.struct.unpack_from(buffer, offset)
+        return dict(zip(self.names, self._decode(values)))
+
+    def iter_unpack(self, buffer):
+        """
+        Decode back-to-back records from a buffer of a multiple of `size`.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            Buffer of `n * size` bytes
+
+        Returns
+        -------
+        iterator of tuple
+            Field values of each record in order
+        """
+        values = self.struct.iter_unpack(buffer)
+        if self._flat:
+            return values
+        return (tuple(self._decode(value)) for value in values)
+
+    def pack(self, record):
+        """
+        Encode one record into bytes.
+
+        Parameters
+        ----------
+        record : dict | list | tuple
+            Field name -> value mapping or field values in order
+
+        Returns
+        -------
+        bytes
+            Encoded record of `size` bytes
+        """
+        return self.struct.pack(*self._encode(record))
+
+    def pack_into(self, buffer, offset, record):
+        """
+        Encode one record into a writable buffer starting at `offset`.
+
+        Parameters
+        ----------
+        buffer : bytearray | memoryview
+            Writable buffer of at least `offset + size` bytes
+        offset : int
+            Position of the record in the buffer (# of bytes)
+        record : dict | list | tuple
+            Field name -> value mapping or field values in order
+        """
+        self.struct.pack_into(buffer, offset, *self._encode(record))
+
+    def read(self, data):
+        """
+        Read one record.
+
+        Parameters
+        ----------
+        data : io.BufferedReader
+            File open to read in binary mode
+
+        Returns
+        -------
+        dict
+            Field name -> value mapping
+        """
+        return self.unpack(data.read(self.size))
+
+    def write(self, data, record):
+        """
+        Write one record.
+
+        Parameters
+        ----------
+        data : io.BufferedWriter
+            File open to write in binary mode
+        record : dict | list | tuple
+            Field name -> value mapping or field values in order
+        """
+        data.write(self.pack(record))
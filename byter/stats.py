@@ -0,0 +1,320 @@
+"""
+Byter opt-in I/O statistics.
+
+Counts calls, bytes read/written and time spent per function and C-language
+type for every `read_*`/`write_*` function of `byter`. Statistics are off
+by default: `enable` replaces the functions in the `byter`, `byter.reader`
+and `byter.writer` namespaces with instrumented wrappers and `disable` puts
+the original functions back, so disabled statistics cost nothing.
+
+Only calls made through these namespaces are counted: names imported with
+`from byter import *` before `enable` keep referring to the original
+functions.
+
+Only the outermost call is counted when byter functions call each other,
+e.g. `read_array(..., as_array=True)` counts as one `read_array` call.
+
+Examples
+--------
+    import byter
+
+    with byter.stats.collect() as stats:
+        run_pipeline()
+
+    stats["read_array"]["float"]  # {"calls": 12, "bytes": 48000, ...}
+"""
+
+__all__ = ["enable", "disable", "is_enabled", "reset", "snapshot", "collect"]
+
+import contextlib
+import functools
+import itertools
+import sys
+import threading
+import time
+
+from . import reader, writer
+from .codec import STRUCTS
+from .schema import STRING_TYPE
+
+# (function name, C-language type) -> [calls, bytes, seconds]
+_counters = {}
+_lock = threading.Lock()
+
+# Function name -> original function, while statistics are enabled
+_originals = {}
+
+# Whether an instrumented call is running in the current thread. Calls made
+# inside it (e.g. `read_array` calling `read_array_into`) are not counted
+_local = threading.local()
+
+
+def _enter():
+    """Mark the start of a call, False if inside an instrumented call."""
+    if getattr(_local, "active", False):
+        return False
+    _local.active = True
+    return True
+
+
+def _exit():
+    """Mark the end of an outermost instrumented call."""
+    _local.active = False
+
+
+def _record(key, num_bytes, seconds):
+    """Add a call to the counters of `key`."""
+    with _lock:
+        counter = _counters.get(key)
+        if counter is None:
+            counter = _counters[key] = [0, 0, 0.0]
+        counter[0] += 1
+        counter[1] += num_bytes
+        counter[2] += seconds
+
+
+def _count_values(values):
+    """Wrap an iterable of unknown length to count the values it yields."""
+    counter = itertools.count()
+    # zip stops on the exhausted `values` before advancing `counter`
+    return (value for value, _ in zip(values, counter)), counter
+
+
+def _wrap_scalar(name, func, c_type):
+    """Instrument `read_<c_type>` or `write_<c_type>`."""
+    key, size = (name, c_type), STRUCTS["native"][c_type].size
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enter():
+            return func(*args, **kwargs)
+        try:
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+        finally:
+            _exit()
+        _record(key, size, time.perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+def _wrap_read_string(func):
+    """Instrument `read_string`."""
+    key = ("read_string", STRING_TYPE)
+
+    @functools.wraps(func)
+    def read_string(data, s_len):
+        if not _enter():
+            return func(data, s_len)
+        try:
+            start = time.perf_counter()
+            result = func(data, s_len)
+        finally:
+            _exit()
+        _record(key, s_len, time.perf_counter() - start)
+        return result
+
+    return read_string
+
+
+def _wrap_write_string(func):
+    """Instrument `write_string`."""
+    key = ("write_string", STRING_TYPE)
+
+    @functools.wraps(func)
+    def write_string(data, value):
+        if not _enter():
+            return func(data, value)
+        try:
+            start = time.perf_counter()
+            func(data, value)
+        finally:
+            _exit()
+        _record(key, len(value), time.perf_counter() - start)
+
+    return write_string
+
+
+def _wrap_read_array(func):
+    """Instrument `read_array`."""
+
+    @functools.wraps(func)
+    def read_array(data, size, c_type, *args, **kwargs):
+        if not _enter():
+            return func(data, size, c_type, *args, **kwargs)
+        try:
+            start = time.perf_counter()
+            result = func(data, size, c_type, *args, **kwargs)
+        finally:
+            _exit()
+        _record(("read_array", c_type), size * STRUCTS["native"][c_type].size,
+                time.perf_counter() - start)
+        return result
+
+    return read_array
+
+
+def _wrap_read_array_into(func):
+    """Instrument `read_array_into`."""
+
+    @functools.wraps(func)
+    def read_array_into(data, buffer, c_type, *args, **kwargs):
+        if not _enter():
+            return func(data, buffer, c_type, *args, **kwargs)
+        try:
+            start = time.perf_counter()
+            result = func(data, buffer, c_type, *args, **kwargs)
+        finally:
+            _exit()
+        _record(("read_array_into", c_type),
+                result * STRUCTS["native"][c_type].size,
+                time.perf_counter() - start)
+        return result
+
+    return read_array_into
+
+
+def _wrap_write_array(func):
+    """Instrument `write_array`."""
+
+    def measure(data, values, c_type, *args, **kwargs):
+        counter = None
+        size = getattr(values, "size", None)  # NumPy arrays
+        if not isinstance(size, int):
+            try:
+                size = len(values)
+            except TypeError:
+                values, counter = _count_values(values)
+
+        start = time.perf_counter()
+        func(data, values, c_type, *args, **kwargs)
+        seconds = time.perf_counter() - start
+
+        if counter is not None:
+            size = next(counter)
+        _record(("write_array", c_type), size * STRUCTS["native"][c_type].size,
+                seconds)
+
+    @functools.wraps(func)
+    def write_array(data, values, c_type, *args, **kwargs):
+        if not _enter():
+            return func(data, values, c_type, *args, **kwargs)
+        try:
+            measure(data, values, c_type, *args, **kwargs)
+        finally:
+            _exit()
+
+    return write_array
+
+
+def _wrap(name, func):
+    """Instrument a `byter` read/write function."""
+    if name == "read_string":
+        return _wrap_read_string(func)
+    if name == "write_string":
+        return _wrap_write_string(func)
+    if name == "read_array":
+        return _wrap_read_array(func)
+    if name == "read_array_into":
+        return _wrap_read_array_into(func)
+    if name == "write_array":
+        return _wrap_write_array(func)
+    return _wrap_scalar(name, func, name.split("_", 1)[1])
+
+
+def _namespaces():
+    """Get the modules exposing the read/write functions."""
+    return (reader, writer, sys.modules[__package__])
+
+
+def enable():
+    """Start counting calls of the read/write functions."""
+    with _lock:
+        if _originals:
+            return
+
+        for module in (reader, writer):
+            for name in module.__all__:
+                _originals[name] = getattr(module, name)
+
+        for name, func in _originals.items():
+            wrapper = _wrap(name, func)
+            for namespace in _namespaces():
+                if getattr(namespace, name, None) is func:
+                    setattr(namespace, name, wrapper)
+
+
+def disable():
+    """Stop counting and restore the original read/write functions."""
+    with _lock:
+        for name, func in _originals.items():
+            for namespace in _namespaces():
+                if hasattr(namespace, name):
+                    setattr(namespace, name, func)
+        _originals.clear()
+
+
+def is_enabled():
+    """
+    Check whether statistics are being collected.
+
+    Returns
+    -------
+    bool
+        True between `enable` and `disable`
+    """
+    return bool(_originals)
+
+
+def reset():
+    """Clear all counters."""
+    with _lock:
+        _counters.clear()
+
+
+def snapshot():
+    """
+    Get a copy of the counters.
+
+    Returns
+    -------
+    dict
+        Function name -> C-language type ("char[]" for strings) -> dict of
+        "calls", "bytes" read or written and "seconds" spent
+    """
+    stats = {}
+    with _lock:
+        for (name, c_type), (calls, num_bytes, seconds) in _counters.items():
+            stats.setdefault(name, {})[c_type] = {
+                "calls": calls,
+                "bytes": num_bytes,
+                "seconds": seconds,
+            }
+    return stats
+
+
+@contextlib.contextmanager
+def collect():
+    """
+    Collect statistics of the calls made inside a `with` block.
+
+    Counters are reset on entry. The yielded dict is filled with `snapshot`
+    on exit, and statistics are left enabled only if they were before.
+
+    Yields
+    ------
+    dict
+        Empty dict, filled with the statistics of the block on exit
+    """
+    was_enabled = is_enabled()
+    reset()
+    enable()
+
+    stats = {}
+    try:
+        yield stats
+    finally:
+        if not was_enabled:
+            disable()
+        stats.update(snapshot())
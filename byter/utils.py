@@ -1,5 +1,8 @@
 """Byter utilities."""
 
+import array
+import struct
+
 from .constants import TYPES_TABLE
 
 
@@ -26,3 +29,93 @@ def get_type(c_type):
         A format character for `struct` library
     """
     return TYPES_TABLE[c_type]
+
+
+def readinto_full(data, buffer):
+    """
+    Fill a writable buffer with bytes read from `data` until it ends.
+
+    Unlike a single `readinto` call, short reads (e.g. from pipes or
+    sockets) are retried until the buffer is full or `data` is exhausted.
+    Falls back to `data.read` for objects without a `readinto` method.
+
+    Parameters
+    ----------
+    data : io.BufferedReader
+        File open to read in binary mode
+    buffer : bytearray | memoryview
+        Writable buffer to fill
+
+    Returns
+    -------
+    int
+        Number of bytes read, less than the size of `buffer` only if `data`
+        has ended
+    """
+    view = memoryview(buffer).cast("B")
+    total, size = 0, view.nbytes
+
+    readinto = getattr(data, "readinto", None)
+    while total < size:
+        if readinto is not None:
+            num_bytes = readinto(view[total:])
+        else:
+            chunk = data.read(size - total)
+            num_bytes = len(chunk)
+            view[total:total + num_bytes] = chunk
+        if not num_bytes:
+            break
+        total += num_bytes
+
+    return total
+
+
+def readinto_exactly(data, buffer):
+    """
+    Fill a writable buffer with bytes read from `data`.
+
+    Parameters
+    ----------
+    data : io.BufferedReader
+        File open to read in binary mode
+    buffer : bytearray | memoryview
+        Writable buffer to fill
+
+    Returns
+    -------
+    memoryview
+        Byte view of `buffer`
+
+    Raises
+    ------
+    struct.error
+        If `data` ends before `buffer` is filled
+    """
+    view = memoryview(buffer).cast("B")
+    if readinto_full(data, view) < view.nbytes:
+        raise struct.error("unpack requires a buffer of %d bytes" %
+                           view.nbytes)
+    return view
+
+
+def byteswap(buffer, itemsize):
+    """
+    Reverse the byte order of every `itemsize`-byte element in place.
+
+    Parameters
+    ----------
+    buffer : bytearray | memoryview | array.array | numpy.ndarray
+        Writable C-contiguous buffer
+    itemsize : int
+        Size of an element (# of bytes)
+    """
+    if isinstance(buffer, array.array) and buffer.itemsize == itemsize:
+        buffer.byteswap()
+        return
+
+    view = memoryview(buffer).cast("B")
+    for lane in range(itemsize // 2):
+        mirror = itemsize - 1 - lane
+        lane_bytes = bytes(view[lane::itemsize])
+        view[lane::itemsize] = view[mirror::itemsize]
+        view[mirror::itemsize] = lane_bytes
@@ -0,0 +1,184 @@
+"""Byter lazy record views."""
+
+__all__ = ["RecordView", "RecordsView"]
+
+import functools
+import keyword
+import struct
+
+from .codec import get_prefix
+from .constants import STRING_TYPE
+
+
+def _field_getter(field, prefix):
+    """Build a function decoding one field of the record a view points at."""
+    unpack_from = struct.Struct(prefix + field.format).unpack_from
+    offset = field.offset
+
+    if field.c_type == STRING_TYPE:
+
+        def getter(view):
+            values = unpack_from(view._buffer, view._offset + offset)
+            return values[0].decode("utf-8")
+    elif field.length is None:
+
+        def getter(view):
+            return unpack_from(view._buffer, view._offset + offset)[0]
+    else:
+
+        def getter(view):
+            return list(unpack_from(view._buffer, view._offset + offset))
+
+    getter.__name__ = field.name
+    getter.__doc__ = "Decode the %r field." % field.name
+    return getter
+
+
+@functools.lru_cache(maxsize=128)
+def _view_class(schema):
+    """Create a `RecordView` subclass with a property per field of `schema`."""
+    prefix = get_prefix(schema.byteorder)
+    getters = {
+        field.name: _field_getter(field, prefix)
+        for field in schema.fields
+    }
+
+    namespace = {"__slots__": (), "_schema": schema, "_getters": getters}
+    for name, getter in getters.items():
+        # Other names are only reachable with `view[name]`
+        if (name.isidentifier() and not keyword.iskeyword(name) and
+                not hasattr(RecordView, name)):
+            namespace[name] = property(getter)
+
+    return type("RecordView", (RecordView, ), namespace)
+
+
+class RecordView:
+    """
+    Lazy view of one fixed-size record of layout `schema` in a buffer.
+
+    Nothing is decoded when a view is created: each field is unpacked from
+    the buffer with its own precompiled struct when it is accessed, so only
+    the fields actually used are decoded.
+
+    Examples
+    --------
+        view = RecordView(schema, buffer, offset)
+        view.year          # decodes the "year" field only
+        view["pts[0].x"]   # fields not named like Python identifiers
+
+    Parameters
+    ----------
+    schema : Schema
+        Layout of the record
+    buffer : bytes-like | mmap.mmap
+        Buffer holding the record; it is referenced, not copied
+    offset : int
+        Position of the record in the buffer (# of bytes)
+    """
+
+    __slots__ = ("_buffer", "_offset")
+
+    def __new__(cls, schema, buffer, offset=0):
+        """Create a view of the record at `offset`."""
+        if offset < 0 or offset + schema.size > memoryview(buffer).nbytes:
+            raise struct.error("unpack_from requires a buffer of at least %d "
+                               "bytes" % (offset + schema.size))
+        return _make_view(_view_class(schema), buffer, offset)
+
+    def __getitem__(self, name):
+        """Decode the field `name`."""
+        try:
+            getter = self._getters[name]
+        except KeyError:
+            raise KeyError(name) from None
+        return getter(self)
+
+    def __repr__(self):
+        """Return the decoded fields."""
+        return "RecordView(%s)" % ", ".join(
+            "%s=%r" % (name, value) for name, value in self._asdict().items())
+
+    def _asdict(self):
+        """
+        Decode all fields.
+
+        Returns
+        -------
+        dict
+            Field name -> value mapping
+        """
+        return {name: getter(self) for name, getter in self._getters.items()}
+
+
+def _make_view(cls, buffer, offset):
+    """Create a view of class `cls` without checking the buffer size."""
+    view = object.__new__(cls)
+    view._buffer = buffer
+    view._offset = offset
+    return view
+
+
+class RecordsView:
+    """
+    Lazy sequence of back-to-back fixed-size records of layout `schema`.
+
+    Indexing creates a `RecordView` of one record, slicing a `RecordsView`
+    of some records; neither decodes anything until a field is accessed.
+
+    Examples
+    --------
+        with MmapReader("/path/to/binary/file") as reader:
+            records = RecordsView(schema, reader.buffer, offset=header_size)
+            years = [records[i].year for i in sample]
+
+    Parameters
+    ----------
+    schema : Schema
+        Layout of a record
+    buffer : bytes-like | mmap.mmap
+        Buffer holding the records; it is referenced, not copied
+    offset : int
+        Position of the first record in the buffer (# of bytes)
+    count : int | None
+        Number of records, as many as fit in the buffer if None
+    """
+
+    def __init__(self, schema, buffer, offset=0, count=None):
+        if offset < 0:
+            raise struct.error("offset %d out of range for %d-byte buffer" %
+                               (offset, memoryview(buffer).nbytes))
+
+        available = (memoryview(buffer).nbytes - offset) // schema.size
+        if count is None:
+            count = max(available, 0)
+        elif count > available:
+            raise struct.error("unpack_from requires a buffer of at least %d "
+                               "bytes" % (offset + count * schema.size))
+
+        self.schema = schema
+        self.buffer = buffer
+        self.offset = offset
+        self._records = range(count)
+        self._class = _view_class(schema)
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self._records)
+
+    def __getitem__(self, index):
+        """Get a view of record #`index`, or a `RecordsView` of a slice."""
+        if isinstance(index, slice):
+            view = object.__new__(RecordsView)
+            view.__dict__.update(self.__dict__)
+            view._records = self._records[index]
+            return view
+
+        position = self.offset + self._records[index] * self.schema.size
+        return _make_view(self._class, self.buffer, position)
+
+    def __iter__(self):
+        """Iterate over views of the records."""
+        cls, buffer, size = self._class, self.buffer, self.schema.size
+        for index in self._records:
+            yield _make_view(cls, buffer, self.offset + index * size)
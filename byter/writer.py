@@ -21,12 +21,15 @@ __all__ = [
 ]
 # yapf: enable
 
+import array
+import itertools
 import struct
 
-from .utils import get_type
+from .codec import (ARRAY_TYPECODES, STRUCTS, get_array_struct,
+                    get_buffer_byteorder, get_dtype, numpy, resolve_byteorder)
 
 
-def write_char(data, value):
+def write_char(data, value, byteorder="native"):
     """
     Write 1 byte of data as `char`.
 
@@ -36,13 +39,14 @@ def write_char(data, value):
         File open to write in binary mode
     value : bytes
         Python string of length of 1, encoded as bytes
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("char")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["char"].pack(value)
     data.write(bytes_data)
 
 
-def write_signed_char(data, value):
+def write_signed_char(data, value, byteorder="native"):
     """
     Write 1 byte of data as `signed char`.
 
@@ -52,13 +56,14 @@ def write_signed_char(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("signed_char")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["signed_char"].pack(value)
     data.write(bytes_data)
 
 
-def write_unsigned_char(data, value):
+def write_unsigned_char(data, value, byteorder="native"):
     """
     Write 1 byte of data as `unsigned char`.
 
@@ -68,13 +73,14 @@ def write_unsigned_char(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("unsigned_char")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["unsigned_char"].pack(value)
     data.write(bytes_data)
 
 
-def write_bool(data, value):
+def write_bool(data, value, byteorder="native"):
     """
     Write 1 byte of data as `bool` type.
 
@@ -84,13 +90,14 @@ def write_bool(data, value):
         File open to write in binary mode
     value : bool
         True or False
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("bool")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["bool"].pack(value)
     data.write(bytes_data)
 
 
-def write_short(data, value):
+def write_short(data, value, byteorder="native"):
     """
     Write 2 bytes of data as `short`.
 
@@ -100,13 +107,14 @@ def write_short(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("short")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["short"].pack(value)
     data.write(bytes_data)
 
 
-def write_unsigned_short(data, value):
+def write_unsigned_short(data, value, byteorder="native"):
     """
     Write 2 bytes of data as `unsigned short`.
 
@@ -116,13 +124,14 @@ def write_unsigned_short(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("unsigned_short")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["unsigned_short"].pack(value)
     data.write(bytes_data)
 
 
-def write_int(data, value):
+def write_int(data, value, byteorder="native"):
     """
     Write 4 bytes of data as `int`.
 
@@ -132,13 +141,14 @@ def write_int(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("int")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["int"].pack(value)
     data.write(bytes_data)
 
 
-def write_unsigned_int(data, value):
+def write_unsigned_int(data, value, byteorder="native"):
     """
     Write 4 bytes of data as `unsigned int`.
 
@@ -148,13 +158,14 @@ def write_unsigned_int(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("unsigned_int")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["unsigned_int"].pack(value)
     data.write(bytes_data)
 
 
-def write_long(data, value):
+def write_long(data, value, byteorder="native"):
     """
     Write 4 bytes of data as `long`.
 
@@ -166,13 +177,14 @@ def write_long(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("long")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["long"].pack(value)
     data.write(bytes_data)
 
 
-def write_unsigned_long(data, value):
+def write_unsigned_long(data, value, byteorder="native"):
     """
     Write 4 bytes of data as `unsigned long`.
 
@@ -184,13 +196,14 @@ def write_unsigned_long(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("unsigned_long")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["unsigned_long"].pack(value)
     data.write(bytes_data)
 
 
-def write_long_long(data, value):
+def write_long_long(data, value, byteorder="native"):
     """
     Write 8 bytes of data as `long long`.
 
@@ -200,13 +213,14 @@ def write_long_long(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("long_long")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["long_long"].pack(value)
     data.write(bytes_data)
 
 
-def write_unsigned_long_long(data, value):
+def write_unsigned_long_long(data, value, byteorder="native"):
     """
     Write 8 bytes of data as `unsigned long long`.
 
@@ -216,13 +230,14 @@ def write_unsigned_long_long(data, value):
         File open to write in binary mode
     value : int
         Python integer
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("unsigned_long_long")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["unsigned_long_long"].pack(value)
     data.write(bytes_data)
 
 
-def write_float(data, value):
+def write_float(data, value, byteorder="native"):
     """
     Write 4 bytes of data as `float`.
 
@@ -232,13 +247,14 @@ def write_float(data, value):
         File open to write in binary mode
     value : float
         Python float
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("float")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["float"].pack(value)
     data.write(bytes_data)
 
 
-def write_double(data, value):
+def write_double(data, value, byteorder="native"):
     """
     Write 8 bytes of data as `double`.
 
@@ -248,9 +264,10 @@ def write_double(data, value):
         File open to write in binary mode
     value : float
         Python float
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
     """
-    s_type = "=%s" % get_type("double")
-    bytes_data = struct.pack(s_type, value)
+    bytes_data = STRUCTS[byteorder]["double"].pack(value)
     data.write(bytes_data)
 
 
@@ -265,25 +282,128 @@ def write_string(data, value):
     value : str
         Python string
     """
-    s_type = "=%ds" % len(value)
-    bytes_data = struct.pack(s_type, value.encode("utf-8"))
-    data.write(bytes_data)
+    # Like packing "%ds" % len(value), the encoded string is cut to len(value)
+    data.write(value.encode("utf-8")[:len(value)])
 
 
-def write_array(data, values, c_type):
+def write_array(data, values, c_type, byteorder="native", chunk_size=65536):
     """
     Write a list of elements, each of type `c_type`.
 
+    Iterables without a length (e.g. generators) and sequences longer than
+    `chunk_size` are packed and written `chunk_size` elements at a time, so
+    memory usage is bounded by the chunk size rather than the array size.
+
     Parameters
     ----------
     data : io.BufferedWriter
         File open to write in binary mode
-    values : list | tuple
-        Python iterable object
+    values : list | tuple | iterable | bytes-like | numpy.ndarray
+        Python iterable object. Objects supporting the buffer protocol
+        (`bytes`, `array.array`, `memoryview`, NumPy arrays...) with items
+        of the same kind and size as `c_type` are written from their memory
+        buffer as is, byte-swapped only if needed. NumPy arrays of other
+        numeric dtypes are converted to the dtype matching `c_type` first,
+        if no value is lost (e.g. no float to integer conversion or
+        overflow), other NumPy arrays are packed like lists
     c_type : str
         C-language type string (e.g. "unsigned_int")
-    """
-    s_type = get_type(c_type)
-    format_string = "=%d%s" % (len(values), s_type)  # 10i --> write 10 int's
-    bytes_data = struct.pack(format_string, *values)
-    data.write(bytes_data)
+    byteorder : str
+        Byte order name: "native", "little", "big" or "network"
+    chunk_size : int
+        Number of elements to pack and write at once
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive, got %d" % chunk_size)
+
+    if not isinstance(values, (list, tuple)):
+        try:
+            view = memoryview(values)
+        except TypeError:  # not a buffer, e.g. a generator
+            view = None
+
+        if view is not None:
+            if numpy is not None and isinstance(values, numpy.ndarray) and \
+                    get_buffer_byteorder(view, c_type) is None:
+                # Numeric arrays are converted, others (e.g. of objects) are
+                # packed like a list
+                view = None
+                if values.dtype.kind in "biufS":
+                    view = memoryview(_cast_ndarray(values, c_type, byteorder))
+            if view is not None and \
+                    get_buffer_byteorder(view, c_type) is not None:
+                _write_buffer(data, view, c_type, byteorder, chunk_size)
+                return
+
+    if hasattr(values, "__len__") and len(values) <= chunk_size:
+        codec = get_array_struct(len(values), c_type, byteorder)
+        bytes_data = codec.pack(*values)
+        data.write(bytes_data)
+        return
+
+    codec = get_array_struct(chunk_size, c_type, byteorder)
+    bytes_data = bytearray(codec.size)  # reused for every whole chunk
+    values = iter(values)
+
+    while True:
+        chunk = tuple(itertools.islice(values, chunk_size))
+        if len(chunk) < chunk_size:
+            break
+        codec.pack_into(bytes_data, 0, *chunk)
+        data.write(bytes_data)
+
+    if chunk:
+        data.write(
+            get_array_struct(len(chunk), c_type, byteorder).pack(*chunk))
+
+
+def _cast_ndarray(values, c_type, byteorder):
+    """
+    Convert a NumPy array to the dtype of `c_type` without losing values.
+
+    Raises
+    ------
+    struct.error
+        If the values are not of the same kind as `c_type` (e.g. floats
+        written as integers) or do not fit in it, like packing them would
+    """
+    dtype = get_dtype(c_type, byteorder)
+    # Signed and unsigned integers convert both ways, checked by range below
+    integers = dtype.kind in "iu" and values.dtype.kind in "iu"
+    if not (integers or
+            numpy.can_cast(values.dtype, dtype, casting="same_kind")) or (
+                dtype.kind == "S" and values.dtype.itemsize > dtype.itemsize):
+        raise struct.error("cannot write %s values as %r without losing "
+                           "data" % (values.dtype, c_type))
+
+    if values.size and integers:
+        info = numpy.iinfo(dtype)
+        if int(values.min()) < info.min or int(values.max()) > info.max:
+            raise struct.error("%r format requires %d <= number <= %d" %
+                               (c_type, info.min, info.max))
+    elif values.size and dtype.kind == "f" and values.dtype.kind == "f":
+        finite = values[numpy.isfinite(values)]
+        if finite.size and numpy.abs(finite).max() > numpy.finfo(dtype).max:
+            raise struct.error("float too large to pack as %r" % c_type)
+
+    return numpy.ascontiguousarray(values, dtype=dtype)
+
+
+def _write_buffer(data, view, c_type, byteorder, chunk_size):
+    """Write a buffer of `c_type` values, byte-swapping it if needed."""
+    itemsize = STRUCTS["native"][c_type].size
+    swap = itemsize > 1 and get_buffer_byteorder(
+        view, c_type) != resolve_byteorder(byteorder)
+    view = view.cast("B")
+
+    if not swap:
+        data.write(view)
+        return
+
+    # Swap a bounded copy at a time rather than the whole buffer
+    chunk_bytes = chunk_size * itemsize
+    for start in range(0, view.nbytes, chunk_bytes):
+        chunk = array.array(ARRAY_TYPECODES[c_type])
+        chunk.frombytes(view[start:start + chunk_bytes])
+        chunk.byteswap()
+        data.write(chunk)
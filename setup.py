@@ -23,4 +23,5 @@ setuptools.setup(
         "Programming Language :: Python :: 3",
     ],
     python_requires=">=3.6",
+    extras_require={"numpy": ["numpy"]},
 )
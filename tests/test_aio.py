@@ -0,0 +1,161 @@
+"""Test asyncio read/write functions over socket pairs."""
+
+import array
+import asyncio
+import random
+import socket
+
+import pytest
+
+from byter import Schema, aio
+
+NUMBER_ENTRIES = 10000
+
+VALUES = [
+    ("char", b"x"),
+    ("signed_char", -5),
+    ("unsigned_char", 200),
+    ("bool", True),
+    ("short", -30000),
+    ("unsigned_short", 65000),
+    ("int", -2**31),
+    ("unsigned_int", 2**32 - 1),
+    ("long", 2**31 - 1),
+    ("unsigned_long", 2**31),
+    ("long_long", -2**62),
+    ("unsigned_long_long", 2**63),
+    ("float", 1.5),
+    ("double", 1e300),
+]
+
+
+async def __transfer(write, read):
+    """Run `write(writer)` and `read(reader)` concurrently over a socket."""
+    read_socket, write_socket = socket.socketpair()
+    reader, reader_side = await asyncio.open_connection(sock=read_socket)
+    _, writer = await asyncio.open_connection(sock=write_socket)
+
+    async def write_and_close():
+        await write(writer)
+        writer.close()
+        await writer.wait_closed()
+
+    _, result = await asyncio.gather(write_and_close(), read(reader))
+
+    reader_side.close()
+    await reader_side.wait_closed()
+    return result
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_aio_values(byteorder):
+    """Test aio [write|read]_* functions."""
+    write_values = [
+        random.choice(range(-1 * (2**31), 2**31))
+        for _ in range(NUMBER_ENTRIES)
+    ]
+
+    async def write(writer):
+        for c_type, value in VALUES:
+            await getattr(aio, "write_" + c_type)(writer,
+                                                  value,
+                                                  byteorder,
+                                                  drain=False)
+        await aio.write_string(writer, "Hello World!")
+        for value in write_values:
+            await aio.write_int(writer, value, byteorder)
+        await aio.write_array(writer, write_values, "int", byteorder)
+        await aio.write_array(writer, array.array("i", write_values), "int",
+                              byteorder)
+
+    async def read(reader):
+        for c_type, value in VALUES:
+            assert await getattr(aio, "read_" + c_type)(reader,
+                                                        byteorder) == value
+        assert await aio.read_string(reader, 12) == "Hello World!"
+        read_values = [
+            await aio.read_int(reader, byteorder)
+            for _ in range(NUMBER_ENTRIES)
+        ]
+        assert read_values == write_values
+        assert await aio.read_array(reader, NUMBER_ENTRIES, "int",
+                                    byteorder) == write_values
+        assert await aio.read_array(reader,
+                                    NUMBER_ENTRIES,
+                                    "int",
+                                    byteorder,
+                                    as_array=True) == array.array(
+                                        "i", write_values)
+        return await reader.read()
+
+    assert asyncio.run(__transfer(write, read)) == b""
+
+
+def test_aio_records():
+    """Test aio [write|read]_record[s] functions."""
+    schema = Schema([("year", "short"), ("text", ("char[]", 5)),
+                     ("width", "double")],
+                    byteorder="network")
+    write_values = [(random.choice(range(-32768, 32768)), "%05d" % index,
+                     random.uniform(-1 * (2**63), 2**63))
+                    for index in range(NUMBER_ENTRIES)]
+
+    async def write(writer):
+        await aio.write_record(writer, schema, write_values[0])
+        await aio.write_records(writer,
+                                schema,
+                                write_values[1:],
+                                batch_size=1000)
+        await aio.write_records(writer, schema, write_values)
+
+    async def read(reader):
+        record = await aio.read_record(reader, schema)
+        assert tuple(record.values()) == write_values[0]
+        assert await aio.read_records(reader, schema,
+                                      NUMBER_ENTRIES - 1) == write_values[1:]
+        columns = await aio.read_records(reader,
+                                         schema,
+                                         NUMBER_ENTRIES,
+                                         columns=True)
+        assert list(columns["year"]) == [value[0] for value in write_values]
+
+        with pytest.raises(asyncio.IncompleteReadError):
+            await aio.read_int(reader)
+
+    asyncio.run(__transfer(write, read))
+
+
+class __RecordingStream:
+    """Stream writer recording the sizes of the writes between drains."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.events = []
+
+    def write(self, data):
+        self.data += data
+        self.events.append(len(data))
+
+    async def drain(self):
+        self.events.append("drain")
+
+
+def test_aio_write_array_chunks():
+    """Test that aio.write_array drains after every chunk."""
+    values = list(range(10))
+    expected = array.array("i", values).tobytes()
+
+    for data in (values, iter(values), array.array("i", values)):
+        stream = __RecordingStream()
+        asyncio.run(aio.write_array(stream, data, "int", chunk_size=4))
+        assert stream.data == expected
+        assert stream.events == [16, "drain", 16, "drain", 8, "drain"]
+
+    stream = __RecordingStream()
+    asyncio.run(aio.write_array(stream, values, "int", "big", 4, False))
+    assert stream.data == array.array("i", values[::-1]).tobytes()[::-1]
+    assert "drain" not in stream.events
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            aio.write_array(__RecordingStream(), values, "int", chunk_size=0))
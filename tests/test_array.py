@@ -1,8 +1,12 @@
 """Test all possible read_array and write_array cases."""
 
+import array
 import os
 import random
 import string
+import struct
+
+import pytest
 
 from byter import *
 
@@ -292,3 +296,174 @@ def test_array_double():
         read_values = read_array(test_file, NUMBER_ENTRIES, "double")
 
     assert write_values == read_values
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_array_module(byteorder):
+    """Test [write|read]_array functions with `array.array` values."""
+    __delete_testfile()
+
+    write_values = array.array("i", [
+        random.choice(range(-1 * (2**31), 2**31))
+        for _ in range(NUMBER_ENTRIES)
+    ])
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, write_values, "int", byteorder)
+        write_array(test_file, write_values.tolist(), "int", byteorder)
+
+    with open(TEST_FILE, "rb") as test_file:
+        read_values = read_array(test_file,
+                                 NUMBER_ENTRIES,
+                                 "int",
+                                 byteorder,
+                                 as_array=True)
+        list_values = read_array(test_file, NUMBER_ENTRIES, "int", byteorder)
+
+    assert isinstance(read_values, array.array)
+    assert write_values == read_values
+    assert write_values.tolist() == list_values
+
+
+def test_array_module_typecodes():
+    """Test that `as_array` maps C types to typecodes of the same size."""
+    __delete_testfile()
+
+    c_types = [
+        "signed_char", "unsigned_char", "short", "unsigned_short", "int",
+        "unsigned_int", "long", "unsigned_long", "long_long",
+        "unsigned_long_long", "float", "double"
+    ]
+
+    with open(TEST_FILE, "ab") as test_file:
+        for c_type in c_types:
+            write_array(test_file, [1, 2, 3], c_type)
+
+    with open(TEST_FILE, "rb") as test_file:
+        for c_type in c_types:
+            read_values = read_array(test_file, 3, c_type, as_array=True)
+            assert read_values.tolist() == [1, 2, 3]
+
+    with open(TEST_FILE, "rb") as test_file:
+        with pytest.raises(ValueError):
+            read_array(test_file, 3, "bool", as_array=True)
+        with pytest.raises(ValueError):
+            read_array(test_file, 3, "int", as_array=True, as_numpy=True)
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_array_into(byteorder):
+    """Test read_array_into function with reusable buffers."""
+    __delete_testfile()
+
+    write_values = [
+        random.choice(range(0, 2**32)) for _ in range(NUMBER_ENTRIES)
+    ]
+
+    with open(TEST_FILE, "ab") as test_file:
+        for _ in range(3):
+            write_array(test_file, write_values, "unsigned_int", byteorder)
+
+    buffers = [
+        array.array("I", bytes(NUMBER_ENTRIES * 4)),
+        bytearray(NUMBER_ENTRIES * 4),
+        memoryview(bytearray(NUMBER_ENTRIES * 4)).cast("I"),
+    ]
+
+    with open(TEST_FILE, "rb") as test_file:
+        for buffer in buffers:
+            size = read_array_into(test_file, buffer, "unsigned_int",
+                                   byteorder)
+            assert size == NUMBER_ENTRIES
+            assert memoryview(buffer).cast("B").cast("I").tolist() == \
+                write_values
+
+
+def test_array_into_invalid():
+    """Test read_array_into function with unsuitable buffers."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, [1, 2, 3], "int")
+
+    with open(TEST_FILE, "rb") as test_file:
+        with pytest.raises(ValueError):
+            read_array_into(test_file, bytearray(6), "int")
+        with pytest.raises(ValueError):
+            read_array_into(test_file, array.array("h", [0, 0]), "int")
+        with pytest.raises(ValueError):
+            read_array_into(test_file, array.array("f", [0] * 3), "int")
+        with pytest.raises(struct.error):
+            read_array_into(test_file, array.array("i", [0] * 4), "int")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 999, 1000, NUMBER_ENTRIES * 2])
+def test_array_stream(chunk_size):
+    """Test write_array function with generators and chunked sequences."""
+    __delete_testfile()
+
+    write_values = [
+        random.choice(range(-32768, 32768)) for _ in range(NUMBER_ENTRIES)
+    ]
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, (value for value in write_values),
+                    "short",
+                    chunk_size=chunk_size)
+        write_array(test_file,
+                    write_values,
+                    "short",
+                    "big",
+                    chunk_size=chunk_size)
+        write_array(test_file, iter([]), "short", chunk_size=chunk_size)
+
+    with open(TEST_FILE, "rb") as test_file:
+        assert read_array(test_file, NUMBER_ENTRIES, "short") == write_values
+        assert read_array(test_file, NUMBER_ENTRIES, "short",
+                          "big") == write_values
+        assert test_file.read() == b""
+
+    with open(TEST_FILE, "ab") as test_file:
+        with pytest.raises(ValueError):
+            write_array(test_file, iter([1]), "short", chunk_size=0)
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_array_buffers(byteorder):
+    """Test write_array function with buffer protocol objects."""
+    __delete_testfile()
+
+    write_values = [
+        random.choice(range(0, 2**63 - 1)) for _ in range(NUMBER_ENTRIES)
+    ]
+    buffer = array.array("Q", write_values)
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, buffer, "unsigned_long_long", byteorder)
+        write_array(test_file,
+                    memoryview(buffer),
+                    "unsigned_long_long",
+                    byteorder,
+                    chunk_size=999)
+        write_array(test_file, b"abc", "char", byteorder)
+        write_array(test_file, bytearray(b"\x01\x02"), "unsigned_char")
+
+    with open(TEST_FILE, "rb") as test_file:
+        for _ in range(2):
+            assert read_array(test_file, NUMBER_ENTRIES, "unsigned_long_long",
+                              byteorder) == write_values
+        assert read_array(test_file, 3, "char") == [b"a", b"b", b"c"]
+        assert read_array(test_file, 2, "unsigned_char") == [1, 2]
+
+
+def test_array_buffers_mismatch():
+    """Test write_array function with buffers of a different type."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, array.array("B", [1, 2]), "int")
+        write_array(test_file, array.array("h", [3, 4]), "int")
+        write_array(test_file, b"\x05\x06", "int")
+
+    with open(TEST_FILE, "rb") as test_file:
+        assert read_array(test_file, 6, "int") == [1, 2, 3, 4, 5, 6]
@@ -0,0 +1,92 @@
+"""Test reading and writing with an explicit byte order."""
+
+import os
+import struct
+
+import pytest
+
+from byter import *
+
+TEST_FILE = "./tests/testfile.byter"
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+def test_byteorder_layout():
+    """Test that `byteorder` controls the layout of written bytes."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_int(test_file, 1, byteorder="little")
+        write_int(test_file, 1, byteorder="big")
+        write_unsigned_short(test_file, 258, byteorder="network")
+
+    with open(TEST_FILE, "rb") as test_file:
+        assert test_file.read() == b"\x01\x00\x00\x00\x00\x00\x00\x01\x01\x02"
+
+
+def test_byteorder_roundtrip():
+    """Test [write|read]_* functions with every byte order."""
+    __delete_testfile()
+
+    byteorders = ["native", "little", "big", "network"]
+
+    with open(TEST_FILE, "ab") as test_file:
+        for byteorder in byteorders:
+            write_long_long(test_file, -2**40, byteorder=byteorder)
+            write_double(test_file, 1280.5, byteorder=byteorder)
+            write_array(test_file, [13, 4, 16], "unsigned_short", byteorder)
+
+    with open(TEST_FILE, "rb") as test_file:
+        for byteorder in byteorders:
+            assert read_long_long(test_file, byteorder=byteorder) == -2**40
+            assert read_double(test_file, byteorder=byteorder) == 1280.5
+            assert read_array(test_file, 3, "unsigned_short",
+                              byteorder) == [13, 4, 16]
+
+
+def test_byteorder_mismatch():
+    """Test that reading with a different byte order swaps the bytes."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_unsigned_int(test_file, 1, byteorder="big")
+
+    with open(TEST_FILE, "rb") as test_file:
+        assert read_unsigned_int(test_file, byteorder="little") == 2**24
+
+
+def test_byteorder_unknown():
+    """Test that an unknown byte order raises a ValueError."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        with pytest.raises(ValueError):
+            write_int(test_file, 1, byteorder="middle")
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_int(test_file, 1)
+
+    with open(TEST_FILE, "rb") as test_file:
+        with pytest.raises(ValueError):
+            read_int(test_file, byteorder="middle")
+
+
+def test_short_read():
+    """Test that a truncated value raises a `struct.error`."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_short(test_file, 1)
+
+    with open(TEST_FILE, "rb") as test_file:
+        with pytest.raises(struct.error):
+            read_int(test_file)
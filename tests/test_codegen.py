@@ -0,0 +1,160 @@
+"""Test code-generated record decoders."""
+
+import collections
+import dataclasses
+import pickle
+import random
+
+import pytest
+
+from byter import *
+
+NUMBER_ENTRIES = 1000
+
+HEADER_FIELDS = [
+    ("has_data", "bool"),
+    ("year", "short"),
+    ("month", "short"),
+    ("width", "float"),
+    ("height", "float"),
+    ("text", ("char[]", 12)),
+    ("array", ("unsigned_short", 3)),
+]
+
+Header = collections.namedtuple("Header", [name for name, _ in HEADER_FIELDS])
+
+
+class SlotsHeader:
+    """Header with `__slots__`."""
+
+    __slots__ = tuple(name for name, _ in HEADER_FIELDS)
+
+
+@dataclasses.dataclass
+class DataHeader:
+    """Header dataclass."""
+
+    has_data: bool
+    year: int
+    month: int
+    width: float
+    height: float
+    text: str
+    array: list
+
+
+def __random_records(count):
+    """Generate `count` random header records."""
+    return [(random.choice([True, False]), random.choice(range(1900, 2100)),
+             random.choice(range(1, 13)), 0.5, 1280.0, "Hello World%d" %
+             random.choice(range(10)),
+             [random.choice(range(2**16)) for _ in range(3)])
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize("byteorder", ["native", "big"])
+def test_decoder_namedtuple(byteorder):
+    """Test decoding records into namedtuples."""
+    schema = Schema(HEADER_FIELDS, byteorder=byteorder)
+    records = __random_records(NUMBER_ENTRIES)
+    buffer = b"".join(schema.pack(record) for record in records)
+
+    decode = compile_decoder(schema)
+    assert decode.record_class._fields == schema.names
+
+    for index, record in enumerate(records):
+        decoded = decode(buffer, index * schema.size)
+        assert tuple(decoded) == record
+        assert decoded.year == record[1]
+
+    assert [tuple(record) for record in decode.iter_decode(buffer)] == records
+
+    decode = compile_decoder(schema, Header)
+    assert decode(buffer) == Header(*records[0])
+    assert list(
+        decode.iter_decode(buffer)) == [Header(*record) for record in records]
+
+
+def test_decoder_classes():
+    """Test decoding records into slots classes and dataclasses."""
+    schema = Schema(HEADER_FIELDS)
+    records = __random_records(NUMBER_ENTRIES)
+    buffer = b"".join(schema.pack(record) for record in records)
+
+    decoded = list(compile_decoder(schema, SlotsHeader).iter_decode(buffer))
+    assert all(isinstance(record, SlotsHeader) for record in decoded)
+    assert [
+        tuple(getattr(record, name) for name in schema.names)
+        for record in decoded
+    ] == records
+
+    decode = compile_decoder(schema, DataHeader)
+    assert decode(buffer, schema.size) == DataHeader(*records[1])
+
+
+def test_decoder_converters():
+    """Test post-processing field values inline."""
+    schema = Schema([("year", "short"), ("text", ("char[]", 5))])
+    buffer = schema.pack((2019, "hello")) + schema.pack((2020, "world"))
+
+    decode = compile_decoder(schema,
+                             converters={
+                                 "text": str.upper,
+                                 "year": lambda year: year - 2000
+                             })
+    assert tuple(decode(buffer)) == (19, "HELLO")
+    assert [tuple(record)
+            for record in decode.iter_decode(buffer)] == [(19, "HELLO"),
+                                                          (20, "WORLD")]
+
+
+def test_decoder_c_names():
+    """Test fields of nested C structs, mapped to identifiers."""
+    schema = Schema.from_c("""
+        struct point { short x; short y; };
+        struct shape {
+            struct point in;
+            struct point pts[2];
+            char names[2][4];
+        };
+    """)
+    buffer = schema.pack((1, 2, 3, 4, 5, 6, "ab\0\0", "cd\0\0"))
+
+    decode = compile_decoder(schema, converters={"pts[1].y": lambda y: -y})
+    record = decode(buffer)
+    assert record._fields == ("in_x", "in_y", "pts_0_x", "pts_0_y", "pts_1_x",
+                              "pts_1_y", "names_0", "names_1")
+    assert (record.in_x, record.pts_1_x, record.pts_1_y) == (1, 5, -6)
+    assert record.names_1 == "cd\0\0"
+
+    with pytest.raises(ValueError):
+        compile_decoder(Schema([("a.b", "int"), ("a_b", "int")]))
+
+
+def test_decoder_cache():
+    """Test that decoders are compiled once per schema."""
+    decode = compile_decoder(Schema(HEADER_FIELDS))
+
+    assert Schema(HEADER_FIELDS) == pickle.loads(
+        pickle.dumps(Schema(HEADER_FIELDS)))
+    assert compile_decoder(Schema(HEADER_FIELDS)) is decode
+    assert compile_decoder(Schema(HEADER_FIELDS, "big")) is not decode
+    assert compile_decoder(Schema(HEADER_FIELDS), Header) is not decode
+
+
+def test_decoder_errors():
+    """Test decoder compilation errors."""
+    schema = Schema(HEADER_FIELDS)
+
+    with pytest.raises(ValueError):
+        compile_decoder(schema, collections.namedtuple("Header", "year text"))
+    with pytest.raises(ValueError):
+        compile_decoder(schema, converters={"unknown": int})
+    with pytest.raises(ValueError):
+        compile_decoder(Schema([("class", "int")]))
+
+    class Slots:
+        __slots__ = ("year", )
+
+    with pytest.raises(ValueError):
+        compile_decoder(schema, Slots)
@@ -0,0 +1,151 @@
+"""Test reading compressed files with byter.open."""
+
+import array
+import bz2
+import gzip
+import io
+import lzma
+import os
+import random
+import zlib
+
+import pytest
+
+import byter
+from byter import *
+
+TEST_FILE = "./tests/testfile.byter"
+NUMBER_ENTRIES = 10000
+
+COMPRESSORS = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+    "zlib": zlib.compress,
+}
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+def __write_values(byteorder):
+    """Write a string, `int` values and an array of `double` to bytes."""
+    values = [
+        random.choice(range(-1 * (2**31), 2**31))
+        for _ in range(NUMBER_ENTRIES)
+    ]
+    doubles = [random.uniform(-1000, 1000) for _ in range(NUMBER_ENTRIES)]
+
+    data = io.BytesIO()
+    write_string(data, "Hello World!")
+    for value in values:
+        write_int(data, value, byteorder)
+    write_array(data, doubles, "double", byteorder)
+    return data.getvalue(), values, doubles
+
+
+@pytest.mark.parametrize("compression", sorted(COMPRESSORS))
+@pytest.mark.parametrize("byteorder", ["native", "big"])
+@pytest.mark.parametrize("block_size", [7, 4096, byter.compression.BLOCK_SIZE])
+def test_open_compressed(compression, byteorder, block_size):
+    """Test reading values from compressed files with detection."""
+    __delete_testfile()
+    raw_data, values, doubles = __write_values(byteorder)
+
+    with open(TEST_FILE, "wb") as test_file:
+        test_file.write(COMPRESSORS[compression](raw_data))
+
+    # zlib streams have no magic number to detect
+    modes = [compression] if compression == "zlib" else ["auto", compression]
+    for mode in modes:
+        with byter.open(TEST_FILE, mode, block_size=block_size) as data:
+            assert read_string(data, 12) == "Hello World!"
+            assert [read_int(data, byteorder)
+                    for _ in range(NUMBER_ENTRIES)] == values
+            assert read_array(data,
+                              NUMBER_ENTRIES,
+                              "double",
+                              byteorder,
+                              as_array=True) == array.array("d", doubles)
+            assert data.read() == b""
+
+
+def test_open_concatenated_streams():
+    """Test reading multi-member gzip and concatenated bz2/xz files."""
+    __delete_testfile()
+    raw_data = os.urandom(100000)
+    parts = [raw_data[:10], raw_data[10:60000], raw_data[60000:]]
+
+    for compression in ("gzip", "bz2", "xz"):
+        compress = COMPRESSORS[compression]
+        with open(TEST_FILE, "wb") as test_file:
+            for part in parts:
+                test_file.write(compress(part))
+
+        with byter.open(TEST_FILE, block_size=1000) as data:
+            assert data.read() == raw_data
+
+
+def test_open_file_objects():
+    """Test reading compressed and uncompressed file objects."""
+    raw_data = bytes(range(256)) * 100
+
+    compressed = io.BytesIO(gzip.compress(raw_data))
+    with byter.open(compressed) as data:
+        assert read_array(data, len(raw_data),
+                          "unsigned_char") == list(raw_data)
+    assert not compressed.closed
+
+    # Uncompressed files are returned as they are, with nothing consumed
+    uncompressed = io.BytesIO(raw_data)
+    assert byter.open(uncompressed) is uncompressed
+    assert uncompressed.read() == raw_data
+
+    assert byter.open(io.BytesIO(zlib.compress(raw_data)),
+                      None).read() == zlib.compress(raw_data)
+
+
+def test_open_invalid():
+    """Test errors on unknown compressions and truncated files."""
+    __delete_testfile()
+    with open(TEST_FILE, "wb") as test_file:
+        test_file.write(gzip.compress(os.urandom(10000))[:-100])
+
+    with pytest.raises(ValueError):
+        byter.open(TEST_FILE, "zip")
+
+    with byter.open(TEST_FILE) as data:
+        with pytest.raises(EOFError):
+            data.read()
+
+
+def test_detect_compression():
+    """Test detecting compressions from magic numbers."""
+    raw_data = b"Hello World!"
+    for compression in ("gzip", "bz2", "xz"):
+        compress = COMPRESSORS[compression]
+        assert detect_compression(compress(raw_data)) == compression
+    assert detect_compression(zlib.compress(raw_data)) is None
+
+    assert detect_compression(raw_data) is None
+    assert detect_compression(b"") is None
+    assert "open" not in byter.__all__
+
+
+def test_open_uncompressed_zlib_like():
+    """Test that files starting like a zlib header are read as they are."""
+    __delete_testfile()
+    with open(TEST_FILE, "wb") as test_file:
+        write_int(test_file, 376, "little")  # 78 01: a valid zlib header
+        write_int(test_file, 2019, "little")
+
+    with byter.open(TEST_FILE) as data:
+        assert read_int(data, "little") == 376
+        assert read_int(data, "little") == 2019
@@ -0,0 +1,130 @@
+"""Test in-memory BufferCursor and BufferWriter."""
+
+import array
+import io
+import random
+import struct
+
+import pytest
+
+from byter import *
+
+NUMBER_ENTRIES = 10000
+
+VALUES = [
+    ("char", b"x"),
+    ("signed_char", -5),
+    ("unsigned_char", 200),
+    ("bool", True),
+    ("short", -30000),
+    ("unsigned_short", 65000),
+    ("int", -2**31),
+    ("unsigned_int", 2**32 - 1),
+    ("long", 2**31 - 1),
+    ("unsigned_long", 2**31),
+    ("long_long", -2**62),
+    ("unsigned_long_long", 2**63),
+    ("float", 1.5),
+    ("double", 1e300),
+]
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_cursor_matches_functions(byteorder):
+    """Test that cursors encode and decode the same bytes as functions."""
+    data = io.BytesIO()
+    writer = BufferWriter(byteorder=byteorder)
+
+    for c_type, value in VALUES:
+        globals()["write_" + c_type](data, value, byteorder)
+        getattr(writer, "write_" + c_type)(value)
+    write_string(data, "Hello World!")
+    writer.write_string("Hello World!")
+    write_array(data, [13, 4, 16], "unsigned_short", byteorder)
+    writer.write_array([13, 4, 16], "unsigned_short")
+
+    assert writer.getvalue() == data.getvalue()
+    assert writer.offset == len(data.getvalue())
+
+    cursor = BufferCursor(data.getvalue(), byteorder=byteorder)
+
+    for c_type, value in VALUES:
+        assert getattr(cursor, "read_" + c_type)() == value
+    assert cursor.read_string(12) == "Hello World!"
+    assert cursor.read_array(3, "unsigned_short") == [13, 4, 16]
+    assert cursor.offset == len(data.getvalue())
+
+
+def test_cursor_arrays():
+    """Test BufferCursor.read_array in every mode."""
+    write_values = [
+        random.choice(range(-1 * (2**31), 2**31))
+        for _ in range(NUMBER_ENTRIES)
+    ]
+
+    writer = BufferWriter(byteorder="big")
+    for _ in range(2):
+        writer.write_array(write_values, "int")
+
+    cursor = BufferCursor(bytearray(writer.getvalue()), byteorder="big")
+    assert cursor.read_array(NUMBER_ENTRIES, "int") == write_values
+    assert cursor.read_array(NUMBER_ENTRIES, "int",
+                             as_array=True) == array.array("i", write_values)
+
+    with pytest.raises(struct.error):
+        cursor.read_array(1, "int", as_array=True)
+
+
+def test_cursor_bounds():
+    """Test that reads past the end of the buffer raise a `struct.error`."""
+    cursor = BufferCursor(b"\x01\x02\x03", offset=1)
+
+    with pytest.raises(struct.error):
+        cursor.read_int()
+    with pytest.raises(struct.error):
+        cursor.read_string(3)
+
+    assert cursor.offset == 1
+    assert cursor.read_unsigned_short() == struct.unpack("=H", b"\x02\x03")[0]
+
+    with pytest.raises(struct.error):
+        BufferCursor(b"\x01\x02\x03\x04", offset=-4)
+    with pytest.raises(struct.error):
+        BufferWriter(bytearray(4), offset=-4)
+
+
+def test_writer_fixed_buffer():
+    """Test BufferWriter over a preallocated fixed-size buffer."""
+    buffer = memoryview(bytearray(6))
+    writer = BufferWriter(buffer, offset=2, byteorder="little")
+
+    writer.write_int(1)
+    assert bytes(buffer) == b"\x00\x00\x01\x00\x00\x00"
+
+    with pytest.raises(struct.error):
+        writer.write_short(1)
+
+
+def test_writer_failed_write():
+    """Test that a value failing to pack is not partially written."""
+    writer = BufferWriter(byteorder="little")
+    writer.write_int(1)
+
+    with pytest.raises(struct.error):
+        writer.write_int(2**40)
+    with pytest.raises(struct.error):
+        writer.write_array([1, 2**40], "int")
+
+    writer.write_short(2)
+    assert writer.getvalue() == b"\x01\x00\x00\x00\x02\x00"
+
+
+def test_writer_string_matches_function():
+    """Test BufferWriter.write_string against byter.write_string."""
+    data = io.BytesIO()
+    writer = BufferWriter()
+    for value in ("héllo", "Hello World!", ""):
+        write_string(data, value)
+        writer.write_string(value)
+
+    assert writer.getvalue() == data.getvalue()
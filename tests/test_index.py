@@ -0,0 +1,198 @@
+"""Test variable-length record offset index."""
+
+import os
+import random
+import struct
+
+import pytest
+
+from byter import *
+
+TEST_FILE = "./tests/testfile.byter"
+INDEX_FILE = TEST_FILE + ".idx"
+NUMBER_ENTRIES = 1000
+
+
+def __delete_testfile():
+    """
+    Delete the files at paths `TEST_FILE` and `INDEX_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    for path in (TEST_FILE, INDEX_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def __read_record(data):
+    """Read a `short` year and an `int`-prefixed string."""
+    return read_short(data), read_string(data, read_int(data))
+
+
+def __write_records():
+    """Write `NUMBER_ENTRIES` variable-length records after a header."""
+    records = [(random.choice(range(1900,
+                                    2100)), "x" * random.choice(range(0, 100)))
+               for _ in range(NUMBER_ENTRIES)]
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_string(test_file, "HEADER")
+        for year, text in records:
+            write_short(test_file, year)
+            write_int(test_file, len(text))
+            write_string(test_file, text)
+
+    return records
+
+
+def test_index_read_record():
+    """Test IndexedReader with a record reading function."""
+    __delete_testfile()
+    records = __write_records()
+
+    offsets = build_index(TEST_FILE, __read_record, offset=6)
+    assert len(offsets) == NUMBER_ENTRIES + 1
+    assert offsets[0] == 6
+    assert offsets[-1] == os.path.getsize(TEST_FILE)
+
+    with IndexedReader(TEST_FILE, __read_record, offset=6) as reader:
+        assert len(reader) == NUMBER_ENTRIES
+        assert reader.offsets.tolist() == offsets.tolist()
+
+        for index in random.sample(range(NUMBER_ENTRIES), 100):
+            assert reader[index] == records[index]
+        assert reader[-1] == records[-1]
+
+        assert reader.seek_record(1) == offsets[1]
+        assert read_short(reader.data) == records[1][0]
+
+        with pytest.raises(IndexError):
+            reader.seek_record(NUMBER_ENTRIES)
+
+    __delete_testfile()
+
+
+def test_index_length_prefix():
+    """Test IndexedReader with a length prefix rule."""
+    __delete_testfile()
+
+    payloads = [
+        bytes(random.choice(range(256)) for _ in range(size))
+        for size in random.choices(range(0, 50), k=NUMBER_ENTRIES)
+    ]
+
+    with open(TEST_FILE, "ab") as test_file:
+        for payload in payloads:
+            write_unsigned_short(test_file, len(payload), "big")
+            test_file.write(payload)
+
+    with IndexedReader(TEST_FILE,
+                       length_type="unsigned_short",
+                       byteorder="big") as reader:
+        assert len(reader) == NUMBER_ENTRIES
+        assert [reader[index] for index in range(len(reader))] == payloads
+
+    __delete_testfile()
+
+
+def test_index_sidecar():
+    """Test that a saved index is reused and rebuilt when stale."""
+    __delete_testfile()
+    records = __write_records()
+
+    build_index(TEST_FILE, __read_record, offset=6)
+    index_id = os.stat(INDEX_FILE).st_ino, os.stat(INDEX_FILE).st_mtime_ns
+
+    # An up-to-date index is loaded, not rebuilt and replaced
+    with IndexedReader(TEST_FILE, __read_record, offset=6) as reader:
+        assert len(reader) == NUMBER_ENTRIES
+        reader.seek_record(-1)
+        assert read_short(reader.data) == records[-1][0]
+    assert (os.stat(INDEX_FILE).st_ino,
+            os.stat(INDEX_FILE).st_mtime_ns) == index_id
+
+    # Appending records makes the index stale
+    with open(TEST_FILE, "ab") as test_file:
+        write_short(test_file, 2019)
+        write_int(test_file, 5)
+        write_string(test_file, "Hello")
+
+    with IndexedReader(TEST_FILE, __read_record, offset=6) as reader:
+        assert len(reader) == NUMBER_ENTRIES + 1
+        assert reader[NUMBER_ENTRIES] == (2019, "Hello")
+        assert reader[0] == records[0]
+
+    __delete_testfile()
+
+
+def test_index_parameters():
+    """Test that an index built with other parameters is rebuilt."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_string(test_file, "HEAD")
+        for payload in (b"ab", b"cdef"):
+            write_int(test_file, len(payload))
+            test_file.write(payload)
+
+    build_index(TEST_FILE, length_type="int", offset=4)
+    with IndexedReader(TEST_FILE, length_type="int", offset=4) as reader:
+        assert [reader[0], reader[1]] == [b"ab", b"cdef"]
+
+    # Rescanned with `short` prefixes, or from the start of the file, the
+    # records are invalid rather than read with the offsets of the index
+    with pytest.raises(struct.error):
+        IndexedReader(TEST_FILE, length_type="short", offset=4)
+    with pytest.raises(struct.error):
+        IndexedReader(TEST_FILE, length_type="int")
+
+    # Same offsets, but built with a `read_record` function
+    build_index(TEST_FILE, lambda data: data.read(read_int(data)), offset=4)
+    index_inode = os.stat(INDEX_FILE).st_ino
+    with IndexedReader(TEST_FILE, length_type="int", offset=4) as reader:
+        assert [reader[0], reader[1]] == [b"ab", b"cdef"]
+    assert os.stat(INDEX_FILE).st_ino != index_inode
+
+    __delete_testfile()
+
+
+def test_index_schemas():
+    """Test that indexes of one file read with two schemas are told apart."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, [1, 2, 3, 4], "int")
+
+    int_schema = Schema([("x", "int")])
+    long_long_schema = Schema([("x", "long_long")])
+
+    build_index(TEST_FILE, int_schema.read)
+    with IndexedReader(TEST_FILE, long_long_schema.read) as reader:
+        assert len(reader) == 2
+        assert reader[1] == {
+            "x": struct.unpack("=q", struct.pack("=ii", 3, 4))[0]
+        }
+
+    with IndexedReader(TEST_FILE, int_schema.read) as reader:
+        assert len(reader) == 4
+        assert reader[1] == {"x": 2}
+
+    __delete_testfile()
+
+
+def test_index_errors():
+    """Test index building errors."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_int(test_file, 10)
+        write_string(test_file, "short")
+
+    with pytest.raises(ValueError):
+        build_index(TEST_FILE)
+    with pytest.raises(ValueError):
+        build_index(TEST_FILE, __read_record, "int")
+    with pytest.raises(struct.error):
+        build_index(TEST_FILE, length_type="int")
+
+    __delete_testfile()
@@ -0,0 +1,236 @@
+"""
+Test peak memory usage of large array and string reads/writes.
+
+Every test measures the peak of memory allocated by a single call with
+`tracemalloc` and fails if it exceeds a stated multiple of the payload size.
+"""
+
+import array
+import os
+import tracemalloc
+
+import pytest
+
+from byter import *
+
+TEST_FILE = "./tests/testfile.byter"
+
+# 40 MB of `int` payload
+NUMBER_ELEMENTS = 10000000
+# Every element of a list is a separate object traced by `tracemalloc`,
+# which makes list modes slow to measure on 10M elements
+NUMBER_LIST_ELEMENTS = 1000000
+
+# Transient buffers of a fixed size (e.g. write_array chunks of 65536 values)
+# are allowed on top of the multiple of the payload size
+FIXED_ALLOWANCE = 4 << 20
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+def __write_ints(size):
+    """Write `size` consequent `int` values 0, 1, 2, ... to `TEST_FILE`."""
+    __delete_testfile()
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, array.array("i", range(size)), "int")
+    return 4 * size
+
+
+def __assert_peak(payload_size, ratio, func, *args, **kwargs):
+    """
+    Call `func` and check its peak of allocated memory.
+
+    Parameters
+    ----------
+    payload_size : int
+        Size of the data read or written (# of bytes)
+    ratio : float
+        Maximal peak of allocated memory as a multiple of `payload_size`
+
+    Returns
+    -------
+    object
+        The value returned by `func`
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    limit = ratio * payload_size + FIXED_ALLOWANCE
+    assert peak <= limit, ("peak of %d bytes exceeds %.2fx of the %d bytes "
+                           "payload" % (peak, ratio, payload_size))
+    return result
+
+
+def test_memory_read_array_list():
+    """Test peak memory of read_array returning a list."""
+    payload_size = __write_ints(NUMBER_LIST_ELEMENTS)
+
+    # The list, its items and the tuple unpacked by `struct`: 8 + 32 + 8
+    # bytes per 4-byte `int`, plus the bytes read
+    with open(TEST_FILE, "rb") as test_file:
+        values = __assert_peak(payload_size, 13, read_array, test_file,
+                               NUMBER_LIST_ELEMENTS, "int")
+
+    assert len(values) == NUMBER_LIST_ELEMENTS
+
+
+@pytest.mark.parametrize("byteorder", ["native", "big"])
+def test_memory_read_array_array(byteorder):
+    """Test peak memory of read_array returning an `array.array`."""
+    payload_size = __write_ints(NUMBER_ELEMENTS)
+
+    with open(TEST_FILE, "rb") as test_file:
+        values = __assert_peak(payload_size,
+                               1.05,
+                               read_array,
+                               test_file,
+                               NUMBER_ELEMENTS,
+                               "int",
+                               byteorder=byteorder,
+                               as_array=True)
+
+    assert len(values) == NUMBER_ELEMENTS
+
+
+def test_memory_read_array_numpy():
+    """Test peak memory of read_array returning a NumPy array."""
+    pytest.importorskip("numpy")
+    payload_size = __write_ints(NUMBER_ELEMENTS)
+
+    with open(TEST_FILE, "rb") as test_file:
+        values = __assert_peak(payload_size,
+                               1.05,
+                               read_array,
+                               test_file,
+                               NUMBER_ELEMENTS,
+                               "int",
+                               as_numpy=True)
+
+    assert values[-1] == NUMBER_ELEMENTS - 1
+
+
+def test_memory_read_array_into():
+    """Test peak memory of read_array_into a preallocated buffer."""
+    payload_size = __write_ints(NUMBER_ELEMENTS)
+    buffer = array.array("i", [0]) * NUMBER_ELEMENTS
+
+    with open(TEST_FILE, "rb") as test_file:
+        __assert_peak(payload_size, 0.05, read_array_into, test_file, buffer,
+                      "int")
+
+    assert buffer[-1] == NUMBER_ELEMENTS - 1
+
+
+def test_memory_read_array_views():
+    """Test peak memory of reading arrays from in-memory buffers."""
+    payload_size = __write_ints(NUMBER_ELEMENTS)
+
+    with MmapReader(TEST_FILE) as reader:
+        view = __assert_peak(payload_size,
+                             0.05,
+                             reader.read_array_at,
+                             0,
+                             NUMBER_ELEMENTS,
+                             "int",
+                             as_view=True)
+        assert view[-1] == NUMBER_ELEMENTS - 1
+        view.release()
+
+    with open(TEST_FILE, "rb") as test_file:
+        cursor = BufferCursor(test_file.read())
+    values = __assert_peak(payload_size,
+                           1.05,
+                           cursor.read_array,
+                           NUMBER_ELEMENTS,
+                           "int",
+                           as_array=True)
+    assert values[-1] == NUMBER_ELEMENTS - 1
+
+
+def test_memory_read_string():
+    """Test peak memory of read_string."""
+    __delete_testfile()
+    payload_size = 4 * NUMBER_ELEMENTS
+    with open(TEST_FILE, "ab") as test_file:
+        write_string(test_file, "x" * payload_size)
+
+    # The bytes read and the decoded string
+    with open(TEST_FILE, "rb") as test_file:
+        value = __assert_peak(payload_size, 2.05, read_string, test_file,
+                              payload_size)
+
+    assert len(value) == payload_size
+
+
+def test_memory_write_array_list():
+    """Test peak memory of write_array of a list and a generator."""
+    __delete_testfile()
+    values = list(range(NUMBER_LIST_ELEMENTS))
+    payload_size = 4 * NUMBER_LIST_ELEMENTS
+
+    # Values are packed in fixed-size chunks, not all at once
+    with open(TEST_FILE, "wb") as test_file:
+        __assert_peak(payload_size, 0.1, write_array, test_file, values, "int")
+        __assert_peak(payload_size, 0.1, write_array, test_file,
+                      (value for value in values), "int")
+
+    assert os.path.getsize(TEST_FILE) == 2 * payload_size
+
+
+@pytest.mark.parametrize("byteorder", ["native", "big"])
+def test_memory_write_array_buffer(byteorder):
+    """Test peak memory of write_array of an `array.array`."""
+    __delete_testfile()
+    values = array.array("i", range(NUMBER_ELEMENTS))
+    payload_size = 4 * NUMBER_ELEMENTS
+
+    # Native buffers are written directly, others byte-swapped in chunks
+    with open(TEST_FILE, "wb") as test_file:
+        __assert_peak(payload_size,
+                      0.05,
+                      write_array,
+                      test_file,
+                      values,
+                      "int",
+                      byteorder=byteorder)
+
+    assert os.path.getsize(TEST_FILE) == payload_size
+
+
+def test_memory_write_array_numpy():
+    """Test peak memory of write_array of a NumPy array."""
+    numpy = pytest.importorskip("numpy")
+    __delete_testfile()
+    values = numpy.arange(NUMBER_ELEMENTS, dtype="i4")
+    payload_size = 4 * NUMBER_ELEMENTS
+
+    with open(TEST_FILE, "wb") as test_file:
+        __assert_peak(payload_size, 0.05, write_array, test_file, values,
+                      "int")
+
+    assert os.path.getsize(TEST_FILE) == payload_size
+
+
+def test_memory_write_string():
+    """Test peak memory of write_string."""
+    __delete_testfile()
+    payload_size = 4 * NUMBER_ELEMENTS
+    value = "x" * payload_size
+
+    # Only the encoded string
+    with open(TEST_FILE, "wb") as test_file:
+        __assert_peak(payload_size, 1.05, write_string, test_file, value)
+
+    assert os.path.getsize(TEST_FILE) == payload_size
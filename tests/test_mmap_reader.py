@@ -0,0 +1,120 @@
+"""Test random-access MmapReader."""
+
+import array
+import os
+import random
+import struct
+
+import pytest
+
+from byter import *
+
+TEST_FILE = "./tests/testfile.byter"
+NUMBER_ENTRIES = 10000
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_mmap_reader_values(byteorder):
+    """Test MmapReader.read_*_at functions at random offsets."""
+    __delete_testfile()
+
+    write_values = [
+        random.choice(range(-1 * (2**31), 2**31))
+        for _ in range(NUMBER_ENTRIES)
+    ]
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_string(test_file, "Hello World!")
+        for value in write_values:
+            write_int(test_file, value, byteorder)
+        write_double(test_file, 1280.5, byteorder)
+
+    with MmapReader(TEST_FILE, byteorder=byteorder) as reader:
+        assert len(reader) == 12 + 4 * NUMBER_ENTRIES + 8
+        assert reader.read_string_at(0, 5) == "Hello"
+        assert reader.read_double_at(len(reader) - 8) == 1280.5
+
+        for index in random.sample(range(NUMBER_ENTRIES), 100):
+            assert reader.read_int_at(12 + 4 * index) == write_values[index]
+
+        assert reader.read_array_at(12, NUMBER_ENTRIES, "int") == write_values
+        assert reader.read_array_at(12, NUMBER_ENTRIES, "int",
+                                    as_array=True) == array.array(
+                                        "i", write_values)
+
+        with pytest.raises(struct.error):
+            reader.read_int_at(len(reader) - 2)
+        with pytest.raises(struct.error):
+            reader.read_string_at(len(reader) - 2, 3)
+        with pytest.raises(struct.error):
+            reader.read_array_at(len(reader) - 2, 1, "int", as_array=True)
+
+
+def test_mmap_reader_view():
+    """Test that MmapReader.read_array_at views share memory with file."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_bool(test_file, True)
+        write_array(test_file, [13, 4, 16], "unsigned_short")
+
+    reader = MmapReader(TEST_FILE)
+    view = reader.read_array_at(1, 3, "unsigned_short", as_view=True)
+
+    assert isinstance(view, memoryview)
+    assert view.tolist() == [13, 4, 16]
+    assert view.readonly
+
+    with pytest.raises(BufferError):
+        reader.close()
+
+    view.release()
+    reader.close()
+
+
+def test_mmap_reader_view_byteorder():
+    """Test that views are refused for a foreign byte order."""
+    __delete_testfile()
+
+    foreign = "big" if struct.pack("=h", 1) == b"\x01\x00" else "little"
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, [1, 2], "int", foreign)
+
+    with MmapReader(TEST_FILE, byteorder=foreign) as reader:
+        with pytest.raises(ValueError):
+            reader.read_array_at(0, 2, "int", as_view=True)
+        assert reader.read_array_at(0, 2, "int", as_array=True).tolist() == \
+            [1, 2]
+
+
+def test_mmap_reader_negative_offsets():
+    """Test that negative offsets are rejected rather than counted back."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, list(range(10)), "int")
+
+    with MmapReader(TEST_FILE) as reader:
+        with pytest.raises(struct.error):
+            reader.read_int_at(-4)
+        with pytest.raises(struct.error):
+            reader.read_char_at(-1)
+        with pytest.raises(struct.error):
+            reader.read_string_at(-4, 4)
+        for mode in ({}, {"as_array": True}, {"as_view": True}):
+            with pytest.raises(struct.error, match="out of range"):
+                reader.read_array_at(-8, 2, "int", **mode)
+
+        assert reader.read_int_at(36) == 9
+        assert reader.read_array_at(32, 2, "int") == [8, 9]
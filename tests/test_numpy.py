@@ -0,0 +1,230 @@
+"""Test NumPy arrays support of read_array and write_array."""
+
+import os
+import struct
+
+import pytest
+
+from byter import *
+from byter.utils import get_type
+
+numpy = pytest.importorskip("numpy")
+
+TEST_FILE = "./tests/testfile.byter"
+NUMBER_ENTRIES = 10000
+
+C_TYPES = [
+    "signed_char", "unsigned_char", "bool", "short", "unsigned_short", "int",
+    "unsigned_int", "long", "unsigned_long", "long_long", "unsigned_long_long",
+    "float", "double"
+]
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+def __random_values(c_type):
+    """Generate `NUMBER_ENTRIES` random values of `c_type` as a list."""
+    size = struct.calcsize("=" + get_type(c_type))
+    if c_type == "bool":
+        return numpy.random.randint(0, 2, NUMBER_ENTRIES).astype(bool).tolist()
+    if c_type in ("float", "double"):
+        return numpy.random.uniform(-128, 128, NUMBER_ENTRIES).tolist()
+    if c_type.startswith("unsigned"):
+        return numpy.random.randint(0,
+                                    2**(8 * size - 1),
+                                    NUMBER_ENTRIES,
+                                    dtype="u%d" % size).tolist()
+    return numpy.random.randint(-2**(8 * size - 1),
+                                2**(8 * size - 1) - 1,
+                                NUMBER_ENTRIES,
+                                dtype="i%d" % size).tolist()
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big", "network"])
+@pytest.mark.parametrize("c_type", C_TYPES)
+def test_array_numpy(c_type, byteorder):
+    """Test [write|read]_array functions with NumPy arrays."""
+    __delete_testfile()
+
+    write_values = __random_values(c_type)
+    if c_type == "float":
+        write_values = numpy.float32(write_values).tolist()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, write_values, c_type, byteorder)
+        write_array(test_file, numpy.array(write_values), c_type, byteorder)
+
+    with open(TEST_FILE, "rb") as test_file:
+        list_values = read_array(test_file, NUMBER_ENTRIES, c_type, byteorder)
+        numpy_values = read_array(test_file,
+                                  NUMBER_ENTRIES,
+                                  c_type,
+                                  byteorder,
+                                  as_numpy=True)
+
+    assert isinstance(numpy_values, numpy.ndarray)
+    assert numpy_values.dtype.itemsize == struct.calcsize("=" +
+                                                          get_type(c_type))
+    assert list_values == write_values
+    assert numpy_values.tolist() == write_values
+
+
+def test_array_numpy_char():
+    """Test [write|read]_array functions with NumPy arrays of `char`."""
+    __delete_testfile()
+
+    write_values = [b"a", b"b", b"c"]
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, numpy.array(write_values), "char")
+
+    with open(TEST_FILE, "rb") as test_file:
+        read_values = read_array(test_file, 3, "char", as_numpy=True)
+
+    assert read_values.tolist() == write_values
+
+
+def test_array_numpy_lossy():
+    """Test that NumPy arrays are not written with lossy conversions."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        with pytest.raises(struct.error):
+            write_array(test_file, numpy.array([1.7, 2**40, -3.9]), "int")
+        with pytest.raises(struct.error):
+            write_array(test_file, numpy.array([1, 2**40, -3]), "int")
+        with pytest.raises(struct.error):
+            write_array(test_file, numpy.array([70000]), "unsigned_short")
+        with pytest.raises(struct.error):
+            write_array(test_file, numpy.array([-1]), "unsigned_int")
+        with pytest.raises(struct.error):
+            write_array(test_file, numpy.array([1e300]), "float")
+        with pytest.raises(struct.error):
+            write_array(test_file, numpy.array([b"ab"]), "char")
+
+        # Values fitting in a smaller type of the same kind are converted
+        write_array(test_file, numpy.array([1, -2**31, 2**31 - 1]), "int")
+        write_array(test_file, numpy.array([0.5, numpy.inf]), "float")
+
+        # Arrays of Python objects are packed like lists
+        write_array(test_file,
+                    numpy.array([1, 2, 2**40], dtype=object)[:2], "int")
+        with pytest.raises(struct.error):
+            write_array(test_file, numpy.array([2**40], dtype=object), "int")
+
+    with open(TEST_FILE, "rb") as test_file:
+        assert read_array(test_file, 3, "int") == [1, -2**31, 2**31 - 1]
+        assert read_array(test_file, 2, "float") == [0.5, float("inf")]
+        assert read_array(test_file, 2, "int") == [1, 2]
+
+
+def test_array_numpy_truncated():
+    """Test that a truncated NumPy array read raises a `struct.error`."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, [1, 2, 3], "int")
+
+    with open(TEST_FILE, "rb") as test_file:
+        with pytest.raises(struct.error):
+            read_array(test_file, 4, "int", as_numpy=True)
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_array_into_numpy(byteorder):
+    """Test read_array_into function with a NumPy array buffer."""
+    __delete_testfile()
+
+    write_values = __random_values("double")
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, write_values, "double", byteorder)
+
+    buffer = numpy.empty(NUMBER_ENTRIES, dtype=numpy.float64)
+
+    with open(TEST_FILE, "rb") as test_file:
+        read_array_into(test_file, buffer, "double", byteorder)
+
+    assert buffer.tolist() == write_values
+
+
+@pytest.mark.parametrize("dtype", ["<i4", ">i4", "=i4"])
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+def test_array_into_numpy_byteorder(dtype, byteorder):
+    """Test read_array_into keeping the byte order of NumPy buffers."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, [1, 2, 3], "int", byteorder)
+
+    buffer = numpy.zeros(3, dtype=dtype)
+    with open(TEST_FILE, "rb") as test_file:
+        read_array_into(test_file, buffer, "int", byteorder)
+        assert buffer.tolist() == [1, 2, 3]
+
+        test_file.seek(0)
+        with pytest.raises(ValueError):
+            read_array_into(test_file, numpy.zeros(3, dtype="f4"), "int",
+                            byteorder)
+
+
+def test_cursor_numpy():
+    """Test that BufferCursor.read_array shares memory with the buffer."""
+    buffer = bytearray(struct.pack(">4i", 1, 2, 3, 4))
+    cursor = BufferCursor(buffer, offset=4, byteorder="big")
+
+    values = cursor.read_array(2, "int", as_numpy=True)
+    assert values.tolist() == [2, 3]
+    assert cursor.offset == 12
+
+    buffer[7] = 5
+    assert values.tolist() == [5, 3]
+
+
+def test_mmap_reader_numpy():
+    """Test MmapReader.read_array_at returning a zero-copy NumPy array."""
+    __delete_testfile()
+
+    write_values = __random_values("unsigned_short")
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_bool(test_file, True)
+        write_array(test_file, write_values, "unsigned_short", "big")
+
+    with MmapReader(TEST_FILE, byteorder="big") as reader:
+        values = reader.read_array_at(1,
+                                      NUMBER_ENTRIES,
+                                      "unsigned_short",
+                                      as_numpy=True)
+        assert values.dtype == numpy.dtype(">u2")
+        assert not values.flags.writeable
+        assert values.tolist() == write_values
+        del values
+
+
+@pytest.mark.parametrize("dtype", [">u8", "<u8", "=u8"])
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_array_numpy_byteorder(dtype, byteorder):
+    """Test write_array function with NumPy arrays of any byte order."""
+    __delete_testfile()
+
+    write_values = __random_values("unsigned_long_long")
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file,
+                    numpy.array(write_values, dtype=dtype),
+                    "unsigned_long_long",
+                    byteorder,
+                    chunk_size=999)
+
+    with open(TEST_FILE, "rb") as test_file:
+        assert read_array(test_file, NUMBER_ENTRIES, "unsigned_long_long",
+                          byteorder) == write_values
@@ -0,0 +1,90 @@
+"""Test multi-process record decoding."""
+
+import array
+import os
+import random
+
+import pytest
+
+from byter import *
+from byter import parallel
+
+TEST_FILE = "./tests/testfile.byter"
+NUMBER_ENTRIES = 10000
+
+SCHEMA_FIELDS = [
+    ("flag", "bool"),
+    ("year", "short"),
+    ("text", ("char[]", 3)),
+    ("count", "unsigned_long_long"),
+    ("width", "double"),
+]
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+def __write_records(schema, header=b""):
+    """Write `NUMBER_ENTRIES` random records to `TEST_FILE`."""
+    write_values = [(random.choice([True, False]),
+                     random.choice(range(-32768,
+                                         32768)), "%03d" % (index % 1000),
+                     random.choice(range(0, 2**63 - 1)),
+                     random.uniform(-1 * (2**63), 2**63))
+                    for index in range(NUMBER_ENTRIES)]
+
+    with open(TEST_FILE, "ab") as test_file:
+        test_file.write(header)
+        with RecordWriter(test_file, schema) as writer:
+            writer.write_records(write_values)
+
+    return write_values
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+@pytest.mark.parametrize("byteorder", ["native", "big"])
+def test_parallel_read_records(workers, byteorder):
+    """Test parallel_read_records returning a list of tuples."""
+    __delete_testfile()
+
+    schema = Schema(SCHEMA_FIELDS, byteorder=byteorder)
+    write_values = __write_records(schema)
+
+    read_values = parallel_read_records(TEST_FILE,
+                                        schema,
+                                        workers=workers,
+                                        chunk_records=999)
+
+    assert write_values == read_values
+
+
+@pytest.mark.parametrize("shared", [True, False])
+def test_parallel_read_records_columns(monkeypatch, shared):
+    """Test parallel_read_records returning per-field columns."""
+    __delete_testfile()
+
+    if not shared:
+        monkeypatch.setattr(parallel, "shared_memory", None)
+
+    schema = Schema(SCHEMA_FIELDS, byteorder="little")
+    write_values = __write_records(schema, header=b"header")
+
+    columns = parallel_read_records(TEST_FILE,
+                                    schema,
+                                    workers=3,
+                                    columns=True,
+                                    offset=6,
+                                    count=NUMBER_ENTRIES - 1,
+                                    chunk_records=999)
+
+    assert isinstance(columns["year"], array.array)
+    for position, name in enumerate(schema.names):
+        assert list(columns[name]) == \
+            [value[position] for value in write_values[:-1]]
@@ -0,0 +1,99 @@
+"""Test random-access PositionalReader."""
+
+import array
+import os
+import random
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from byter import *
+
+TEST_FILE = "./tests/testfile.byter"
+NUMBER_ENTRIES = 10000
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_positional_reader_values(byteorder):
+    """Test PositionalReader.read_*_at functions at random offsets."""
+    __delete_testfile()
+
+    write_values = [
+        random.choice(range(-1 * (2**31), 2**31))
+        for _ in range(NUMBER_ENTRIES)
+    ]
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_string(test_file, "Hello World!")
+        for value in write_values:
+            write_int(test_file, value, byteorder)
+        write_double(test_file, 1280.5, byteorder)
+
+    with PositionalReader(TEST_FILE, byteorder=byteorder) as reader:
+        assert len(reader) == 12 + 4 * NUMBER_ENTRIES + 8
+        assert reader.read_string_at(0, 5) == "Hello"
+        assert reader.read_double_at(len(reader) - 8) == 1280.5
+
+        for index in random.sample(range(NUMBER_ENTRIES), 100):
+            assert reader.read_int_at(12 + 4 * index) == write_values[index]
+
+        assert reader.read_array_at(12, NUMBER_ENTRIES, "int") == write_values
+        assert reader.read_array_at(12, NUMBER_ENTRIES, "int",
+                                    as_array=True) == array.array(
+                                        "i", write_values)
+
+        with pytest.raises(struct.error):
+            reader.read_int_at(len(reader) - 2)
+        with pytest.raises(struct.error):
+            reader.read_string_at(len(reader) - 2, 3)
+        with pytest.raises(struct.error):
+            reader.read_array_at(len(reader) - 2, 1, "int", as_array=True)
+
+
+def test_positional_reader_threads():
+    """Test many threads reading one file descriptor concurrently."""
+    __delete_testfile()
+
+    write_values = [random.randrange(2**64) for _ in range(NUMBER_ENTRIES)]
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_array(test_file, write_values, "unsigned_long_long")
+
+    offsets = list(range(0, 8 * NUMBER_ENTRIES, 8))
+    random.shuffle(offsets)
+
+    with PositionalReader(TEST_FILE) as reader:
+        with ThreadPoolExecutor(8) as pool:
+            read_values = list(
+                pool.map(reader.read_unsigned_long_long_at, offsets))
+
+    assert read_values == [write_values[offset // 8] for offset in offsets]
+
+
+def test_positional_reader_fd():
+    """Test that a file descriptor passed in is left open."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_short(test_file, 2019)
+        write_bool(test_file, True)
+
+    with open(TEST_FILE, "rb") as test_file:
+        with PositionalReader(test_file.fileno()) as reader:
+            assert reader.read_bool_at(2) is True
+            assert reader.read_short_at(0) == 2019
+
+        # Positional reads neither close nor move the file
+        assert test_file.tell() == 0
+        assert read_short(test_file) == 2019
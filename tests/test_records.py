@@ -0,0 +1,405 @@
+"""Test bulk record reading."""
+
+import array
+import io
+import os
+import random
+import struct
+
+import pytest
+
+import byter.records
+from byter import *
+
+TEST_FILE = "./tests/testfile.byter"
+NUMBER_ENTRIES = 10000
+
+SCHEMA_FIELDS = [
+    ("flag", "bool"),
+    ("year", "short"),
+    ("count", "unsigned_long_long"),
+    ("width", "double"),
+    ("tag", "char"),
+]
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+def __write_records(schema):
+    """Write `NUMBER_ENTRIES` random records to `TEST_FILE`."""
+    write_values = [(random.choice([True, False]),
+                     random.choice(range(-32768, 32768)),
+                     random.choice(range(0, 2**63 - 1)),
+                     random.uniform(-1 * (2**63),
+                                    2**63), random.choice([b"a", b"b", b"c"]))
+                    for _ in range(NUMBER_ENTRIES)]
+
+    with open(TEST_FILE, "ab") as test_file:
+        for value in write_values:
+            schema.write(test_file, value)
+
+    return write_values
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_read_records(byteorder):
+    """Test read_records returning a list of tuples."""
+    __delete_testfile()
+
+    schema = Schema(SCHEMA_FIELDS, byteorder=byteorder)
+    write_values = __write_records(schema)
+
+    with open(TEST_FILE, "rb") as test_file:
+        read_values = read_records(test_file, schema, NUMBER_ENTRIES)
+
+    assert write_values == read_values
+
+    with open(TEST_FILE, "rb") as test_file:
+        read_values = read_records(test_file, schema)
+
+    assert write_values == read_values
+
+
+@pytest.mark.parametrize("byteorder", ["native", "little", "big"])
+def test_read_records_columns(byteorder):
+    """Test read_records returning per-field columns."""
+    __delete_testfile()
+
+    schema = Schema(SCHEMA_FIELDS, byteorder=byteorder)
+    write_values = __write_records(schema)
+
+    with open(TEST_FILE, "rb") as test_file:
+        columns = read_records(test_file, schema, NUMBER_ENTRIES, columns=True)
+
+    assert list(columns) == list(schema.names)
+    assert isinstance(columns["year"], array.array)
+    assert isinstance(columns["flag"], list)
+
+    for position, name in enumerate(schema.names):
+        assert list(columns[name]) == [v[position] for v in write_values]
+
+
+def test_read_records_nested():
+    """Test read_records with string and array fields."""
+    __delete_testfile()
+
+    schema = Schema([("text", ("char[]", 3)), ("id", "int"),
+                     ("array", ("unsigned_short", 2))])
+    write_values = [("abc", 1, [2, 3]), ("def", 4, [5, 6])]
+
+    with open(TEST_FILE, "ab") as test_file:
+        for value in write_values:
+            schema.write(test_file, value)
+
+    with open(TEST_FILE, "rb") as test_file:
+        assert read_records(test_file, schema, 2) == write_values
+
+    with open(TEST_FILE, "rb") as test_file:
+        columns = read_records(test_file, schema, 2, columns=True)
+
+    assert columns["text"] == ["abc", "def"]
+    assert columns["id"] == array.array("i", [1, 4])
+    assert columns["array"] == [[2, 3], [5, 6]]
+
+
+def test_read_records_truncated():
+    """Test that a truncated file raises a `struct.error`."""
+    __delete_testfile()
+
+    schema = Schema([("id", "int"), ("value", "short")])
+
+    with open(TEST_FILE, "ab") as test_file:
+        schema.write(test_file, (1, 2))
+        write_int(test_file, 3)
+
+    with open(TEST_FILE, "rb") as test_file:
+        with pytest.raises(struct.error):
+            read_records(test_file, schema, 2)
+
+    with open(TEST_FILE, "rb") as test_file:
+        with pytest.raises(struct.error):
+            read_records(test_file, schema)
+
+
+class __TrickleReader(io.RawIOBase):
+    """Binary stream returning at most 7 bytes per read, like a pipe."""
+
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def readable(self):
+        """Return True."""
+        return True
+
+    def readinto(self, buffer):
+        """Read at most 7 bytes into `buffer`."""
+        chunk = self.data.read(min(len(buffer), 7))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+@pytest.mark.parametrize("chunk_records", [1, 7, 4096, NUMBER_ENTRIES * 2])
+def test_iter_records(chunk_records):
+    """Test iter_records with different chunk sizes."""
+    __delete_testfile()
+
+    schema = Schema(SCHEMA_FIELDS, byteorder="little")
+    write_values = __write_records(schema)
+
+    with open(TEST_FILE, "rb") as test_file:
+        read_values = list(iter_records(test_file, schema, chunk_records))
+
+    assert write_values == read_values
+
+    with open(TEST_FILE, "rb") as test_file:
+        chunks = list(
+            iter_records(test_file, schema, chunk_records, columns=True))
+
+    assert sum(len(chunk["year"]) for chunk in chunks) == NUMBER_ENTRIES
+    assert [year for chunk in chunks for year in chunk["year"]] == \
+        [value[1] for value in write_values]
+
+
+def test_iter_records_short_reads():
+    """Test iter_records with records split between reads."""
+    schema = Schema([("text", ("char[]", 3)), ("id", "int")])
+    write_values = [("%03d" % index, index) for index in range(1000)]
+
+    data = b"".join(schema.pack(value) for value in write_values)
+    read_values = list(iter_records(__TrickleReader(data), schema, 10))
+
+    assert write_values == read_values
+
+    with pytest.raises(struct.error):
+        list(iter_records(__TrickleReader(data[:-1]), schema, 10))
+
+
+@pytest.mark.parametrize("buffer_size", [1, 100, 1 << 20])
+def test_record_writer(buffer_size):
+    """Test RecordWriter against Schema.write."""
+    __delete_testfile()
+
+    schema = Schema(SCHEMA_FIELDS, byteorder="big")
+    write_values = __write_records(schema)
+
+    with open(TEST_FILE, "rb") as test_file:
+        expected = test_file.read()
+
+    data = io.BytesIO()
+    with RecordWriter(data, schema, buffer_size=buffer_size) as writer:
+        writer.write(write_values[0])
+        writer.write(dict(zip(schema.names, write_values[1])))
+        writer.write_records(write_values[2:])
+
+    assert data.getvalue() == expected
+
+
+def test_record_writer_flush():
+    """Test that RecordWriter writes whole buffers only."""
+    schema = Schema([("id", "int")])
+    data = io.BytesIO()
+
+    writer = RecordWriter(data, schema, buffer_size=10)
+    writer.write_records(range_value for range_value in [(1, ), (2, ), (3, )])
+    assert data.getvalue() == schema.pack((1, )) + schema.pack((2, ))
+
+    writer.flush()
+    assert len(data.getvalue()) == 3 * schema.size
+
+
+COLUMN_FIELDS = [
+    ("has_data", "bool"),
+    ("year", "short"),
+    ("width", "double"),
+    ("text", ("char[]", 12)),
+    ("array", ("unsigned_short", 3)),
+]
+
+
+def __random_column_records():
+    """Generate `NUMBER_ENTRIES` random records of `COLUMN_FIELDS`."""
+    return [(random.choice([True, False]), random.choice(range(1900, 2100)),
+             random.uniform(0,
+                            1000), "Hello World%d" % random.choice(range(10)),
+             [random.choice(range(2**16)) for _ in range(3)])
+            for _ in range(NUMBER_ENTRIES)]
+
+
+@pytest.mark.parametrize("byteorder", ["native", "big"])
+def test_read_columns(byteorder):
+    """Test reading some fields of records from a file and a buffer."""
+    __delete_testfile()
+    schema = Schema(COLUMN_FIELDS, byteorder=byteorder)
+    records = __random_column_records()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_string(test_file, "HEADER")
+        with RecordWriter(test_file, schema) as writer:
+            writer.write_records(records)
+
+    columns = read_columns(TEST_FILE, schema, ["year", "width"], offset=6)
+    assert list(columns) == ["year", "width"]
+    assert columns["year"] == array.array("h",
+                                          [record[1] for record in records])
+    assert columns["width"] == array.array("d",
+                                           [record[2] for record in records])
+
+    with open(TEST_FILE, "rb") as test_file:
+        buffer = test_file.read()
+
+    columns = read_columns(buffer,
+                           schema, ["text", "array", "has_data"],
+                           offset=6 + schema.size,
+                           count=10)
+    assert columns["text"] == [record[3] for record in records[1:11]]
+    assert columns["array"] == [record[4] for record in records[1:11]]
+    assert columns["has_data"] == [record[0] for record in records[1:11]]
+
+    with pytest.raises(KeyError):
+        read_columns(buffer, schema, ["unknown"], offset=6)
+    with pytest.raises(struct.error):
+        read_columns(buffer, schema, ["year"], offset=5)
+    with pytest.raises(struct.error):
+        read_columns(buffer,
+                     schema, ["year"],
+                     offset=6,
+                     count=NUMBER_ENTRIES + 1)
+
+
+def test_read_columns_numpy():
+    """Test reading some fields of records into NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+    __delete_testfile()
+    schema = Schema(COLUMN_FIELDS, byteorder="big")
+    records = __random_column_records()
+
+    with open(TEST_FILE, "ab") as test_file:
+        with RecordWriter(test_file, schema) as writer:
+            writer.write_records(records)
+
+    columns = read_columns(TEST_FILE,
+                           schema, ["year", "text", "array"],
+                           as_numpy=True)
+    assert columns["year"].dtype == numpy.dtype(">i2")
+    assert columns["year"].flags.c_contiguous
+    assert columns["year"].tolist() == [record[1] for record in records]
+    assert columns["text"].tolist() == [
+        record[3].encode("utf-8") for record in records
+    ]
+    assert columns["array"].shape == (NUMBER_ENTRIES, 3)
+    assert columns["array"].tolist() == [record[4] for record in records]
+
+    empty = read_columns(b"", schema, ["year"], as_numpy=True)
+    assert len(empty["year"]) == 0
+
+
+def test_read_columns_numpy_contiguous():
+    """Test that NumPy columns of contiguous fields outlive the file map."""
+    pytest.importorskip("numpy")
+    __delete_testfile()
+    schema = Schema([("year", "int")])
+    with open(TEST_FILE, "ab") as test_file:
+        with RecordWriter(test_file, schema) as writer:
+            writer.write_records([(2017, ), (2018, ), (2019, )])
+
+    # A single field fills the whole record: the strided view is contiguous
+    columns = read_columns(TEST_FILE, schema, ["year"], as_numpy=True)
+    assert columns["year"].tolist() == [2017, 2018, 2019]
+
+    __delete_testfile()
+    schema = Schema([("a", "int"), ("b", "short")])
+    with open(TEST_FILE, "ab") as test_file:
+        with RecordWriter(test_file, schema) as writer:
+            writer.write_records([(2019, 7)])
+
+    # A single record is contiguous whatever its fields
+    columns = read_columns(TEST_FILE, schema, ["a", "b"], as_numpy=True)
+    assert columns["a"].tolist() == [2019]
+    assert columns["b"].tolist() == [7]
+
+
+@pytest.mark.parametrize("byteorder", ["native", "big"])
+@pytest.mark.parametrize("chunk_records", [1, 1000, 65536])
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_filter_records(byteorder, chunk_records, use_numpy, monkeypatch):
+    """Test that filtered records match a plain Python filter."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(byter.records, "numpy", None)
+    __delete_testfile()
+    schema = Schema(COLUMN_FIELDS + [("ratio", "float")], byteorder=byteorder)
+    # `float` values as read back, e.g. 0.10000000149011612 for 0.1
+    ratios = [
+        struct.unpack("f", struct.pack("f", ratio))[0]
+        for ratio in (0.1, 0.2, 0.3, 0.5)
+    ]
+    records = [
+        record + (random.choice(ratios), )
+        for record in __random_column_records()
+    ]
+
+    with open(TEST_FILE, "ab") as test_file:
+        with RecordWriter(test_file, schema) as writer:
+            writer.write_records(records)
+
+    cases = [
+        (dict(year=("==", 2019)), lambda r: r[1] == 2019),
+        (dict(year=("between", (1950, 1960)),
+              has_data=("==", True)), lambda r: 1950 <= r[1] <= 1960 and r[0]),
+        (dict(width=("<", 100.0),
+              year=("in", [1999, 2000,
+                           2001])), lambda r: r[2] < 100.0 and r[1] in
+         (1999, 2000, 2001)),
+        (dict(text=("in", ["Hello World1", "Hello World2"])), lambda r: r[3] in
+         ("Hello World1", "Hello World2")),
+        (dict(array=("!=", [0, 0, 0]), width=(">", 500.0)),
+         lambda r: r[4] != [0, 0, 0] and r[2] > 500.0),
+        (dict(text=("==", "Hello World3"), year=("<", 2000)),
+         lambda r: r[3] == "Hello World3" and r[1] < 2000),
+        (dict(year=(">=", 1950),
+              text=("in", ["Hello World1", "Hello World2"]),
+              width=(">", 0.0)), lambda r: r[1] >= 1950 and r[3] in
+         ("Hello World1", "Hello World2") and r[2] > 0.0),
+        (dict(ratio=("==", 0.1)), lambda r: r[5] == 0.1),
+        (dict(ratio=("==", 0.5)), lambda r: r[5] == 0.5),
+        (dict(ratio=("<=", 0.2),
+              year=("<", 2000)), lambda r: r[5] <= 0.2 and r[1] < 2000),
+        (dict(ratio=("between", (0.1, 0.3))), lambda r: 0.1 <= r[5] <= 0.3),
+        (dict(ratio=("in", [0.1, 0.5])), lambda r: r[5] in (0.1, 0.5)),
+        ({}, lambda r: True),
+    ]
+
+    for where, test in cases:
+        with open(TEST_FILE, "rb") as test_file:
+            read_values = list(
+                filter_records(test_file, schema, where, chunk_records))
+        expected = [list(record) for record in records if test(record)]
+        assert [list(values) for values in read_values] == expected
+
+
+def test_filter_records_invalid():
+    """Test that malformed predicates are rejected."""
+    schema = Schema(COLUMN_FIELDS)
+    data = io.BytesIO(schema.pack((True, 2019, 0.5, "Hello", [1, 2, 3])))
+
+    with pytest.raises(KeyError):
+        list(filter_records(data, schema, {"unknown": ("==", 1)}))
+    with pytest.raises(ValueError):
+        list(filter_records(data, schema, {"year": ("~", 1)}))
+    with pytest.raises(ValueError):
+        list(filter_records(data, schema, {"year": 2019}))
+    with pytest.raises(ValueError):
+        list(filter_records(data, schema, {"year": ("between", 2019)}))
+
+    data = io.BytesIO(schema.pack((True, 2019, 0.5, "Hello", [1, 2, 3]))[:-1])
+    with pytest.raises(struct.error):
+        list(filter_records(data, schema, {"year": ("==", 2019)}))
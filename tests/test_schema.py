@@ -0,0 +1,245 @@
+"""Test record Schema read and write."""
+
+import ctypes
+import os
+import pickle
+import random
+
+import pytest
+
+from byter import *
+
+TEST_FILE = "./tests/testfile.byter"
+NUMBER_ENTRIES = 10000
+
+HEADER_FIELDS = [
+    ("has_data", "bool"),
+    ("year", "short"),
+    ("month", "short"),
+    ("width", "float"),
+    ("height", "float"),
+    ("text", ("char[]", 12)),
+    ("array", ("unsigned_short", 3)),
+]
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+def test_schema_layout():
+    """Test that a schema compiles into a single struct."""
+    schema = Schema(HEADER_FIELDS, byteorder="little")
+
+    assert schema.struct.format == "<?hhff12s3H"
+    assert schema.size == 1 + 2 + 2 + 4 + 4 + 12 + 3 * 2
+    assert schema.names == tuple(name for name, _ in HEADER_FIELDS)
+    assert [field.offset for field in schema.fields] == \
+        [0, 1, 3, 5, 9, 13, 25]
+
+
+def test_schema_matches_functions():
+    """Test that Schema.read decodes what write_* functions encode."""
+    __delete_testfile()
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_bool(test_file, True)
+        write_short(test_file, 2019)
+        write_short(test_file, 9)
+        write_float(test_file, 1280.0)
+        write_float(test_file, 1024.0)
+        write_string(test_file, "Hello World!")
+        write_array(test_file, [13, 4, 16], "unsigned_short")
+
+    with open(TEST_FILE, "rb") as test_file:
+        record = Schema(HEADER_FIELDS).read(test_file)
+
+    assert record == {
+        "has_data": True,
+        "year": 2019,
+        "month": 9,
+        "width": 1280.0,
+        "height": 1024.0,
+        "text": "Hello World!",
+        "array": [13, 4, 16]
+    }
+
+
+def test_schema_roundtrip():
+    """Test [write|read] of many records with Schema."""
+    __delete_testfile()
+
+    schema = Schema([("id", "unsigned_int"), ("value", "double"),
+                     ("flag", "bool"), ("tag", "char")],
+                    byteorder="big")
+
+    write_values = [{
+        "id": random.choice(range(0, 2**32)),
+        "value": random.uniform(-1 * (2**63), 2**63),
+        "flag": random.choice([True, False]),
+        "tag": random.choice([b"a", b"b", b"c"])
+    } for _ in range(NUMBER_ENTRIES)]
+
+    with open(TEST_FILE, "ab") as test_file:
+        for value in write_values:
+            schema.write(test_file, value)
+
+    read_values = []
+
+    with open(TEST_FILE, "rb") as test_file:
+        for _ in range(NUMBER_ENTRIES):
+            read_values.append(schema.read(test_file))
+
+    assert write_values == read_values
+
+
+def test_schema_sequence_record():
+    """Test that records can be passed as sequences of field values."""
+    schema = Schema(HEADER_FIELDS)
+    record = [False, 1999, 12, 1.5, 2.5, "abc", [1, 2, 3]]
+
+    buffer = bytearray(schema.size + 3)
+    schema.pack_into(buffer, 3, record)
+
+    assert bytes(buffer[3:]) == schema.pack(record)
+    assert list(schema.unpack_from(buffer, 3).values()) == \
+        record[:5] + ["abc" + "\x00" * 9, [1, 2, 3]]
+
+    with pytest.raises(ValueError):
+        schema.pack(record[:-1])
+
+
+def test_schema_invalid():
+    """Test that malformed schemas are rejected."""
+    with pytest.raises(ValueError):
+        Schema([("a", "int"), ("a", "short")])
+
+    with pytest.raises(ValueError):
+        Schema([("text", "char[]")])
+
+    with pytest.raises(KeyError):
+        Schema([("a", "integer")])
+
+
+C_HEADER = """
+/* Written by a C program */
+struct hdr {
+    bool ok;
+    short year;
+    float w;
+    char name[70];
+    unsigned short arr[3];
+};
+"""
+
+
+class CHeader(ctypes.Structure):
+    """Layout of `C_HEADER` computed by ctypes."""
+
+    _fields_ = [("ok", ctypes.c_bool), ("year", ctypes.c_short),
+                ("w", ctypes.c_float), ("name", ctypes.c_char * 70),
+                ("arr", ctypes.c_ushort * 3)]
+
+
+class CPackedHeader(ctypes.Structure):
+    """Packed layout of `C_HEADER` computed by ctypes."""
+
+    _pack_ = 1
+    _fields_ = CHeader._fields_
+
+
+def test_schema_padding():
+    """Test that pad bytes are skipped inside the struct."""
+    schema = Schema([("a", "char"), (None, 3), ("b", "int"), (None, 2)],
+                    byteorder="little")
+
+    assert schema.struct.format == "<c3xi2x"
+    assert schema.size == 10
+    assert schema.names == ("a", "b")
+    assert schema.fields[1].offset == 4
+    assert schema.unpack(b"x\0\0\0\x01\0\0\0\0\0") == {"a": b"x", "b": 1}
+    assert pickle.loads(pickle.dumps(schema)) == schema
+
+    with pytest.raises(ValueError):
+        Schema([(None, -1)])
+
+
+@pytest.mark.parametrize("packed, c_struct", [(False, CHeader),
+                                              (True, CPackedHeader)])
+def test_schema_from_c(packed, c_struct):
+    """Test that C struct layouts match the ones of a C compiler."""
+    schema = Schema.from_c(C_HEADER, packed=packed)
+
+    assert schema.size == ctypes.sizeof(c_struct)
+    assert schema.names == ("ok", "year", "w", "name", "arr")
+    for field in schema.fields:
+        assert field.offset == getattr(c_struct, field.name).offset
+    assert schema.fields[3].spec == ("char[]", 70)
+    assert schema.fields[4].spec == ("unsigned_short", 3)
+
+    c_record = c_struct(True, 2019, 1.5, b"Hello World!", (1, 2, 3))
+    assert schema.unpack(bytes(c_record)) == {
+        "ok": True,
+        "year": 2019,
+        "w": 1.5,
+        "name": "Hello World!" + "\x00" * 58,
+        "arr": [1, 2, 3]
+    }
+
+
+def test_schema_from_c_nested():
+    """Test nested structs, typedefs and multidimensional arrays."""
+
+    class CPoint(ctypes.Structure):
+        _fields_ = [("c", ctypes.c_char), ("x", ctypes.c_double)]
+
+    class CRecord(ctypes.Structure):
+        _fields_ = [("tag", ctypes.c_uint8), ("pts", CPoint * 2),
+                    ("m", (ctypes.c_int * 3) * 2),
+                    ("names", (ctypes.c_char * 4) * 2),
+                    ("id", ctypes.c_uint64)]
+
+    schema = Schema.from_c("""
+        struct point { char c; double x; };
+        typedef struct {
+            uint8_t tag;
+            struct point pts[2];
+            const signed int m[2][3];
+            char names[2][4];
+            unsigned long long int id;
+        } record_t;
+    """)
+
+    assert schema.size == ctypes.sizeof(CRecord)
+    assert schema.names == ("tag", "pts[0].c", "pts[0].x", "pts[1].c",
+                            "pts[1].x", "m", "names[0]", "names[1]", "id")
+    assert schema.fields[2].offset == CRecord.pts.offset + CPoint.x.offset
+    assert schema.fields[-1].offset == CRecord.id.offset
+
+    c_record = CRecord(7, ((b"a", 0.5), (b"b", 1.5)), ((1, 2, 3), (4, 5, 6)))
+    c_record.names[0].raw, c_record.names[1].raw = b"abcd", b"efgh"
+    c_record.id = 2**40
+    assert list(schema.unpack(bytes(c_record)).values()) == [
+        7, b"a", 0.5, b"b", 1.5, [1, 2, 3, 4, 5, 6], "abcd", "efgh", 2**40
+    ]
+
+    # Anonymous nested structs declared inline
+    schema = Schema.from_c("struct { short a; struct { char c; int i; } in; };")
+    assert schema.struct.format == "=h2xc3xi"
+
+
+def test_schema_from_c_invalid():
+    """Test that unsupported C declarations are rejected."""
+    for declaration in [
+            "", "struct a { long double x; };", "struct a { struct b x; };",
+            "struct a { int x[0]; };", "struct a { unsigned float x; };",
+            "struct a { }", "struct a { int x };"
+    ]:
+        with pytest.raises(ValueError):
+            Schema.from_c(declaration)
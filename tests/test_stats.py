@@ -0,0 +1,118 @@
+"""Test opt-in I/O statistics."""
+
+import array
+import io
+import struct
+
+import pytest
+
+import byter
+from byter import reader, stats
+
+
+def test_stats_disabled():
+    """Test that disabled statistics leave the original functions."""
+    original = reader.read_int
+    assert not stats.is_enabled()
+
+    stats.enable()
+    assert stats.is_enabled()
+    assert byter.read_int is reader.read_int is not original
+    assert byter.read_int.__name__ == "read_int"
+
+    stats.disable()
+    assert not stats.is_enabled()
+    assert byter.read_int is reader.read_int is original
+
+
+def test_stats_counters():
+    """Test call, byte and time counters per function and C type."""
+    data = io.BytesIO()
+
+    with stats.collect() as collected:
+        byter.write_int(data, 13)
+        byter.write_int(data, 4, "big")
+        byter.write_double(data, 16.5)
+        byter.write_string(data, "Hello")
+        byter.write_array(data, [1, 2, 3], "unsigned_short")
+        byter.write_array(data, (value for value in range(5)), "short")
+        byter.write_array(data, array.array("f", [0.5] * 4), "float")
+
+        data.seek(0)
+        assert byter.read_int(data) == 13
+        assert byter.read_int(data, "big") == 4
+        assert byter.read_double(data) == 16.5
+        assert byter.read_string(data, 5) == "Hello"
+        assert byter.read_array(data, 3, "unsigned_short") == [1, 2, 3]
+        assert byter.read_array_into(data, array.array("h", [0] * 5),
+                                     "short") == 5
+
+        # Snapshots can be taken while collecting
+        assert stats.snapshot()["read_int"]["int"]["calls"] == 2
+
+    assert not stats.is_enabled()
+
+    assert collected["write_int"]["int"]["calls"] == 2
+    assert collected["write_int"]["int"]["bytes"] == 8
+    assert collected["write_double"]["double"]["bytes"] == 8
+    assert collected["write_string"]["char[]"]["bytes"] == 5
+    assert collected["write_array"]["unsigned_short"]["bytes"] == 6
+    assert collected["write_array"]["short"]["bytes"] == 10
+    assert collected["write_array"]["float"]["bytes"] == 16
+
+    assert collected["read_int"]["int"] == {
+        "calls": 2,
+        "bytes": 8,
+        "seconds": pytest.approx(collected["read_int"]["int"]["seconds"])
+    }
+    assert collected["read_string"]["char[]"]["bytes"] == 5
+    assert collected["read_array"]["unsigned_short"]["bytes"] == 6
+    assert collected["read_array_into"]["short"]["bytes"] == 10
+    assert "read_float" not in collected
+
+    assert all(counter["seconds"] >= 0 for functions in collected.values()
+               for counter in functions.values())
+
+
+def test_stats_nested_calls():
+    """Test that calls between byter functions are counted once."""
+    data = io.BytesIO(bytes(40))
+
+    with stats.collect() as collected:
+        values = byter.read_array(data, 10, "int", as_array=True)
+        assert len(values) == 10
+
+    assert collected == {
+        "read_array": {
+            "int": {
+                "calls": 1,
+                "bytes": 40,
+                "seconds": collected["read_array"]["int"]["seconds"]
+            }
+        }
+    }
+
+    # A failed call does not stop the next ones from being counted
+    with stats.collect() as collected:
+        with pytest.raises(struct.error):
+            byter.read_array(io.BytesIO(bytes(4)), 10, "int", as_array=True)
+        byter.read_int(io.BytesIO(bytes(4)))
+
+    assert collected["read_int"]["int"]["calls"] == 1
+
+
+def test_stats_reset():
+    """Test that counters are kept until reset."""
+    stats.reset()
+    stats.enable()
+    try:
+        byter.read_bool(io.BytesIO(b"\x01"))
+        assert stats.snapshot()["read_bool"]["bool"]["calls"] == 1
+        stats.reset()
+        assert stats.snapshot() == {}
+    finally:
+        stats.disable()
+
+    # Calls made while disabled are not counted
+    byter.read_bool(io.BytesIO(b"\x01"))
+    assert stats.snapshot() == {}
@@ -0,0 +1,116 @@
+"""Test lazy record views."""
+
+import os
+import random
+import struct
+
+import pytest
+
+from byter import *
+
+TEST_FILE = "./tests/testfile.byter"
+NUMBER_ENTRIES = 10000
+
+HEADER_FIELDS = [
+    ("has_data", "bool"),
+    ("year", "short"),
+    ("month", "short"),
+    ("width", "float"),
+    ("height", "float"),
+    ("text", ("char[]", 12)),
+    ("array", ("unsigned_short", 3)),
+]
+
+
+def __delete_testfile():
+    """
+    Delete the file at path `TEST_FILE`.
+
+    This function is called at the beginning of each test.
+    """
+    if os.path.exists(TEST_FILE):
+        os.remove(TEST_FILE)
+
+
+def __random_records(count):
+    """Generate `count` random header records."""
+    return [(random.choice([True, False]), random.choice(range(1900, 2100)),
+             random.choice(range(1, 13)), 0.5, 1280.0, "Hello World%d" %
+             random.choice(range(10)),
+             [random.choice(range(2**16)) for _ in range(3)])
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize("byteorder", ["native", "big"])
+def test_record_view(byteorder):
+    """Test decoding single fields of a record view."""
+    schema = Schema(HEADER_FIELDS, byteorder=byteorder)
+    record = __random_records(1)[0]
+    buffer = b"\x00" * 5 + schema.pack(record)
+
+    view = RecordView(schema, buffer, 5)
+    assert view.year == record[1]
+    assert view.text == record[5]
+    assert view["array"] == record[6]
+    assert view._asdict() == schema.unpack_from(buffer, 5)
+    assert repr(view).startswith("RecordView(has_data=")
+
+    with pytest.raises(AttributeError):
+        view.unknown
+    with pytest.raises(KeyError):
+        view["unknown"]
+    with pytest.raises(struct.error):
+        RecordView(schema, buffer, 6)
+
+
+def test_records_view_mmap():
+    """Test random access to records of a memory-mapped file."""
+    __delete_testfile()
+    schema = Schema(HEADER_FIELDS)
+    records = __random_records(NUMBER_ENTRIES)
+
+    with open(TEST_FILE, "ab") as test_file:
+        write_string(test_file, "HEADER")
+        with RecordWriter(test_file, schema) as writer:
+            writer.write_records(records)
+
+    with MmapReader(TEST_FILE) as reader:
+        views = RecordsView(schema, reader.buffer, offset=6)
+        assert len(views) == NUMBER_ENTRIES
+
+        for index in random.sample(range(NUMBER_ENTRIES), 100):
+            assert views[index].year == records[index][1]
+            assert views[index].array == records[index][6]
+        assert views[-1].month == records[-1][2]
+
+        assert [view.year
+                for view in views] == [record[1] for record in records]
+
+        every_tenth = views[5::10]
+        assert len(every_tenth) == len(records[5::10])
+        assert [view.text for view in every_tenth
+                ] == [record[5] for record in records[5::10]]
+        assert every_tenth[1].has_data == records[15][0]
+
+        with pytest.raises(IndexError):
+            views[NUMBER_ENTRIES]
+        with pytest.raises(struct.error):
+            RecordsView(schema, reader.buffer, 6, NUMBER_ENTRIES + 1)
+        with pytest.raises(struct.error):
+            RecordsView(schema, reader.buffer, -schema.size)
+
+        del views, every_tenth
+
+
+def test_records_view_c_names():
+    """Test fields of nested C structs."""
+    schema = Schema.from_c("""
+        struct point { short x; short y; };
+        struct segment { struct point ends[2]; int class; };
+    """)
+    buffer = schema.pack((1, 2, 3, 4, 5)) + schema.pack((6, 7, 8, 9, 10))
+
+    views = RecordsView(schema, buffer)
+    assert views[1]["ends[1].y"] == 9
+    assert views[1]["class"] == 10
+    assert not hasattr(views[1], "class")